@@ -2,3 +2,9 @@ DB_HOST = "localhost"
 DB_NAME = "wku_map_system"
 DB_USER = "postgres"
 DB_PASS = "020618"
+
+# 커넥션 풀 설정
+DB_POOL_MIN = 2          # 항상 열어둘 최소 커넥션 수
+DB_POOL_MAX = 10         # 동시에 빌려줄 수 있는 최대 커넥션 수
+DB_POOL_TIMEOUT = 5.0    # 풀에서 커넥션을 얻기까지 최대 대기(초)
+DB_POOL_MAX_IDLE = 300.0  # 이 시간(초) 이상 놀고 있는 여분 커넥션은 정리
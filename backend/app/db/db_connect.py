@@ -1,15 +1,131 @@
-import psycopg2
-from .db_config import DB_HOST, DB_NAME, DB_USER, DB_PASS
+from contextlib import contextmanager, asynccontextmanager
+from typing import AsyncIterator, Iterator, Optional
+
+import psycopg
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+from app.services.metrics import instrument_connection
+
+from .db_config import (
+    DB_HOST, DB_NAME, DB_USER, DB_PASS,
+    DB_POOL_MIN, DB_POOL_MAX, DB_POOL_TIMEOUT, DB_POOL_MAX_IDLE,
+)
+
+CONNINFO = psycopg.conninfo.make_conninfo(
+    host=DB_HOST,
+    dbname=DB_NAME,
+    user=DB_USER,
+    password=DB_PASS,
+)
+
+_pool: Optional[ConnectionPool] = None
+_async_pool: Optional[AsyncConnectionPool] = None
+
+
+# -----------------------------------------------------------
+# 동기 커넥션 풀 (임포터/스크립트용, 프로세스당 하나)
+# -----------------------------------------------------------
+def get_pool() -> ConnectionPool:
+    """
+    프로세스 전역 동기 커넥션 풀을 반환 (처음 호출 시 생성).
+    - min/max 크기, 대여 타임아웃은 db_config 에서 조정
+    - 대여 직전 check_connection 으로 죽은 커넥션을 걸러낸다
+    """
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool(
+            CONNINFO,
+            min_size=DB_POOL_MIN,
+            max_size=DB_POOL_MAX,
+            timeout=DB_POOL_TIMEOUT,
+            max_idle=DB_POOL_MAX_IDLE,
+            check=ConnectionPool.check_connection,
+            name="smartcampus",
+            open=False,
+        )
+        _pool.open()
+    return _pool
+
+
+def close_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+
+def pool_stats() -> dict:
+    """모니터링용 풀 상태 (pool_size, pool_available, requests_waiting ...)"""
+    pool = _async_pool or _pool
+    if pool is None:
+        return {"open": False}
+    return {"open": True, **pool.get_stats()}
+
+
+@contextmanager
+def connection() -> Iterator[psycopg.Connection]:
+    """
+    풀에서 커넥션 하나를 빌려 with 블록 동안 사용.
+    블록이 정상 종료되면 commit, 예외면 rollback 후 풀에 반납.
+    """
+    with get_pool().connection() as conn:
+        yield conn
+
+
+# -----------------------------------------------------------
+# 비동기 커넥션 풀 (API 요청 경로)
+# -----------------------------------------------------------
+async def open_async_pool() -> AsyncConnectionPool:
+    """
+    API 서버 lifespan 에서 호출. 이벤트 루프 안에서 열어야 하므로 지연 생성하지 않는다.
+    크기/타임아웃/헬스체크 설정은 동기 풀과 동일.
+    """
+    global _async_pool
+    if _async_pool is None:
+        _async_pool = AsyncConnectionPool(
+            CONNINFO,
+            min_size=DB_POOL_MIN,
+            max_size=DB_POOL_MAX,
+            timeout=DB_POOL_TIMEOUT,
+            max_idle=DB_POOL_MAX_IDLE,
+            check=AsyncConnectionPool.check_connection,
+            configure=instrument_connection,  # 쿼리 수/DB 시간 계측 커서
+            name="smartcampus-async",
+            open=False,
+        )
+        await _async_pool.open()
+    return _async_pool
+
+
+async def close_async_pool() -> None:
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
+
+
+@asynccontextmanager
+async def async_connection() -> AsyncIterator[psycopg.AsyncConnection]:
+    """connection() 의 비동기 버전. 동시에 여러 조회를 돌릴 때 조회마다 하나씩 빌린다."""
+    if _async_pool is None:
+        raise RuntimeError("async pool is not open (open_async_pool() 먼저 호출)")
+    async with _async_pool.connection() as conn:
+        yield conn
+
+
+async def get_db() -> AsyncIterator[psycopg.AsyncConnection]:
+    """FastAPI 의존성: 요청 하나당 커넥션 하나를 빌려 쓰고 반납"""
+    async with async_connection() as conn:
+        yield conn
+
 
 def get_conn():
+    """
+    풀을 거치지 않는 단발성 커넥션 (일회성 스크립트용).
+    API/임포터 코드는 connection() 을 사용할 것.
+    """
     try:
-        conn = psycopg2.connect(
-            host=DB_HOST,
-            database=DB_NAME,
-            user=DB_USER,
-            password=DB_PASS
-        )
-        return conn
+        return psycopg.connect(CONNINFO)
     except Exception as e:
         print("❌ DB 연결 실패:", e)
         return None
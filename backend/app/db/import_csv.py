@@ -1,145 +1,426 @@
+import argparse
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 import pandas as pd
-import math
-from app.db.db_connect import get_conn
+import requests
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.db.db_connect import connection
+from app.services.courses import parse_course
+from app.db.timetable_grid import (
+    Cell, Row, cells_of, content_hash, diff_cells, grid_to_rows,
+)
 
 # CSV 파일들이 있는 디렉토리
 CSV_DIR = r"C:\Users\dlaeh\WKU_CRReservation\backend\output\PRIME_building"
 
-# 요일 매핑
-day_map = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 7: 6}
+# 임포트 후 점유 인덱스 재적재를 요청할 API 서버
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 
+# CSV 파싱 프로세스 수 (기본: 코어 수)
+IMPORT_WORKERS = int(os.getenv("IMPORT_WORKERS", "0")) or (os.cpu_count() or 1)
 
-# -----------------------------------------------------------
-# Building 생성 or 가져오기
-# -----------------------------------------------------------
-def get_or_create_building(building_name: str):
-    conn = get_conn()
-    cur = conn.cursor()
+# (building_name, room_name, [(period, weekday, raw_text), ...])
+ParsedRoom = Tuple[str, str, List[Row]]
 
-    # 외국어 building code 자동 생성
-    building_code = building_name.replace("관", "").upper()
 
-    # 1) 이미 있는지 확인
-    cur.execute("SELECT id FROM building WHERE name = %s", (building_name,))
-    row = cur.fetchone()
+# -----------------------------------------------------------
+# CSV 하나 읽기 (DB 접근 없음)
+# -----------------------------------------------------------
+def parse_csv_file(csv_path: str) -> Optional[ParsedRoom]:
+    # 파일명에서 building + room 추출
+    filename = os.path.basename(csv_path)
+    room_full_name = filename.replace(".csv", "")
 
-    if row:
-        building_id = row[0]
+    # 예: "프라임관 - 101대강의실"
+    if " - " in room_full_name:
+        building_name, room_name = room_full_name.split(" - ", 1)
     else:
-        # 2) 없다면 생성
-        cur.execute(
-            "INSERT INTO building (code, name) VALUES (%s, %s) RETURNING id",
-            (building_code, building_name)
-        )
-        building_id = cur.fetchone()[0]
-        conn.commit()
+        print(f"⚠ 파일명 형식 오류: {filename} (스킵)")
+        return None
+
+    df = pd.read_csv(csv_path)
+    rows = grid_to_rows(df)
 
-    cur.close()
-    conn.close()
-    return building_id
+    return building_name, room_name, rows
 
 
 # -----------------------------------------------------------
-# Room 생성 or 가져오기
+# Building / Room 일괄 생성 or 가져오기
 # -----------------------------------------------------------
-def get_or_create_room(room_name: str, building_id: int):
-    conn = get_conn()
-    cur = conn.cursor()
+def building_code(name: str) -> str:
+    """외국어 building code 자동 생성 ("프라임관" → "프라임")"""
+    return name.replace("관", "").upper()
 
-    # 1) 기존 room 있는지 확인
-    cur.execute("SELECT id FROM room WHERE name = %s AND building_id = %s",
-                (room_name, building_id))
-    row = cur.fetchone()
 
-    if row:
-        room_id = row[0]
-    else:
-        # 기본 floor, capacity는 0으로 설정
+def ensure_buildings(cur, building_names: Iterable[str]) -> Dict[str, int]:
+    """
+    이름 목록의 building 을 없으면 만들고 {name: id} 반환 (쿼리 2번).
+    만들 code 를 이미 다른 이름의 building 이 쓰고 있으면 (예: "공학관" / "공학") ValueError.
+    """
+    names = sorted(set(building_names))
+    codes = [building_code(name) for name in names]
+
+    cur.execute("""
+        INSERT INTO building (code, name)
+        SELECT t.code, t.name
+        FROM unnest(%s::text[], %s::text[]) AS t(code, name)
+        WHERE NOT EXISTS (SELECT 1 FROM building b WHERE b.name = t.name)
+        ON CONFLICT (code) DO NOTHING
+    """, (codes, names))
+
+    cur.execute("SELECT name, id FROM building WHERE name = ANY(%s)", (names,))
+    ids = dict(cur.fetchall())
+
+    # ON CONFLICT (code) DO NOTHING 으로 조용히 빠진 이름 → 어느 building 과 겹쳤는지 알려 준다
+    missing = [name for name in names if name not in ids]
+    if missing:
         cur.execute(
-            "INSERT INTO room (building_id, name, floor, capacity) VALUES (%s, %s, %s, %s) RETURNING id",
-            (building_id, room_name, 0, 0)
+            "SELECT code, name FROM building WHERE code = ANY(%s)",
+            ([building_code(name) for name in missing],),
+        )
+        holders = dict(cur.fetchall())
+        detail = ", ".join(
+            f"{name!r} → code {building_code(name)!r} (이미 {holders.get(building_code(name), '?')!r} 가 사용 중)"
+            for name in missing
         )
-        room_id = cur.fetchone()[0]
-        conn.commit()
+        raise ValueError(f"building code 충돌로 건물을 만들 수 없음: {detail}")
+    return ids
 
-    cur.close()
-    conn.close()
-    return room_id
 
+def ensure_rooms(cur, pairs: Iterable[Tuple[int, str]]) -> Tuple[Dict[Tuple[int, str], int], List[int]]:
+    """
+    (building_id, room_name) 목록의 room 을 없으면 만들고
+    ({(building_id, name): id}, 이번에 새로 만든 room id 목록) 반환
+    """
+    pairs = sorted(set(pairs))
+    building_ids = [b for b, _ in pairs]
+    names = [n for _, n in pairs]
+
+    # 기본 floor, capacity는 0으로 설정. RETURNING 은 실제로 INSERT 된 행만 돌려준다
+    cur.execute("""
+        INSERT INTO room (building_id, name, floor, capacity)
+        SELECT t.building_id, t.name, 0, 0
+        FROM unnest(%s::int[], %s::text[]) AS t(building_id, name)
+        ON CONFLICT (building_id, name) DO NOTHING
+        RETURNING id
+    """, (building_ids, names))
+    created = sorted(rid for (rid,) in cur.fetchall())
 
-# -----------------------------------------------------------
-# room_timetable 삽입
-# -----------------------------------------------------------
-def insert_timetable(room_id, period, weekday, raw_text):
-    conn = get_conn()
-    cur = conn.cursor()
     cur.execute("""
-        INSERT INTO room_timetable (room_id, period, weekday, raw_text)
-        VALUES (%s, %s, %s, %s)
-    """, (room_id, period, weekday, raw_text))
-    conn.commit()
-    cur.close()
-    conn.close()
+        SELECT r.building_id, r.name, r.id
+        FROM room r
+        JOIN unnest(%s::int[], %s::text[]) AS t(building_id, name)
+          ON r.building_id = t.building_id AND r.name = t.name
+    """, (building_ids, names))
+    return {(b, n): rid for b, n, rid in cur.fetchall()}, created
 
 
 # -----------------------------------------------------------
-# CSV 하나 처리
+# 여러 CSV 를 병렬로 파싱 (DB 접근 없음)
 # -----------------------------------------------------------
-def import_csv_file(csv_path: str):
-    print(f"[처리중] {csv_path}")
-
-    # 파일명에서 building + room 추출
-    filename = os.path.basename(csv_path)
-    room_full_name = filename.replace(".csv", "")
-
-    # 예: "프라임관 - 101대강의실"
-    if " - " in room_full_name:
-        building_name, room_name = room_full_name.split(" - ", 1)
+def parse_files(csv_paths: List[str], workers: int = IMPORT_WORKERS) -> List[ParsedRoom]:
+    """
+    CSV 들을 프로세스 풀에서 파싱. 결과는 입력 순서를 유지한다.
+    workers <= 1 이거나 파일이 하나뿐이면 현재 프로세스에서 순차 처리.
+    """
+    workers = max(1, min(workers, len(csv_paths)))
+    if workers == 1:
+        results = map(parse_csv_file, csv_paths)
     else:
-        print(f"⚠ 파일명 형식 오류: {filename} (스킵)")
-        return
-
-    # 1) Building 자동 생성
-    building_id = get_or_create_building(building_name)
+        chunksize = max(1, len(csv_paths) // (workers * 4))
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(parse_csv_file, csv_paths, chunksize=chunksize)
+
+    parsed: List[ParsedRoom] = []
+    try:
+        for path, result in zip(csv_paths, results):
+            print(f"[파싱] {path}")
+            if result is not None:
+                parsed.append(result)
+    finally:
+        if workers > 1:
+            pool.shutdown()
+    return parsed
 
-    # 2) Room 자동 생성
-    room_id = get_or_create_room(room_name, building_id)
-
-    # 3) CSV 읽기
-    df = pd.read_csv(csv_path)
 
-    # 4) 시간표 삽입
-    for _, row in df.iterrows():
-        if str(row["col_1"]).strip() == "" or str(row["col_1"]).lower() == "nan":
-            continue
+# -----------------------------------------------------------
+# 증분 적재 결과
+# -----------------------------------------------------------
+@dataclass
+class ImportSummary:
+    files: int = 0
+    rooms: int = 0                  # 이번에 들어온 방 수
+    rows: int = 0                   # 읽은 시간표 칸 수
+    unchanged: int = 0              # 내용이 같아 손대지 않은 방 수
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    backfilled: int = 0             # 내용은 같고 구조화 컬럼만 채운 칸 수
+    changed_room_ids: List[int] = field(default_factory=list)
+    new_room_ids: List[int] = field(default_factory=list)     # 이번에 만든 방 (시간표가 비어 있어도)
+
+    @property
+    def reload_room_ids(self) -> List[int]:
+        """API 서버가 다시 읽어야 할 방: 시간표가 바뀐 방 + 새로 생긴 방 (목록 / 자동완성에 보여야 함)"""
+        return sorted(set(self.changed_room_ids) | set(self.new_room_ids))
+
+    def as_dict(self) -> dict:
+        return {
+            "files": self.files,
+            "rooms": self.rooms,
+            "rows": self.rows,
+            "unchanged": self.unchanged,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "deleted": self.deleted,
+            "backfilled": self.backfilled,
+            "changed_room_ids": self.changed_room_ids,
+            "new_room_ids": self.new_room_ids,
+        }
+
+
+def load_stored_cells(cur, room_ids: List[int]) -> Tuple[Dict[int, Dict[Cell, str]], Dict[int, List[Cell]]]:
+    """
+    room_id → {(period, weekday): raw_text} 와
+    room_id → 구조화 컬럼(label)이 아직 비어 있는 칸 목록 (쿼리 1번)
+    """
+    cur.execute(
+        """
+        SELECT room_id, period, weekday, raw_text, label IS NULL
+        FROM room_timetable
+        WHERE room_id = ANY(%s)
+        """,
+        (room_ids,),
+    )
+    stored: Dict[int, Dict[Cell, str]] = {rid: {} for rid in room_ids}
+    unparsed: Dict[int, List[Cell]] = {rid: [] for rid in room_ids}
+    for room_id, period, weekday, raw_text, missing in cur.fetchall():
+        stored[room_id][(period, weekday)] = raw_text
+        if missing:
+            unparsed[room_id].append((period, weekday))
+    return stored, unparsed
+
+
+# raw_text 를 파싱해 같이 저장하는 구조화 컬럼 (CourseInfo 필드 순서)
+COURSE_COLUMNS = ("course_code", "title", "section", "instructor", "enrollment", "level", "label")
+
+
+def with_course(row: Tuple[int, int, int, str]) -> tuple:
+    """(room_id, period, weekday, raw_text) 뒤에 파싱한 과목 필드를 붙임"""
+    return (*row, *parse_course(row[3]))
+
+
+def apply_delta(
+    cur,
+    inserts: List[Tuple[int, int, int, str]],
+    updates: List[Tuple[int, int, int, str]],
+    deletes: List[Tuple[int, int, int]],
+) -> None:
+    """
+    (room_id, period, weekday[, raw_text]) 단위 변경을 종류별로 한 번에 반영.
+    추가 / 수정되는 칸은 여기서 raw_text 를 한 번 파싱해 구조화 컬럼도 같이 쓴다.
+    """
+    if deletes:
+        cur.execute(
+            """
+            DELETE FROM room_timetable t
+            USING unnest(%s::int[], %s::int[], %s::int[]) AS d(room_id, period, weekday)
+            WHERE t.room_id = d.room_id AND t.period = d.period AND t.weekday = d.weekday
+            """,
+            [list(col) for col in zip(*deletes)],
+        )
+    if updates:
+        cur.execute(
+            """
+            UPDATE room_timetable t
+            SET raw_text = u.raw_text,
+                course_code = u.course_code, title = u.title, section = u.section,
+                instructor = u.instructor, enrollment = u.enrollment,
+                level = u.level, label = u.label
+            FROM unnest(
+                %s::int[], %s::int[], %s::int[], %s::text[],
+                %s::text[], %s::text[], %s::text[], %s::text[], %s::int[], %s::text[], %s::text[]
+            ) AS u(room_id, period, weekday, raw_text,
+                   course_code, title, section, instructor, enrollment, level, label)
+            WHERE t.room_id = u.room_id AND t.period = u.period AND t.weekday = u.weekday
+            """,
+            [list(col) for col in zip(*map(with_course, updates))],
+        )
+    if inserts:
+        columns = ", ".join(("room_id", "period", "weekday", "raw_text") + COURSE_COLUMNS)
+        with cur.copy(f"COPY room_timetable ({columns}) FROM STDIN") as copy:
+            for row in inserts:
+                copy.write_row(with_course(row))
 
-        period = int(row["col_1"])
 
-        for col_idx, weekday in day_map.items():
-            cell = row[f"col_{col_idx}"]
-            if str(cell).strip() in ("", "nan"):
-                continue
+# -----------------------------------------------------------
+# 여러 CSV 를 커넥션 1개 / 트랜잭션 1개로 증분 적재
+# -----------------------------------------------------------
+def import_files(csv_paths: List[str], workers: int = IMPORT_WORKERS) -> ImportSummary:
+    """
+    1) 모든 CSV 를 프로세스 풀에서 병렬 파싱
+    2) building / room 을 일괄 get-or-create
+    3) 방마다 내용 해시를 room.timetable_hash 와 비교해 같으면 건너뜀
+    4) 바뀐 방만 저장된 칸과 diff → 추가 / 수정 / 삭제된 칸만 반영
+    쓰기는 이 프로세스 하나가 전담한다. 같은 CSV 를 다시 돌리면 아무것도 바뀌지 않고,
+    중간에 실패하면 전체 롤백. 변경 요약(바뀐 room_id 목록 포함) 반환.
+    """
+    t0 = time.perf_counter()
+    summary = ImportSummary()
+
+    parsed = parse_files(csv_paths, workers)
+    summary.files = len(parsed)
+    if not parsed:
+        print("⚠ 적재할 CSV 가 없습니다.")
+        return summary
+
+    # 같은 방 CSV 가 두 번 들어오면 뒤의 것이 이김
+    latest: Dict[Tuple[str, str], Dict[Cell, str]] = {}
+    for building_name, room_name, rows in parsed:
+        latest[(building_name, room_name)] = cells_of(rows)
+    summary.rooms = len(latest)
+    summary.rows = sum(len(cells) for cells in latest.values())
+
+    with connection() as conn:
+        with conn.transaction():
+            cur = conn.cursor()
+
+            building_ids = ensure_buildings(cur, (b for b, _ in latest))
+            room_ids, summary.new_room_ids = ensure_rooms(cur, ((building_ids[b], r) for b, r in latest))
+
+            incoming: Dict[int, Dict[Cell, str]] = {}
+            names: Dict[int, str] = {}
+            for (building_name, room_name), cells in latest.items():
+                room_id = room_ids[(building_ids[building_name], room_name)]
+                incoming[room_id] = cells
+                names[room_id] = f"{building_name} - {room_name}"
+            hashes = {room_id: content_hash(cells) for room_id, cells in incoming.items()}
+
+            cur.execute(
+                "SELECT id, timetable_hash FROM room WHERE id = ANY(%s)",
+                (sorted(incoming),),
+            )
+            stored_hashes = dict(cur.fetchall())
+            candidates = sorted(
+                room_id for room_id in incoming
+                if stored_hashes.get(room_id) != hashes[room_id]
+            )
+
+            inserts: List[Tuple[int, int, int, str]] = []
+            updates: List[Tuple[int, int, int, str]] = []
+            deletes: List[Tuple[int, int, int]] = []
+            backfill: List[Tuple[int, int, int, str]] = []
+            stored, unparsed = load_stored_cells(cur, candidates) if candidates else ({}, {})
+            for room_id in candidates:
+                ins, upd, dels = diff_cells(stored[room_id], incoming[room_id])
+                changed = {(p, w) for p, w, _ in upd}
+                # 내용은 그대로인데 구조화 컬럼이 빈 예전 행 → 같은 UPDATE 로 채움
+                backfill.extend(
+                    (room_id, p, w, incoming[room_id][(p, w)])
+                    for p, w in unparsed[room_id]
+                    if (p, w) in incoming[room_id] and (p, w) not in changed
+                )
+                if not (ins or upd or dels):
+                    continue    # 해시만 비어 있던 기존 방: 내용은 같음
+                inserts.extend((room_id, *row) for row in ins)
+                updates.extend((room_id, *row) for row in upd)
+                deletes.extend((room_id, *cell) for cell in dels)
+                summary.changed_room_ids.append(room_id)
+                print(f"[변경] {names[room_id]} (+{len(ins)} ~{len(upd)} -{len(dels)})")
+
+            apply_delta(cur, inserts, updates + backfill, deletes)
+            summary.inserted, summary.updated, summary.deleted = (
+                len(inserts), len(updates), len(deletes)
+            )
+            summary.backfilled = len(backfill)
+            summary.unchanged = summary.rooms - len(summary.changed_room_ids)
+
+            if candidates:
+                cur.execute(
+                    """
+                    UPDATE room r SET timetable_hash = h.hash
+                    FROM unnest(%s::int[], %s::text[]) AS h(id, hash)
+                    WHERE r.id = h.id
+                    """,
+                    (candidates, [hashes[rid] for rid in candidates]),
+                )
+
+            cur.close()
+
+    elapsed = time.perf_counter() - t0
+    rate = summary.rows / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"[통계] 파일 {summary.files}개, 방 {summary.rooms}개 "
+        f"(신규 {len(summary.new_room_ids)}, 변경 {len(summary.changed_room_ids)} / 동일 {summary.unchanged}), "
+        f"칸 +{summary.inserted} ~{summary.updated} -{summary.deleted} "
+        f"(구조화 채움 {summary.backfilled}), "
+        f"{elapsed:.2f}초 (workers={workers})"
+    )
+    print(f"[통계] 시간표 {summary.rows}행, {rate:,.0f} rows/s")
+    return summary
 
-            insert_timetable(room_id, period, weekday, str(cell))
 
-    print(f"[완료] {room_full_name}")
+# -----------------------------------------------------------
+# CSV 하나 처리
+# -----------------------------------------------------------
+def import_csv_file(csv_path: str):
+    summary = import_files([csv_path])
+    notify_changes(summary)
+    return summary
 
 
 # -----------------------------------------------------------
 # 전체 CSV 처리
 # -----------------------------------------------------------
-def import_all_csv():
+def import_all_csv(csv_dir: str = CSV_DIR, workers: int = IMPORT_WORKERS):
     print("\n=== CSV Import 시작 ===\n")
 
-    for file in os.listdir(CSV_DIR):
-        if file.lower().endswith(".csv"):
-            path = os.path.join(CSV_DIR, file)
-            import_csv_file(path)
+    paths = [
+        os.path.join(csv_dir, file)
+        for file in sorted(os.listdir(csv_dir))
+        if file.lower().endswith(".csv")
+    ]
+    summary = import_files(paths, workers)
 
     print("\n=== 모든 CSV 처리 완료! ===")
 
+    notify_changes(summary)
+    return summary
+
+
+# -----------------------------------------------------------
+# 실행 중인 API 서버에 점유 인덱스 재적재 요청
+# -----------------------------------------------------------
+def notify_api_reload(room_ids: Optional[List[int]] = None):
+    """room_ids 를 주면 그 방들만 다시 읽고 캐시도 그 방 것만 무효화, None 이면 전체"""
+    url = f"{API_BASE_URL}/admin/occupancy/reload"
+    body = {"room_ids": room_ids} if room_ids is not None else None
+    try:
+        res = requests.post(url, json=body, timeout=10)
+        res.raise_for_status()
+        print(f"[reload] 점유 인덱스 갱신 완료: {res.json()}")
+    except Exception as e:
+        # 서버가 꺼져 있으면 다음 기동 때 어차피 새로 적재됨
+        print(f"⚠ 점유 인덱스 갱신 요청 실패 ({url}): {e}")
+
+
+def notify_changes(summary: ImportSummary):
+    """바뀐 방 / 새 방만 서버에 알린다. 둘 다 없으면 서버 쪽 인덱스 / 캐시도 그대로 둠"""
+    if summary.reload_room_ids:
+        notify_api_reload(summary.reload_room_ids)
+
 
 # 메인 실행
+def cli():
+    parser = argparse.ArgumentParser(description="시간표 CSV → DB 적재")
+    parser.add_argument("--dir", default=CSV_DIR, help="CSV 디렉토리")
+    parser.add_argument("--workers", type=int, default=IMPORT_WORKERS,
+                        help="파싱 프로세스 수 (1이면 순차)")
+    args = parser.parse_args()
+    import_all_csv(args.dir, args.workers)
+
+
 if __name__ == "__main__":
-    import_all_csv()
+    cli()
@@ -0,0 +1,185 @@
+"""
+버전 관리되는 스키마 마이그레이션.
+
+migrations/NNNN_*.sql 파일을 번호 순으로 한 번씩만 적용하고,
+적용 이력은 schema_migrations 테이블에 남긴다. 파일 하나 = 트랜잭션 하나.
+
+  python -m app.db.migrate            # 미적용 마이그레이션 적용
+  python -m app.db.migrate --status   # 적용/미적용 목록
+  python -m app.db.migrate --explain  # 핫 쿼리 실행계획이 인덱스를 타는지 확인
+"""
+import argparse
+import json
+import os
+import re
+from typing import Dict, List, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL, Engine
+
+from .db_config import DB_HOST, DB_NAME, DB_USER, DB_PASS
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
+MIGRATION_FILE = re.compile(r"^(\d{4})_[\w-]+\.sql$")
+
+
+def get_engine() -> Engine:
+    url = URL.create(
+        "postgresql+psycopg",
+        username=DB_USER,
+        password=DB_PASS,
+        host=DB_HOST,
+        database=DB_NAME,
+    )
+    return create_engine(url)
+
+
+# -----------------------------------------------------------
+# 마이그레이션 목록 / 이력
+# -----------------------------------------------------------
+def list_migrations() -> List[Tuple[str, str]]:
+    """(version, 파일경로) 를 버전 순으로"""
+    found = []
+    for name in sorted(os.listdir(MIGRATIONS_DIR)):
+        m = MIGRATION_FILE.match(name)
+        if m:
+            found.append((m.group(1), os.path.join(MIGRATIONS_DIR, name)))
+    return found
+
+
+def ensure_history_table(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version VARCHAR(16) PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+        """))
+
+
+def applied_versions(engine: Engine) -> Dict[str, str]:
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT version, applied_at FROM schema_migrations")).all()
+    return {v: str(at) for v, at in rows}
+
+
+def migrate(engine: Engine) -> List[str]:
+    """미적용 마이그레이션을 순서대로 적용하고 적용한 버전 목록을 반환"""
+    ensure_history_table(engine)
+    done = applied_versions(engine)
+    applied = []
+
+    for version, path in list_migrations():
+        if version in done:
+            continue
+        with open(path, encoding="utf-8") as f:
+            sql = f.read()
+
+        print(f"[migrate] {os.path.basename(path)} 적용 중...")
+        with engine.begin() as conn:
+            # 파라미터 없이 드라이버로 그대로 보냄 (여러 문장 / DO 블록 허용)
+            conn.exec_driver_sql(sql)
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, name) VALUES (:v, :n)"),
+                {"v": version, "n": os.path.basename(path)},
+            )
+        applied.append(version)
+
+    return applied
+
+
+# -----------------------------------------------------------
+# 핫 쿼리 실행계획 확인
+# -----------------------------------------------------------
+# 이름 → (SQL, 예시 파라미터, 기대하는 인덱스 이름)
+HOT_QUERIES: Dict[str, Tuple[str, dict, str]] = {
+    "timetable_by_room_weekday": (
+        """
+        SELECT period, raw_text
+        FROM room_timetable
+        WHERE room_id = :room_id AND weekday = :weekday
+        ORDER BY period
+        """,
+        {"room_id": 1, "weekday": 1},
+        "room_timetable_cell_key",
+    ),
+    "timetable_by_room": (
+        """
+        SELECT period, weekday, raw_text
+        FROM room_timetable
+        WHERE room_id = :room_id
+        ORDER BY weekday, period
+        """,
+        {"room_id": 1},
+        "room_timetable_cell_key",
+    ),
+    "reservations_by_room_date": (
+        """
+        SELECT start_time, end_time, user_name
+        FROM reservation
+        WHERE room_id = :room_id AND date = :date
+        ORDER BY start_time
+        """,
+        {"room_id": 1, "date": "2025-01-06"},
+        "reservation_room_date_start_idx",
+    ),
+}
+
+
+def _plan_indexes(node: dict) -> List[str]:
+    found = []
+    if "Index Name" in node:
+        found.append(node["Index Name"])
+    for child in node.get("Plans", []):
+        found.extend(_plan_indexes(child))
+    return found
+
+
+def explain_hot_queries(engine: Engine) -> bool:
+    """
+    각 핫 쿼리의 EXPLAIN (FORMAT JSON) 을 떠서 기대 인덱스를 쓰는지 출력.
+    테이블이 작으면 플래너가 seq scan 을 고르므로 enable_seqscan=off 로
+    '인덱스로 풀 수 있는가' 를 확인한다. 모두 통과하면 True.
+    """
+    ok = True
+    with engine.begin() as conn:
+        conn.execute(text("SET LOCAL enable_seqscan = off"))
+        for name, (sql, params, expected) in HOT_QUERIES.items():
+            raw = conn.execute(text("EXPLAIN (FORMAT JSON) " + sql), params).scalar()
+            plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+            used = _plan_indexes(plan)
+            passed = expected in used
+            ok = ok and passed
+            mark = "OK " if passed else "FAIL"
+            print(f"[{mark}] {name}: {plan['Node Type']} via {used or '-'} (expected {expected})")
+    return ok
+
+
+def cli():
+    parser = argparse.ArgumentParser(description="스키마 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="적용 현황만 출력")
+    parser.add_argument("--explain", action="store_true", help="핫 쿼리 인덱스 사용 확인")
+    args = parser.parse_args()
+
+    engine = get_engine()
+
+    if args.status:
+        ensure_history_table(engine)
+        done = applied_versions(engine)
+        for version, path in list_migrations():
+            state = f"applied {done[version]}" if version in done else "pending"
+            print(f"{version}  {os.path.basename(path):40s} {state}")
+        return
+
+    if args.explain:
+        if not explain_hot_queries(engine):
+            raise SystemExit("핫 쿼리 중 기대 인덱스를 쓰지 않는 것이 있습니다.")
+        return
+
+    applied = migrate(engine)
+    print(f"[migrate] {len(applied)}개 적용 완료" if applied else "[migrate] 최신 상태")
+
+
+if __name__ == "__main__":
+    cli()
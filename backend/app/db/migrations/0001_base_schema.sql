@@ -1,12 +1,14 @@
+-- 기본 테이블 (기존 DB 에서도 그대로 통과하도록 IF NOT EXISTS)
+
 -- building table
-CREATE TABLE building (
+CREATE TABLE IF NOT EXISTS building (
     id SERIAL PRIMARY KEY,
     code VARCHAR(20) UNIQUE NOT NULL,
     name VARCHAR(100) NOT NULL
 );
 
 -- room table
-CREATE TABLE room (
+CREATE TABLE IF NOT EXISTS room (
     id SERIAL PRIMARY KEY,
     building_id INT REFERENCES building(id),
     name VARCHAR(50) NOT NULL,
@@ -16,7 +18,7 @@ CREATE TABLE room (
 );
 
 -- timetable (class schedule)
-CREATE TABLE room_timetable (
+CREATE TABLE IF NOT EXISTS room_timetable (
     id SERIAL PRIMARY KEY,
     room_id INT REFERENCES room(id),
     period INT NOT NULL,
@@ -25,7 +27,7 @@ CREATE TABLE room_timetable (
 );
 
 -- reservation table
-CREATE TABLE reservation (
+CREATE TABLE IF NOT EXISTS reservation (
     id SERIAL PRIMARY KEY,
     room_id INT REFERENCES room(id),
     date DATE NOT NULL,
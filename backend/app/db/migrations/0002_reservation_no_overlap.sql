@@ -0,0 +1,22 @@
+-- reservation 에 시간 범위 컬럼 + 같은 방 겹침 금지 배타 제약
+-- (이미 겹치는 예약이 있으면 제약 추가가 실패하므로 먼저 정리할 것)
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+ALTER TABLE reservation
+    ADD COLUMN IF NOT EXISTS during TSRANGE
+        GENERATED ALWAYS AS (tsrange(date + start_time, date + end_time, '[)')) STORED;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'reservation_time_order') THEN
+        ALTER TABLE reservation
+            ADD CONSTRAINT reservation_time_order CHECK (start_time < end_time);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'reservation_no_overlap') THEN
+        ALTER TABLE reservation
+            ADD CONSTRAINT reservation_no_overlap
+                EXCLUDE USING gist (room_id WITH =, during WITH &&);
+    END IF;
+END
+$$;
@@ -0,0 +1,33 @@
+-- 핫 쿼리용 복합/커버링 인덱스
+--   room_timetable : WHERE room_id, weekday ORDER BY period  (점유 인덱스 적재, raw-timetable)
+--   reservation    : WHERE room_id, date ORDER BY start_time (timeline, free-now, 예약 충돌)
+
+-- 1) 같은 칸 (room_id, weekday, period) 중복 행 정리: 가장 먼저 들어온 행만 남김
+DELETE FROM room_timetable t
+USING room_timetable keep
+WHERE t.room_id = keep.room_id
+  AND t.weekday = keep.weekday
+  AND t.period = keep.period
+  AND t.id > keep.id;
+
+-- 2) 칸당 한 행 보장 + raw_text 까지 담은 커버링 유니크 인덱스 (index-only scan)
+ALTER TABLE room_timetable
+    ADD CONSTRAINT room_timetable_cell_key
+        UNIQUE (room_id, weekday, period) INCLUDE (raw_text);
+
+ALTER TABLE room_timetable
+    ALTER COLUMN room_id SET NOT NULL;
+
+-- 3) 예약: (room_id, date) 로 찾고 start_time 순으로 읽는다
+CREATE INDEX IF NOT EXISTS reservation_room_date_start_idx
+    ON reservation (room_id, date, start_time)
+    INCLUDE (end_time, user_name);
+
+-- 4) 날짜 기준 전체 조회 (free-now / free-between 의 필터 조인)
+CREATE INDEX IF NOT EXISTS reservation_date_idx
+    ON reservation (date)
+    INCLUDE (room_id, start_time, end_time);
+
+-- 5) 건물별 강의실 목록
+CREATE INDEX IF NOT EXISTS room_building_idx
+    ON room (building_id);
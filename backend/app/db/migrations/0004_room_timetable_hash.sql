@@ -0,0 +1,5 @@
+-- room 별 시간표 내용 해시 (증분 임포트용)
+--   임포터가 정규화한 (period, weekday, raw_text) 목록의 sha1.
+--   해시가 같으면 그 방은 비교조차 하지 않고 건너뛴다. NULL = 아직 계산 안 됨.
+ALTER TABLE room
+    ADD COLUMN IF NOT EXISTS timetable_hash CHAR(40);
@@ -0,0 +1,15 @@
+-- raw_text 를 임포트 시점에 한 번만 파싱해 둔 구조화 컬럼
+--   (학부) 자동차진동제어및실습 / 379052 / 01분반 / 장일도 / 19명
+--   → level, title, course_code, section, instructor, enrollment, label
+-- 예전에 적재된 행은 다음 임포트 때 채워지고, 그 전까지는 API 가 raw_text 를 파싱해 쓴다.
+ALTER TABLE room_timetable
+    ADD COLUMN IF NOT EXISTS course_code TEXT,
+    ADD COLUMN IF NOT EXISTS title TEXT,
+    ADD COLUMN IF NOT EXISTS section TEXT,
+    ADD COLUMN IF NOT EXISTS instructor TEXT,
+    ADD COLUMN IF NOT EXISTS enrollment INT,
+    ADD COLUMN IF NOT EXISTS level TEXT,
+    ADD COLUMN IF NOT EXISTS label TEXT;
+
+-- 해시를 비워 다음 임포트가 모든 방을 다시 비교하게 함 (비어 있는 컬럼 채우기)
+UPDATE room SET timetable_hash = NULL;
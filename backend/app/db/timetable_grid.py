@@ -0,0 +1,99 @@
+"""
+크롤러 CSV 의 주간 격자(col_1=교시, col_2..col_7=월..토) → (period, weekday, raw_text) 레코드.
+행/셀 단위 파이썬 루프 없이 numpy 마스크로 처리한다. 임포터 등 격자를 읽는 곳은 모두 이걸 쓸 것.
+"""
+import hashlib
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 요일 매핑 (CSV 열 번호 → weekday, 1=월 ~ 6=토)
+day_map = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 7: 6}
+
+PERIOD_COLUMN = "col_1"
+DAY_COLUMNS = {f"col_{col_idx}": weekday for col_idx, weekday in day_map.items()}
+
+RECORD_COLUMNS = ["period", "weekday", "raw_text"]
+
+Cell = Tuple[int, int]              # (period, weekday)
+Row = Tuple[int, int, str]          # (period, weekday, raw_text)
+
+
+def grid_to_rows(df: pd.DataFrame) -> List[Row]:
+    """
+    교시 칸이 비었거나 숫자가 아닌 행, 내용이 빈 셀("", 공백, NaN, "nan")은 버린다.
+    반환: (period, weekday, raw_text) 순수 파이썬 튜플, (period, weekday) 순 정렬
+    (같은 칸이 여러 번이면 파일 순서 유지).
+
+    방 하나 격자는 14행 안팎이라 melt / sort_values / DataFrame 생성 같은 pandas 호출 비용이
+    셀 수보다 훨씬 크다. 격자를 numpy 배열로 한 번 꺼내 마스크 → nonzero → 정렬만 한다.
+    """
+    day_cols = [c for c in DAY_COLUMNS if c in df.columns]
+    if PERIOD_COLUMN not in df.columns or not day_cols:
+        return []
+
+    # df[col] / df[day_cols] 도 호출마다 Series / DataFrame 을 만들어 느리다 → 배열 한 번만 꺼낸다
+    values = df.to_numpy(dtype=object)
+    period = pd.to_numeric(values[:, df.columns.get_loc(PERIOD_COLUMN)], errors="coerce").astype(float)
+    has_period = ~np.isnan(period)
+    day_idx = [df.columns.get_loc(c) for c in day_cols]
+    text = values[has_period][:, day_idx].astype(str)                   # NaN → "nan"
+
+    keep = ~np.isin(np.char.strip(text), ["", "nan"])
+    rows, cols = np.nonzero(keep)                                         # 행 우선 = 파일 순서
+    periods = period[has_period].astype(int)[rows]
+    weekdays = np.array([DAY_COLUMNS[c] for c in day_cols])[cols]
+    order = np.lexsort((weekdays, periods))                              # 안정 정렬
+
+    return list(zip(
+        periods[order].tolist(),
+        weekdays[order].tolist(),
+        text[rows, cols][order].tolist(),
+    ))
+
+
+def grid_to_records(df: pd.DataFrame) -> pd.DataFrame:
+    """grid_to_rows 의 DataFrame 판: period(int) / weekday(int) / raw_text(str) 열"""
+    return pd.DataFrame(grid_to_rows(df), columns=RECORD_COLUMNS)
+
+
+def records_to_rows(records: pd.DataFrame) -> List[Tuple[int, int, str]]:
+    """DB 드라이버에 바로 넘길 수 있는 순수 파이썬 튜플 리스트 (numpy 스칼라 제거)"""
+    return list(zip(
+        records["period"].tolist(),
+        records["weekday"].tolist(),
+        records["raw_text"].tolist(),
+    ))
+
+
+# -----------------------------------------------------------
+# 증분 임포트용: 내용 해시 / 칸 단위 diff
+# -----------------------------------------------------------
+def cells_of(rows: Iterable[Row]) -> Dict[Cell, str]:
+    """(period, weekday) → raw_text. 같은 칸이 여러 번 나오면 뒤의 것이 이김"""
+    return {(period, weekday): raw_text for period, weekday, raw_text in rows}
+
+
+def content_hash(cells: Dict[Cell, str]) -> str:
+    """칸 순서와 무관한 방 하나의 시간표 해시 (sha1 hex, 40자)"""
+    h = hashlib.sha1()
+    for (period, weekday), raw_text in sorted(cells.items()):
+        h.update(f"{period}\x1f{weekday}\x1f{raw_text}\x1e".encode("utf-8"))
+    return h.hexdigest()
+
+
+def diff_cells(
+    stored: Dict[Cell, str], incoming: Dict[Cell, str]
+) -> Tuple[List[Row], List[Row], List[Cell]]:
+    """
+    저장된 칸 vs 새 칸 → (inserts, updates, deletes).
+    inserts / updates 는 (period, weekday, raw_text), deletes 는 (period, weekday).
+    """
+    inserts = [(p, w, t) for (p, w), t in incoming.items() if (p, w) not in stored]
+    updates = [
+        (p, w, t) for (p, w), t in incoming.items()
+        if (p, w) in stored and stored[(p, w)] != t
+    ]
+    deletes = [cell for cell in stored if cell not in incoming]
+    return sorted(inserts), sorted(updates), sorted(deletes)
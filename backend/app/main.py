@@ -1,125 +1,88 @@
 from __future__ import annotations
 
-from datetime import date, datetime, time
-from typing import List, Tuple, Dict, Optional
-
-from fastapi import FastAPI, Query, HTTPException
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, List, Tuple, Dict, Optional
+
+from fastapi import FastAPI, Query, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from psycopg_pool import PoolTimeout
 from pydantic import BaseModel, field_validator
 
-from app.db.db_connect import get_conn
+from app.db.db_connect import (
+    get_db, open_async_pool, close_async_pool, async_connection, pool_stats,
+)
+from app.services.intervals import Interval, to_minutes, to_hhmm, merge, gaps, first_gap
+from app.services.courses import CourseInfo, parse_course_cached
+from app.services.occupancy import occupancy
+from app.services.search import search_index
+from app.services.suggest import room_suggest
+from app.services.availability import build_day_grid, common_free_slots
+from app.services.cache import response_cache, etag_matches
+from app.services import metrics
 
 
-app = FastAPI(title="Smart Campus API", version="1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 서버 시작 시 커넥션 풀을 미리 열고, 종료 시 반납
+    await open_async_pool()
+    # 학기 시간표는 정적이므로 시작 시 한 번만 읽어 메모리 인덱스로 보관
+    async with async_connection() as conn:
+        await occupancy.load(conn)
+        await search_index.load(conn)
+        await room_suggest.load(conn)
+    yield
+    await close_async_pool()
 
 
-# ---------------------------------------------------------------
-# 교시 → 시간 매핑 (학교 시간표에 맞게 수정 가능)
-# ---------------------------------------------------------------
-PERIOD_TIME: Dict[int, Tuple[str, str]] = {
-    1: ("09:00", "09:50"),
-    2: ("10:00", "10:50"),
-    3: ("11:00", "11:50"),
-    4: ("12:00", "12:50"),
-    5: ("13:00", "13:50"),
-    6: ("14:00", "14:50"),
-    7: ("15:00", "15:50"),
-    8: ("16:00", "16:50"),
-    9: ("17:00", "17:50"),
-}
+app = FastAPI(title="Smart Campus API", version="1.0", lifespan=lifespan)
+
+
+@app.exception_handler(PoolTimeout)
+def _pool_timeout_handler(request: Request, exc: PoolTimeout):
+    # 풀이 가득 차 타임아웃 안에 커넥션을 못 얻은 경우
+    return JSONResponse(status_code=503, content={"detail": "database busy, try again"})
 
 
 # ---------------------------------------------------------------
-# 수업 원시 텍스트 → "과목명 (분반)" 으로 변환
+# 요청 계측: 라우트별 지연시간 + 요청당 DB 쿼리 수/시간
 # ---------------------------------------------------------------
-def parse_class_text(raw_text: str) -> str:
-    """
-    CSV raw_text 예시:
-      (학부) 자동차진동제어및실습
-      379052 / 01분반
-      장일도 / 19명
+@app.middleware("http")
+async def record_metrics(request: Request, call_next):
+    stats = metrics.begin_request()
+    t0 = time.perf_counter()
+
+    def observe(status: int):
+        # 경로 파라미터 값 대신 라우트 템플릿으로 묶는다 (/rooms/{room_id}/timeline)
+        route = request.scope.get("route")
+        route_path = route.path if route is not None else "unmatched"
+        metrics.observe_request(
+            request.method, route_path, status, time.perf_counter() - t0, stats
+        )
 
-    → "자동차진동제어및실습 (01분반)"
-    """
-    if not raw_text:
-        return ""
-
-    lines = [line.strip() for line in str(raw_text).splitlines() if line.strip()]
-    if not lines:
-        return ""
+    try:
+        response = await call_next(request)
+    except Exception:
+        observe(500)
+        raise
 
-    # 1줄: "(학부) 자동차진동제어및실습" → "(학부)" 제거
-    title_line = lines[0].replace("(학부)", "").strip()
+    # call_next 는 응답 헤더가 나오면 돌아온다. StreamingResponse(/timelines:batch stream=true) 는
+    # 본문을 보내는 동안 쿼리하므로, 본문이 끝난 뒤(중간에 끊겨도) 기록해야 쿼리 수/시간이 다 잡힌다
+    body = response.body_iterator
 
-    # 2줄: "379052 / 01분반" 에서 "01분반"만 추출
-    part = ""
-    if len(lines) >= 2 and "/" in lines[1]:
+    async def observed_body():
         try:
-            part = lines[1].split("/")[1].strip()
-        except Exception:
-            part = ""
-
-    if part:
-        return f"{title_line} ({part})"
-    return title_line
-
-
-def get_class_blocks_from_db(room_id: int, d: date) -> List[Tuple[str, str, str]]:
-    """
-    room_timetable 에서 해당 날짜(요일)의 수업을
-    (start, end, raw_text) 리스트로 반환.
-    연속 교시(1,2,3...)이면서 같은 수업(raw_text 동일)이면
-    중간 10분 쉬는시간을 포함해서 한 덩어리로 합친다.
-    """
-    # weekday 인코딩: room_timetable.weekday 가 1=월 ~ 6=토 라고 가정
-    weekday = d.weekday() + 1
-
-    sql = """
-        SELECT period, raw_text
-        FROM room_timetable
-        WHERE room_id = %s
-          AND weekday = %s
-          AND TRIM(COALESCE(raw_text, '')) <> ''
-        ORDER BY period
-    """
-
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(sql, (room_id, weekday))
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-
-    if not rows:
-        return []
-
-    # period, start, end, text 로 변환
-    tmp = []
-    for period, raw_text in rows:
-        if period in PERIOD_TIME:
-            start_str, end_str = PERIOD_TIME[period]
-            tmp.append((period, start_str, end_str, raw_text))
-
-    if not tmp:
-        return []
-
-    # 연속 교시이면서 같은 과목(raw_text 같음)이면 하나로 merge
-    merged: List[Tuple[str, str, str]] = []
-
-    cur_period, cur_start, cur_end, cur_text = tmp[0]
-    for period, start_str, end_str, text in tmp[1:]:
-        if period == cur_period + 1 and text == cur_text:
-            # 연속 교시 + 같은 과목 → 끝 시간만 늘림 (09:00~09:50 + 10:00~10:50 => 09:00~10:50)
-            cur_end = end_str
-            cur_period = period
-        else:
-            merged.append((cur_start, cur_end, cur_text))
-            cur_period, cur_start, cur_end, cur_text = period, start_str, end_str, text
-
-    # 마지막 덩어리 추가
-    merged.append((cur_start, cur_end, cur_text))
+            async for chunk in body:
+                yield chunk
+        finally:
+            observe(response.status_code)
 
-    return merged
+    response.body_iterator = observed_body()
+    return response
 
 
 # ---------------------------------------------------------------
@@ -173,6 +136,60 @@ class ReservationOut(BaseModel):
     end: str
 
 
+class TimelineBatchIn(BaseModel):
+    room_ids: Optional[List[int]] = None  # room_ids 또는 building_id 중 하나
+    building_id: Optional[int] = None
+    start_date: date
+    end_date: date
+    stream: bool = False  # True 면 (room, date) 하나당 한 줄씩 NDJSON 으로 흘려보냄
+
+    @field_validator("end_date")
+    def _check_range(cls, v: date, info):
+        start = info.data.get("start_date")
+        if start and v < start:
+            raise ValueError("end_date must not be before start_date")
+        if start and (v - start).days >= MAX_BATCH_DAYS:
+            raise ValueError(f"date range must be shorter than {MAX_BATCH_DAYS} days")
+        return v
+
+
+class CommonFreeIn(BaseModel):
+    room_ids: Optional[List[int]] = None  # room_ids 또는 building_id 중 하나
+    building_id: Optional[int] = None
+    start_date: date
+    end_date: date
+    duration_minutes: int = 60
+    min_rooms: Optional[int] = None  # None 이면 요청한 방 전부
+    limit: int = 10
+
+    @field_validator("end_date")
+    def _check_range(cls, v: date, info):
+        start = info.data.get("start_date")
+        if start and v < start:
+            raise ValueError("end_date must not be before start_date")
+        if start and (v - start).days >= MAX_BATCH_DAYS:
+            raise ValueError(f"date range must be shorter than {MAX_BATCH_DAYS} days")
+        return v
+
+    @field_validator("duration_minutes")
+    def _check_duration(cls, v: int):
+        if not 1 <= v <= WORK_END - WORK_START:
+            raise ValueError(f"duration_minutes must be between 1 and {WORK_END - WORK_START}")
+        return v
+
+    @field_validator("min_rooms")
+    def _check_min_rooms(cls, v: Optional[int]):
+        if v is not None and v < 1:
+            raise ValueError("min_rooms must be at least 1")
+        return v
+
+    @field_validator("limit")
+    def _check_limit(cls, v: int):
+        if not 1 <= v <= 100:
+            raise ValueError("limit must be between 1 and 100")
+        return v
+
+
 class TimelineBlock(BaseModel):
     start: str
     end: str
@@ -183,55 +200,147 @@ class TimelineBlock(BaseModel):
 # ---------------------------------------------------------------
 # Utils
 # ---------------------------------------------------------------
-def parse_hhmm(s) -> time:
-    """"HH:MM" 문자열 또는 time 객체를 time 으로 변환"""
-    if isinstance(s, time):
-        return s
-    s = str(s)
+WORK_START = to_minutes("09:00")
+WORK_END = to_minutes("18:00")
+
+
+def parse_hhmm(s) -> int:
+    """"HH:MM" 문자열 또는 time 객체 → 자정 기준 분 (형식 오류면 400)"""
     try:
-        hh, mm = s[:5].split(":")
-        return time(int(hh), int(mm))
-    except Exception:
+        return to_minutes(s)
+    except (ValueError, TypeError):
         raise HTTPException(400, f"Invalid time format: {s}")
 
 
-def overlap(a_s, a_e, b_s, b_e) -> bool:
-    """[a_s, a_e) 와 [b_s, b_e) 가 겹치는지 여부"""
-    s1, e1 = parse_hhmm(a_s), parse_hhmm(a_e)
-    s2, e2 = parse_hhmm(b_s), parse_hhmm(b_e)
-    return not (e1 <= s2 or e2 <= s1)
+MAX_BATCH_DAYS = 366
 
 
-def merge_blocks(blocks: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
-    """(start, end) 문자열 리스트를 받아 겹치거나 맞닿는 구간 병합"""
-    parsed = sorted(
-        [(parse_hhmm(s), parse_hhmm(e)) for s, e in blocks],
-        key=lambda x: x[0],
-    )
-    merged: List[Tuple[time, time]] = []
-    for s, e in parsed:
-        if not merged or s > merged[-1][1]:
-            merged.append((s, e))
-        else:
-            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
-    return [(a.strftime("%H:%M"), b.strftime("%H:%M")) for a, b in merged]
+def stored_course(raw_text, columns) -> CourseInfo:
+    """room_timetable 의 구조화 컬럼 → CourseInfo. label 이 빈 예전 행은 raw_text 를 파싱"""
+    if columns[-1] is None:
+        return parse_course_cached(raw_text)
+    return CourseInfo(*columns)
+
+
+def reservation_intervals(rows) -> List[Tuple[Interval, str]]:
+    """DB 예약 행 (start_time, end_time, user) → (Interval, user)"""
+    return [(Interval(to_minutes(s), to_minutes(e)), user) for s, e, user in rows]
+
+
+async def cached_json(request: Request, key, tags, produce) -> Response:
+    """
+    읽기 전용 응답을 캐시에서 꺼내 주고, 없으면 produce() 로 만들어 채운다 (read-through).
+    본문 해시로 만든 ETag 가 If-None-Match 와 같으면 본문 없이 304.
+    """
+    entry = response_cache.get(key)
+    if entry is None:
+        data = await produce()
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+        entry = response_cache.put(key, body, tags)
+
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+
+def build_timeline(room_id: int, d: date, reservation_rows) -> dict:
+    """
+    한 강의실의 하루 타임라인.
+    reservation_rows: 그 날짜의 예약 (start_time, end_time, user) 행
+    """
+    # 1) 이 날짜의 수업 (시간 + 과목명)
+    class_blocks = occupancy.blocks_on(room_id, d)
+
+    classes_out = [
+        {"start": to_hhmm(b.start), "end": to_hhmm(b.end), "label": b.label, "raw_text": b.raw_text}
+        for b in class_blocks
+    ]
+
+    # 2) 이 날짜의 예약
+    reservations = reservation_intervals(reservation_rows)
+    reservations_out = [{**iv.to_json(), "user": user} for iv, user in reservations]
+
+    # 수업 + 예약 전체를 병합 → 점유, 그 사이(근무시간 내)는 빈 시간
+    occupied = merge([b.interval for b in class_blocks] + [iv for iv, _user in reservations])
+    free = gaps(occupied, WORK_START, WORK_END)
+
+    spans = sorted([(iv, "occupied") for iv in occupied] + [(iv, "free") for iv in free])
+    blocks: List[TimelineBlock] = [
+        TimelineBlock(**iv.to_json(), status=status) for iv, status in spans
+    ]
+
+    return {
+        "room_id": room_id,
+        "date": d.isoformat(),
+        "blocks": [b.model_dump() for b in blocks],
+        "classes": classes_out,
+        "reservations": reservations_out,
+    }
+
+
+NEXT_FREE_MAX_DAYS = 31
+
+
+def parse_from(s: Optional[str]) -> datetime:
+    """?from= (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM) → datetime, 없으면 지금"""
+    if not s:
+        return datetime.now().replace(second=0, microsecond=0)
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        raise HTTPException(400, f"invalid from (expected YYYY-MM-DD[THH:MM]): {s}")
+
+
+def group_reservations(rows) -> Dict[int, Dict[date, List[Interval]]]:
+    """db_get_reservations_range 행 → room_id → 날짜 → 예약 구간"""
+    grouped: Dict[int, Dict[date, List[Interval]]] = {}
+    for rid, d, s, e in rows:
+        grouped.setdefault(rid, {}).setdefault(d, []).append(Interval(to_minutes(s), to_minutes(e)))
+    return grouped
+
+
+def day_busy(room_id: int, d: date, reservations: Dict[date, List[Interval]]) -> List[Interval]:
+    """그 날 수업(미리 병합) + 예약 → 병합된 점유 구간. 예약이 없는 날은 인덱스 그대로"""
+    busy = occupancy.busy_on(room_id, d)
+    if d in reservations:
+        busy = merge(busy + reservations[d])
+    return busy
+
+
+def next_free_window(
+    room_id: int, start: datetime, min_minutes: int, days: int,
+    reservations: Dict[date, List[Interval]],
+) -> Optional[dict]:
+    """
+    start 부터 days 일 안에서 근무시간 내 min_minutes 이상 비는 첫 구간.
+    수업 점유는 인덱스에 미리 병합돼 있고, 그 날 예약이 있을 때만 다시 병합한다.
+    reservations: 이 방의 날짜별 예약 구간
+    """
+    for offset in range(days):
+        d = start.date() + timedelta(days=offset)
+        lo = WORK_START if offset else max(WORK_START, start.hour * 60 + start.minute)
+        if lo + min_minutes > WORK_END:
+            continue
+
+        window = first_gap(day_busy(room_id, d, reservations), lo, WORK_END, min_minutes)
+        if window is not None:
+            return {"date": d.isoformat(), **window.to_json(), "minutes": window.minutes}
+    return None
 
 
 # ---------------------------------------------------------------
 # DB Helpers
 # ---------------------------------------------------------------
-def db_get_buildings():
-    conn = get_conn()
+async def db_get_buildings(conn):
     cur = conn.cursor()
-    cur.execute("SELECT id, code, name FROM building ORDER BY id")
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    await cur.execute("SELECT id, code, name FROM building ORDER BY id")
+    rows = await cur.fetchall()
+    await cur.close()
     return rows
 
 
-def db_get_rooms(building_id=None, floor=None, min_capacity=None):
-    conn = get_conn()
+async def db_get_rooms(conn, building_id=None, floor=None, min_capacity=None):
     cur = conn.cursor()
 
     sql = "SELECT id, building_id, name, floor, capacity FROM room WHERE 1=1"
@@ -249,35 +358,32 @@ def db_get_rooms(building_id=None, floor=None, min_capacity=None):
         sql += " AND capacity >= %s"
         params.append(min_capacity)
 
-    cur.execute(sql, params)
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    await cur.execute(sql, params)
+    rows = await cur.fetchall()
+    await cur.close()
     return rows
 
 
-def db_get_timetable(room_id: int):
-    conn = get_conn()
+async def db_get_timetable(conn, room_id: int):
     cur = conn.cursor()
-    cur.execute(
+    await cur.execute(
         """
-        SELECT period, weekday, raw_text
+        SELECT period, weekday, raw_text,
+               course_code, title, section, instructor, enrollment, level, label
         FROM room_timetable
         WHERE room_id = %s
         ORDER BY weekday, period
         """,
         (room_id,),
     )
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    rows = await cur.fetchall()
+    await cur.close()
     return rows
 
 
-def db_get_reservations(room_id: int, date_str: str):
-    conn = get_conn()
+async def db_get_reservations(conn, room_id: int, date_str: str):
     cur = conn.cursor()
-    cur.execute(
+    await cur.execute(
         """
         SELECT start_time, end_time, user_name
         FROM reservation
@@ -286,125 +392,310 @@ def db_get_reservations(room_id: int, date_str: str):
         """,
         (room_id, date_str),
     )
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    rows = await cur.fetchall()
+    await cur.close()
     return rows
 
 
-def db_insert_reservation(room_id, date_str, start, end, user):
-    conn = get_conn()
+async def db_get_reservations_on(conn, date_str: str, building_id=None, floor=None, min_capacity=None):
+    """
+    db_get_rooms 와 같은 필터에 걸리는 모든 강의실의 특정 날짜 예약 → (room_id, start, end, user).
+    방 목록 조회 결과를 기다리지 않아도 되므로 방 목록과 동시에 돌릴 수 있다.
+    """
     cur = conn.cursor()
-    cur.execute(
+
+    sql = """
+        SELECT r.room_id, r.start_time, r.end_time, r.user_name
+        FROM reservation r
+        JOIN room ON room.id = r.room_id
+        WHERE r.date = %s
+    """
+    params: List = [date_str]
+
+    if building_id is not None:
+        sql += " AND room.building_id = %s"
+        params.append(building_id)
+
+    if floor is not None:
+        sql += " AND room.floor = %s"
+        params.append(floor)
+
+    if min_capacity is not None:
+        sql += " AND room.capacity >= %s"
+        params.append(min_capacity)
+
+    await cur.execute(sql + " ORDER BY r.room_id, r.start_time", params)
+    rows = await cur.fetchall()
+    await cur.close()
+    return rows
+
+
+async def db_get_reservations_range(conn, room_ids: List[int], start_date: date, end_date: date):
+    """여러 강의실의 [start_date, end_date] 예약 → (room_id, date, start, end)"""
+    cur = conn.cursor()
+    await cur.execute(
         """
-        INSERT INTO reservation (room_id, date, start_time, end_time, user_name)
-        VALUES (%s, %s, %s, %s, %s)
+        SELECT room_id, date, start_time, end_time
+        FROM reservation
+        WHERE room_id = ANY(%s) AND date BETWEEN %s AND %s
+        ORDER BY room_id, date, start_time
         """,
-        (room_id, date_str, start, end, user),
+        (room_ids, start_date, end_date),
     )
-    conn.commit()
-    cur.close()
-    conn.close()
+    rows = await cur.fetchall()
+    await cur.close()
+    return rows
+
+
+async def run_queries(*queries):
+    """
+    서로 독립인 조회들을 풀에서 각각 커넥션을 빌려 동시에 실행.
+    queries: conn 하나를 받는 코루틴 함수들. 결과는 같은 순서의 리스트.
+    """
+    async def _run(query):
+        async with async_connection() as conn:
+            return await query(conn)
+
+    return await asyncio.gather(*(_run(q) for q in queries))
+
+
+async def db_insert_reservation(conn, room_id, date_str, start, end, user):
+    """
+    겹치는 예약이 없을 때만 INSERT (배타 제약 reservation_no_overlap 이 판정).
+    검사와 삽입이 한 문장이라 동시 요청 사이에 틈이 없다.
+    - 삽입 성공 (RETURNING id 가 있을 때만): None
+    - 충돌: 겹치는 기존 예약 (start_time, end_time, user_name)
+    - 충돌했는데 상대 예약이 그새 사라져 판정 불가 (재시도 후에도): 409 conflict_retry
+    """
+    params = {"room_id": room_id, "date": date_str, "start": start, "end": end, "user": user}
+    cur = conn.cursor()
+    row = None
+    for _attempt in range(2):
+        await cur.execute(
+            """
+            WITH ins AS (
+                INSERT INTO reservation (room_id, date, start_time, end_time, user_name)
+                VALUES (%(room_id)s, %(date)s, %(start)s, %(end)s, %(user)s)
+                ON CONFLICT DO NOTHING
+                RETURNING id
+            )
+            SELECT TRUE, NULL::time, NULL::time, NULL::varchar FROM ins
+            UNION ALL
+            (
+                SELECT FALSE, r.start_time, r.end_time, r.user_name
+                FROM reservation r
+                WHERE NOT EXISTS (SELECT 1 FROM ins)
+                  AND r.room_id = %(room_id)s
+                  AND r.date = %(date)s
+                  AND r.start_time < %(end)s
+                  AND %(start)s < r.end_time
+                ORDER BY r.start_time
+                LIMIT 1
+            )
+            """,
+            params,
+        )
+        row = await cur.fetchone()
+
+        if row is None:
+            # 문장 시작 뒤에 커밋된 동시 예약과 부딪힌 경우: 스냅샷에 안 보였으니 한 번 더 읽는다
+            await cur.execute(
+                """
+                SELECT FALSE, start_time, end_time, user_name
+                FROM reservation
+                WHERE room_id = %s AND date = %s AND start_time < %s AND %s < end_time
+                ORDER BY start_time
+                LIMIT 1
+                """,
+                (room_id, date_str, end, start),
+            )
+            row = await cur.fetchone()
+
+        if row is not None:
+            break
+        # 부딪힌 예약이 그 사이 지워졌음 → 자리가 비었을 수 있으니 INSERT 부터 한 번 더
+
+    await conn.commit()
+    await cur.close()
+
+    if row is None:
+        raise HTTPException(
+            409,
+            detail={"error": "conflict_retry", "message": "동시 예약과 충돌했습니다. 다시 시도해 주세요."},
+        )
+    if row[0]:
+        # 새 예약이 들어갔으니 그 방/날짜 타임라인 캐시만 무효화
+        response_cache.invalidate(("timeline", room_id, date.fromisoformat(str(date_str)).isoformat()))
+        return None
+    return row[1], row[2], row[3]
 
 
 # ---------------------------------------------------------------
 # API
 # ---------------------------------------------------------------
 @app.get("/")
-def root():
+async def root():
     return {"hello": "world"}
 
 
 @app.get("/healthz")
-def healthz():
-    return {"ok": True, "ts": datetime.now().isoformat()}
+async def healthz():
+    return {
+        "ok": True,
+        "ts": datetime.now().isoformat(),
+        "db_pool": pool_stats(),
+        "occupancy": occupancy.stats(),
+        "search": search_index.stats(),
+        "suggest": room_suggest.stats(),
+        "cache": response_cache.stats(),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    return PlainTextResponse(
+        metrics.render_prometheus(), media_type="text/plain; version=0.0.4"
+    )
 
 
 # ----------------- 건물 목록 ---------------------
 @app.get("/buildings")
-def list_buildings():
-    rows = db_get_buildings()
-    return [
-        {"id": bid, "code": code, "name": name}
-        for bid, code, name in rows
-    ]
+async def list_buildings(request: Request):
+    async def produce():
+        async with async_connection() as conn:
+            rows = await db_get_buildings(conn)
+        return [
+            {"id": bid, "code": code, "name": name}
+            for bid, code, name in rows
+        ]
+
+    return await cached_json(request, ("buildings",), ["buildings"], produce)
 
 
 # ----------------- 강의실 목록 ---------------------
 @app.get("/rooms")
-def list_rooms(
+async def list_rooms(
+    request: Request,
     building_id: Optional[int] = Query(None),
     floor: Optional[int] = Query(None),
     min_capacity: Optional[int] = Query(None),
 ):
-    rows = db_get_rooms(building_id, floor, min_capacity)
-    return [
-        {"id": rid, "building_id": bid, "name": name, "floor": fl, "capacity": cap}
-        for rid, bid, name, fl, cap in rows
-    ]
+    async def produce():
+        async with async_connection() as conn:
+            rows = await db_get_rooms(conn, building_id, floor, min_capacity)
+        return [
+            {"id": rid, "building_id": bid, "name": name, "floor": fl, "capacity": cap}
+            for rid, bid, name, fl, cap in rows
+        ]
+
+    key = ("rooms", building_id, floor, min_capacity)
+    return await cached_json(request, key, ["rooms"], produce)
+
+
+# ----------------- 강의실 이름 자동완성 ---------------------
+@app.get("/rooms/suggest")
+async def suggest_rooms(
+    q: str = Query(..., min_length=1, description="강의실 이름 접두어 (초성 가능: ㅍㄹㅇ)"),
+    k: int = Query(10, ge=1, le=50),
+    building_id: Optional[int] = Query(None),
+):
+    """키 입력마다 호출하는 용도. 메모리 정렬 인덱스만 보고 DB 는 건드리지 않는다"""
+    t0 = time.perf_counter()
+    rooms = room_suggest.suggest(q, k=k, building_id=building_id)
+    return {
+        "query": q,
+        "count": len(rooms),
+        "took_ms": round((time.perf_counter() - t0) * 1000, 3),
+        "rooms": [r.to_json() for r in rooms],
+    }
 
 
 # ----------------- 원시 시간표 확인용 ---------------------
 @app.get("/rooms/{room_id}/raw-timetable")
-def raw_timetable(room_id: int):
+async def raw_timetable(room_id: int, request: Request):
     """
     room_timetable 테이블에 들어있는 원본 데이터 그대로 보기
-    (요일/교시/텍스트)
+    (요일/교시/텍스트 + 임포트 때 파싱해 둔 과목 정보)
     """
-    rows = db_get_timetable(room_id)
-    return [
-        {
-            "period": period,
-            "weekday": weekday,
-            "raw_text": raw_text,
-        }
-        for period, weekday, raw_text in rows
-    ]
+    async def produce():
+        async with async_connection() as conn:
+            rows = await db_get_timetable(conn, room_id)
+        return [
+            {
+                "period": period,
+                "weekday": weekday,
+                "raw_text": raw_text,
+                "course": stored_course(raw_text, course).to_json(),
+            }
+            for period, weekday, raw_text, *course in rows
+        ]
+
+    key = ("raw-timetable", room_id)
+    return await cached_json(request, key, ["timetable", ("room", room_id)], produce)
+
+
+# ----------------- 과목 / 교수 / 강의실 검색 ---------------------
+@app.get("/search")
+async def search(
+    q: str = Query(..., min_length=1, description="과목명, 학수번호, 교수명, 강의실명 (접두어)"),
+    weekday: Optional[int] = Query(None, ge=1, le=6),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """
+    메모리 역색인 조회 (DB 접근 없음). 예: "379052", "장일도", "자동차진", "프라임관 101"
+    → 걸린 시간표 칸 (room_id / 요일 / 교시 + 과목 정보)
+    """
+    t0 = time.perf_counter()
+    hits = search_index.search(q, limit=limit, weekday=weekday)
+    return {
+        "query": q,
+        "count": len(hits),
+        "took_ms": round((time.perf_counter() - t0) * 1000, 3),
+        "hits": [h.to_json() for h in hits],
+    }
 
 
 # ----------------- 지금 빈 강의실 ---------------------
 @app.get("/rooms/free-now")
-def free_now(
+async def free_now(
     building_id: Optional[int] = Query(None),
     min_capacity: Optional[int] = Query(None),
 ):
-    rooms = db_get_rooms(building_id, None, min_capacity)
-
-    now_t = datetime.now().time()
+    now = datetime.now()
+    now_min = to_minutes(now.time())
     today = date.today()
     today_str = today.isoformat()
 
-    free_list = []
-
-    for rid, bid, name, fl, cap in rooms:
-        busy = False
-
-        # 1) 수업 시간 체크 (DB)
-        for s, e, _label in get_class_blocks_from_db(rid, today):
-            if parse_hhmm(s) <= now_t < parse_hhmm(e):
-                busy = True
-                break
-
-        # 2) 예약 시간 체크
-        if not busy:
-            reservations = db_get_reservations(rid, today_str)
-            for s, e, _user in reservations:
-                s_t = parse_hhmm(s)
-                e_t = parse_hhmm(e)
-                if s_t <= now_t < e_t:
-                    busy = True
-                    break
-
-        if not busy:
-            free_list.append(
-                {
-                    "id": rid,
-                    "building_id": bid,
-                    "name": name,
-                    "floor": fl,
-                    "capacity": cap,
-                }
-            )
+    # 방 개수와 상관없이 쿼리 2번(방 목록 / 오늘 예약)을 동시에 돌린다. 수업은 인덱스 조회
+    rooms, reservations = await run_queries(
+        lambda c: db_get_rooms(c, building_id, None, min_capacity),
+        lambda c: db_get_reservations_on(c, today_str, building_id, None, min_capacity),
+    )
+
+    room_ids = [r[0] for r in rooms]
+    busy_ids = set()
+
+    # 1) 수업 시간 체크
+    for rid in room_ids:
+        if any(b.start <= now_min < b.end for b in occupancy.blocks_on(rid, today)):
+            busy_ids.add(rid)
+
+    # 2) 예약 시간 체크
+    for rid, s, e, _user in reservations:
+        if rid not in busy_ids and to_minutes(s) <= now_min < to_minutes(e):
+            busy_ids.add(rid)
+
+    free_list = [
+        {
+            "id": rid,
+            "building_id": bid,
+            "name": name,
+            "floor": fl,
+            "capacity": cap,
+        }
+        for rid, bid, name, fl, cap in rooms
+        if rid not in busy_ids
+    ]
 
     return {
         "timestamp": datetime.now().isoformat(),
@@ -413,10 +704,121 @@ def free_now(
     }
 
 
+# ----------------- 시간대 지정 빈 강의실 ---------------------
+@app.get("/rooms/free-between")
+async def free_between(
+    date_str: Optional[str] = Query(None, alias="date"),
+    start: str = Query(...),
+    end: str = Query(...),
+    building_id: Optional[int] = Query(None),
+    floor: Optional[int] = Query(None),
+    min_capacity: Optional[int] = Query(None),
+):
+    """
+    [start, end) 동안 수업/예약이 하나도 없는 강의실.
+    하루를 (강의실 × 분) 점유 행렬로 만들고 시간창 구간을 한 번에 축약한다.
+    """
+    if not date_str:
+        date_str = date.today().isoformat()
+    try:
+        target_date = date.fromisoformat(date_str)
+    except ValueError:
+        raise HTTPException(400, "invalid date (expected YYYY-MM-DD)")
+
+    start_min = parse_hhmm(start)
+    end_min = parse_hhmm(end)
+    if start_min >= end_min:
+        raise HTTPException(400, "end must be after start")
+
+    rooms, reservations = await run_queries(
+        lambda c: db_get_rooms(c, building_id, floor, min_capacity),
+        lambda c: db_get_reservations_on(c, date_str, building_id, floor, min_capacity),
+    )
+    room_ids = [r[0] for r in rooms]
+
+    grid = build_day_grid(
+        room_ids, target_date, [(rid, s, e) for rid, s, e, _user in reservations]
+    )
+    free_ids = set(grid.free_room_ids(start_min, end_min))
+
+    free_list = [
+        {"id": rid, "building_id": bid, "name": name, "floor": fl, "capacity": cap}
+        for rid, bid, name, fl, cap in rooms
+        if rid in free_ids
+    ]
+
+    return {
+        "date": date_str,
+        "start": to_hhmm(start_min),
+        "end": to_hhmm(end_min),
+        "count": len(free_list),
+        "free_rooms": free_list,
+    }
+
+
+# ----------------- 다음 빈 시간 ---------------------
+async def next_free_for(
+    room_ids: List[int], from_: Optional[str], min_minutes: int, days: int,
+) -> dict:
+    start = parse_from(from_)
+    async with async_connection() as conn:
+        rows = await db_get_reservations_range(
+            conn, room_ids, start.date(), start.date() + timedelta(days=days - 1)
+        )
+
+    reservations = group_reservations(rows)
+
+    return {
+        "from": start.isoformat(timespec="minutes"),
+        "min_minutes": min_minutes,
+        "rooms": [
+            {
+                "room_id": rid,
+                "next_free": next_free_window(rid, start, min_minutes, days, reservations.get(rid, {})),
+            }
+            for rid in room_ids
+        ],
+    }
+
+
+@app.get("/rooms/next-free")
+async def next_free_many(
+    room_ids: Optional[List[int]] = Query(None),
+    building_id: Optional[int] = Query(None),
+    from_: Optional[str] = Query(None, alias="from"),
+    min_minutes: int = Query(30, ge=1, le=WORK_END - WORK_START),
+    days: int = Query(7, ge=1, le=NEXT_FREE_MAX_DAYS),
+):
+    """여러 강의실(room_ids 반복 또는 building_id) 각각의 다음 빈 시간"""
+    if not room_ids:
+        if building_id is None:
+            raise HTTPException(400, "room_ids or building_id is required")
+        async with async_connection() as conn:
+            room_ids = [r[0] for r in await db_get_rooms(conn, building_id)]
+    return await next_free_for(room_ids, from_, min_minutes, days)
+
+
+@app.get("/rooms/{room_id}/next-free")
+async def next_free(
+    room_id: int,
+    from_: Optional[str] = Query(None, alias="from"),
+    min_minutes: int = Query(30, ge=1, le=WORK_END - WORK_START),
+    days: int = Query(7, ge=1, le=NEXT_FREE_MAX_DAYS),
+):
+    """
+    from(기본: 지금) 이후 근무시간 안에서 min_minutes 이상 연속으로 비는 첫 구간.
+    days 일 안에 없으면 next_free = null.
+    """
+    result = await next_free_for([room_id], from_, min_minutes, days)
+    return {"room_id": room_id, "from": result["from"], "min_minutes": min_minutes,
+            "next_free": result["rooms"][0]["next_free"]}
+
+
 # ----------------- 하루 타임라인 ---------------------
 @app.get("/rooms/{room_id}/timeline")
-def timeline(
+async def timeline(
     room_id: int,
+    request: Request,
     date_str: Optional[str] = Query(None, alias="date"),
 ):
     if not date_str:
@@ -424,105 +826,163 @@ def timeline(
 
     target_date = date.fromisoformat(date_str)
 
-    # 1) 이 날짜의 수업 (시간 + 과목명)
-    class_blocks = get_class_blocks_from_db(room_id, target_date)
-    # [(start, end, label), ...]
+    async def produce():
+        async with async_connection() as conn:
+            reservations = await db_get_reservations(conn, room_id, target_date.isoformat())
+        return build_timeline(room_id, target_date, reservations)
 
-    classes_out = [
-        {"start": s, "end": e, "label": label}
-        for (s, e, label) in class_blocks
-    ]
+    day = target_date.isoformat()
+    tags = ["timetable", ("room", room_id), ("timeline", room_id, day)]
+    return await cached_json(request, ("timeline", room_id, day), tags, produce)
 
-    # 2) 이 날짜의 예약
-    reservations = db_get_reservations(room_id, date_str)
-    reservations_out = []
-    occupied_intervals: List[Tuple[str, str]] = []
 
-    # 수업 시간은 무조건 occupied
-    for s, e, label in class_blocks:
-        occupied_intervals.append((s, e))
+# ----------------- 여러 방 × 기간 타임라인 한 번에 ---------------------
+async def iter_batch_timelines(
+    room_ids: List[int], start_date: date, end_date: date
+) -> AsyncIterator[dict]:
+    """
+    (room_id, date) 순서로 타임라인을 하나씩 만들어 내보낸다.
+    예약은 서버 사이드 커서 한 번으로 (room_id, date) 순서대로 흘려 읽으므로
+    방/기간이 커져도 쿼리 수는 고정이고 메모리에는 방 하나 분량만 올라간다.
+    """
+    days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    room_ids = sorted(set(room_ids))
+
+    async with async_connection() as conn:
+        async with conn.cursor(name="timelines_batch") as cur:
+            await cur.execute(
+                """
+                SELECT room_id, date, start_time, end_time, user_name
+                FROM reservation
+                WHERE room_id = ANY(%s) AND date BETWEEN %s AND %s
+                ORDER BY room_id, date, start_time
+                """,
+                (room_ids, start_date, end_date),
+            )
+            rows = aiter(cur)
+            pending = await anext(rows, None)
 
-    # 예약도 occupied에 포함 + 상세 정보는 별도 배열
-    for s, e, user in reservations:
-        s_str = parse_hhmm(s).strftime("%H:%M")
-        e_str = parse_hhmm(e).strftime("%H:%M")
-        occupied_intervals.append((s_str, e_str))
-        reservations_out.append({"start": s_str, "end": e_str, "user": user})
+            for rid in room_ids:
+                by_date: Dict[date, List[Tuple]] = {}
+                while pending is not None and pending[0] == rid:
+                    by_date.setdefault(pending[1], []).append(pending[2:])
+                    pending = await anext(rows, None)
 
-    # 겹치는 구간 병합 (수업 + 예약 전체)
-    merged = merge_blocks(occupied_intervals)
+                for d in days:
+                    yield build_timeline(rid, d, by_date.get(d, []))
 
-    WORK_START = "09:00"
-    WORK_END = "18:00"
 
-    blocks: List[TimelineBlock] = []
-    cursor = WORK_START
+@app.post("/timelines:batch")
+async def batch_timelines(payload: TimelineBatchIn):
+    """
+    room_ids 또는 building_id 의 모든 강의실에 대해 start_date ~ end_date 타임라인.
+    stream=true 면 application/x-ndjson 으로 한 줄씩 전송.
+    """
+    if payload.room_ids:
+        room_ids = payload.room_ids
+    elif payload.building_id is not None:
+        async with async_connection() as conn:
+            room_ids = [r[0] for r in await db_get_rooms(conn, payload.building_id)]
+    else:
+        raise HTTPException(400, "room_ids or building_id is required")
 
-    for s, e in merged:
-        # 빈 시간
-        if parse_hhmm(cursor) < parse_hhmm(s):
-            blocks.append(TimelineBlock(start=cursor, end=s, status="free"))
+    timelines = iter_batch_timelines(room_ids, payload.start_date, payload.end_date)
 
-        # 점유 시간
-        blocks.append(TimelineBlock(start=s, end=e, status="occupied"))
-        cursor = e
+    if payload.stream:
+        async def ndjson():
+            async for t in timelines:
+                yield json.dumps(t, ensure_ascii=False) + "\n"
 
-    if parse_hhmm(cursor) < parse_hhmm(WORK_END):
-        blocks.append(TimelineBlock(start=cursor, end=WORK_END, status="free"))
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
+    items = [t async for t in timelines]
     return {
-        "room_id": room_id,
-        "date": date_str,
-        "blocks": [b.model_dump() for b in blocks],
-        "classes": classes_out,
-        "reservations": reservations_out,
+        "start_date": payload.start_date.isoformat(),
+        "end_date": payload.end_date.isoformat(),
+        "count": len(items),
+        "timelines": items,
+    }
+
+
+# ----------------- 여러 방이 동시에 비는 시간 ---------------------
+@app.post("/rooms/common-free")
+async def common_free(payload: CommonFreeIn):
+    """
+    start_date ~ end_date 근무시간 중 duration_minutes 동안 min_rooms 개 이상(기본: 전부)의
+    방이 동시에 비는 가장 이른 시간대 limit 개. 날마다 방별 빈 구간을 sweep line 으로 훑는다.
+    """
+    if payload.room_ids:
+        room_ids = list(dict.fromkeys(payload.room_ids))
+    elif payload.building_id is not None:
+        async with async_connection() as conn:
+            room_ids = [r[0] for r in await db_get_rooms(conn, payload.building_id)]
+        if not room_ids:
+            raise HTTPException(404, f"no rooms in building {payload.building_id}")
+    else:
+        raise HTTPException(400, "room_ids or building_id is required")
+
+    need = payload.min_rooms or len(room_ids)
+    if need > len(room_ids):
+        raise HTTPException(400, f"min_rooms ({need}) exceeds room count ({len(room_ids)})")
+
+    async with async_connection() as conn:
+        rows = await db_get_reservations_range(conn, room_ids, payload.start_date, payload.end_date)
+    reservations = group_reservations(rows)
+
+    slots = []
+    d = payload.start_date
+    while d <= payload.end_date and len(slots) < payload.limit:
+        free = {
+            rid: gaps(day_busy(rid, d, reservations.get(rid, {})), WORK_START, WORK_END)
+            for rid in room_ids
+        }
+        for slot in common_free_slots(free, payload.duration_minutes, need, payload.limit - len(slots)):
+            slots.append({
+                "date": d.isoformat(),
+                "start": to_hhmm(slot.start),
+                "end": to_hhmm(slot.start + payload.duration_minutes),
+                "latest_start": to_hhmm(slot.latest_start),
+                "room_ids": slot.room_ids,
+            })
+        d += timedelta(days=1)
+
+    return {
+        "duration_minutes": payload.duration_minutes,
+        "min_rooms": need,
+        "room_count": len(room_ids),
+        "count": len(slots),
+        "slots": slots,
     }
 
 
 # ----------------- 예약 (DB 저장) ---------------------
 @app.post("/rooms/reserve", response_model=ReservationOut)
-def reserve(payload: ReservationIn):
+async def reserve(payload: ReservationIn, conn=Depends(get_db)):
     """
-    - 해당 room / date 의 기존 수업 및 예약과 겹치는지 검사
+    - 수업과 겹치는지는 메모리 점유 인덱스로 검사 (DB 조회 없음)
+    - 예약끼리의 겹침은 DB 배타 제약이 INSERT 시점에 원자적으로 판정
     - 겹치면 409 + 적절한 에러코드 반환
     """
     # 1) 수업과 겹치는지 확인
     target_date = date.fromisoformat(payload.date)
-    class_blocks = get_class_blocks_from_db(payload.room_id, target_date)
+    wanted = Interval(parse_hhmm(payload.start), parse_hhmm(payload.end))
 
-    for cs, ce, label in class_blocks:
-        if overlap(payload.start, payload.end, cs, ce):
+    for b in occupancy.blocks_on(payload.room_id, target_date):
+        if wanted.overlaps(b.interval):
             raise HTTPException(
                 409,
                 detail={
                     "error": "conflict_with_class",
                     "class_block": {
-                        "start": cs,
-                        "end": ce,
-                        "label": label,
+                        **b.interval.to_json(),
+                        "label": b.label,
                     },
                 },
             )
 
-    # 2) 기존 예약과 겹치는지 확인
-    reservations = db_get_reservations(payload.room_id, payload.date)
-
-    for rs, re, user in reservations:
-        if overlap(payload.start, payload.end, rs, re):
-            raise HTTPException(
-                409,
-                detail={
-                    "error": "conflict_with_reservation",
-                    "reservation_block": {
-                        "start": parse_hhmm(rs).strftime("%H:%M"),
-                        "end": parse_hhmm(re).strftime("%H:%M"),
-                        "user": user,
-                    },
-                },
-            )
-
-    # 3) 문제 없으면 INSERT
-    db_insert_reservation(
+    # 2) 기존 예약과 겹치지 않으면 INSERT (검사 + 삽입을 DB 한 번 왕복으로)
+    conflict = await db_insert_reservation(
+        conn,
         payload.room_id,
         payload.date,
         payload.start,
@@ -530,6 +990,19 @@ def reserve(payload: ReservationIn):
         payload.user,
     )
 
+    if conflict is not None:
+        rs, re, user = conflict
+        raise HTTPException(
+            409,
+            detail={
+                "error": "conflict_with_reservation",
+                "reservation_block": {
+                    **Interval(to_minutes(rs), to_minutes(re)).to_json(),
+                    "user": user,
+                },
+            },
+        )
+
     return ReservationOut(
         message="reserved",
         room_id=payload.room_id,
@@ -537,3 +1010,37 @@ def reserve(payload: ReservationIn):
         start=payload.start,
         end=payload.end,
     )
+
+
+# ----------------- 점유 인덱스 재적재 ---------------------
+class OccupancyReloadIn(BaseModel):
+    # None 이면 전체 재적재, 목록이면 그 방들만
+    room_ids: Optional[List[int]] = None
+
+
+@app.post("/admin/occupancy/reload")
+async def reload_occupancy(payload: Optional[OccupancyReloadIn] = None, conn=Depends(get_db)):
+    """
+    CSV 임포트(import_csv.py) 후 호출 → room_timetable 을 다시 읽어
+    메모리 점유 인덱스 / 검색 색인 / 자동완성을 교체하고, 임포트로 바뀌었을 수 있는 응답 캐시를 비운다.
+    증분 임포트가 바뀐 room_ids 를 넘기면 그 방들만 다시 읽고 그 방 캐시만 지운다.
+    (임포트가 새 건물 / 방을 만들었을 수 있으므로 /buildings, /rooms 목록 캐시도 함께)
+    """
+    room_ids = payload.room_ids if payload is not None else None
+    # 검색 색인 / 자동완성은 방 이름 / 과목이 섞여 있어 부분 갱신 없이 항상 다시 만든다
+    await search_index.reload(conn)
+    await room_suggest.reload(conn)
+    if room_ids is None:
+        await occupancy.reload(conn)
+        response_cache.clear()
+        return {"reloaded": True, "scope": "all", **occupancy.stats()}
+
+    await occupancy.load_rooms(conn, room_ids)
+    dropped = response_cache.invalidate("buildings", "rooms", *[("room", rid) for rid in room_ids])
+    return {
+        "reloaded": True,
+        "scope": "rooms",
+        "room_ids": room_ids,
+        "cache_invalidated": dropped,
+        **occupancy.stats(),
+    }
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+import numpy as np
+
+from app.services.intervals import Interval, to_minutes
+from app.services.occupancy import occupancy
+
+DAY_MINUTES = 24 * 60
+
+
+# ---------------------------------------------------------------
+# 하루 점유 그리드 (강의실 × 분)
+# ---------------------------------------------------------------
+class DayGrid:
+    """
+    busy[i, m] == True  ⇔  room_ids[i] 강의실이 m분(자정 기준)에 점유 중.
+    수업 + 예약을 한 번에 찍어두고, 시간창 질의는 모든 방에 대해 벡터 연산 한 번으로 답한다.
+    """
+
+    def __init__(self, room_ids: List[int], busy: np.ndarray):
+        self.room_ids = np.asarray(room_ids, dtype=np.int64)
+        self.busy = busy
+
+    def free_mask(self, start_min: int, end_min: int) -> np.ndarray:
+        """[start, end) 동안 한 번도 점유되지 않은 방이면 True"""
+        return ~self.busy[:, start_min:end_min].any(axis=1)
+
+    def free_room_ids(self, start_min: int, end_min: int) -> List[int]:
+        return self.room_ids[self.free_mask(start_min, end_min)].tolist()
+
+
+def build_day_grid(
+    room_ids: List[int],
+    d: date,
+    reservations: Iterable[Tuple[int, object, object]],
+) -> DayGrid:
+    """
+    room_ids      : 그리드 행 순서
+    reservations  : (room_id, start, end) — start/end 는 "HH:MM" 또는 time
+    구간 경계만 +1/-1 로 찍은 뒤 cumsum 으로 채우므로 구간 길이와 무관하게 O(rooms × 1440).
+    """
+    row_of = {rid: i for i, rid in enumerate(room_ids)}
+
+    rows: List[int] = []
+    starts: List[int] = []
+    ends: List[int] = []
+
+    for rid in room_ids:
+        for b in occupancy.blocks_on(rid, d):
+            rows.append(row_of[rid])
+            starts.append(b.start)
+            ends.append(b.end)
+
+    for rid, s, e in reservations:
+        i = row_of.get(rid)
+        if i is None:
+            continue
+        rows.append(i)
+        starts.append(to_minutes(s))
+        ends.append(to_minutes(e))
+
+    diff = np.zeros((len(room_ids), DAY_MINUTES + 1), dtype=np.int16)
+    if rows:
+        r = np.asarray(rows, dtype=np.int64)
+        np.add.at(diff, (r, np.asarray(starts, dtype=np.int64)), 1)
+        np.add.at(diff, (r, np.asarray(ends, dtype=np.int64)), -1)
+
+    busy = np.cumsum(diff[:, :DAY_MINUTES], axis=1, dtype=np.int16) > 0
+    return DayGrid(room_ids, busy)
+
+
+# ---------------------------------------------------------------
+# 여러 방이 동시에 비는 시간 (sweep line)
+# ---------------------------------------------------------------
+class CommonSlot(NamedTuple):
+    start: int              # 가장 이른 시작 (분)
+    latest_start: int       # 여기까지는 언제 시작해도 min_rooms 개 이상 빈다 (방 구성은 바뀔 수 있음)
+    room_ids: List[int]     # start 에 시작해 duration 동안 계속 비는 방
+
+
+def common_free_slots(
+    free: Dict[int, List[Interval]], duration: int, min_rooms: int, limit: int,
+) -> List[CommonSlot]:
+    """
+    free      : room_id → 그 날의 빈 구간 (정렬, 비중첩)
+    duration  : 필요한 길이 (분)
+    min_rooms : 동시에 비어야 하는 방 수
+
+    "t 에 시작해 duration 동안 방 r 이 비어 있다" ⇔ t ∈ [gap.start, gap.end - duration].
+    각 빈 구간을 이 '시작 가능 구간' 으로 바꿔 +1/-1 이벤트로 한 번 훑으면서, 시작 가능한 방이
+    min_rooms 개 이상인 최대 구간마다 하나씩 (가장 이른 것부터 limit 개) 돌려준다.
+    O(E log E), E = 길이가 duration 이상인 빈 구간 수.
+    """
+    events: List[Tuple[int, int, int]] = []
+    for rid, gaps in free.items():
+        for g in gaps:
+            if g.minutes >= duration:
+                events.append((g.start, 1, rid))
+                events.append((g.end - duration + 1, -1, rid))   # 이 시각부터는 못 시작
+    # 같은 시각이면 빠지는 방(-1) 먼저
+    events.sort()
+
+    slots: List[CommonSlot] = []
+    active = set()
+    open_at = None
+    open_rooms: List[int] = []
+    i = 0
+    while i < len(events) and len(slots) < limit:
+        t = events[i][0]
+        while i < len(events) and events[i][0] == t:
+            _t, delta, rid = events[i]
+            if delta > 0:
+                active.add(rid)
+            else:
+                active.discard(rid)
+            i += 1
+
+        if open_at is None and len(active) >= min_rooms:
+            open_at, open_rooms = t, sorted(active)
+        elif open_at is not None and len(active) < min_rooms:
+            slots.append(CommonSlot(open_at, t - 1, open_rooms))
+            open_at = None
+
+    return slots
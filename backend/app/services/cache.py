@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, NamedTuple, Optional, Set
+
+
+class CacheEntry(NamedTuple):
+    body: bytes     # 직렬화된 응답 본문
+    etag: str       # 본문 내용에서 유도한 ETag
+    expires: float  # time.monotonic() 기준 만료 시각
+    tags: frozenset
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 ("*", 여러 개, W/ 약한 비교 포함) 가 etag 와 맞는지"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+# ---------------------------------------------------------------
+# TTL + LRU 응답 캐시
+# ---------------------------------------------------------------
+class TTLCache:
+    """
+    key → 직렬화된 응답. 가장 오래 안 쓰인 항목부터 maxsize 를 넘는 만큼 밀어내고,
+    ttl 초가 지난 항목은 조회 시 버린다.
+    항목마다 태그를 달아 두면 invalidate(tag) 로 관련 키만 골라 지울 수 있다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._by_tag: Dict[Hashable, Set[Hashable]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires <= time.monotonic():
+            self._drop(key)
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, body: bytes, tags: Iterable[Hashable] = ()) -> CacheEntry:
+        if key in self._data:
+            self._drop(key)
+        entry = CacheEntry(body, make_etag(body), time.monotonic() + self.ttl, frozenset(tags))
+        self._data[key] = entry
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._data) > self.maxsize:
+            oldest = next(iter(self._data))
+            self._drop(oldest)
+            self.evictions += 1
+        return entry
+
+    def invalidate(self, *tags: Hashable) -> int:
+        """태그가 하나라도 붙은 항목 제거. 지운 개수 반환"""
+        keys = set()
+        for tag in tags:
+            keys |= self._by_tag.get(tag, set())
+        for key in keys:
+            self._drop(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._by_tag.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+
+# 읽기 전용 API 응답 캐시 (건물/강의실 목록, 원시 시간표, 타임라인)
+response_cache = TTLCache(maxsize=2048, ttl=300.0)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+
+# ---------------------------------------------------------------
+# 수업 원시 텍스트 → 구조화된 과목 정보
+# ---------------------------------------------------------------
+class CourseInfo(NamedTuple):
+    course_code: Optional[str]      # "379052"
+    title: str                      # "자동차진동제어및실습"
+    section: Optional[str]          # "01분반"
+    instructor: Optional[str]       # "장일도"
+    enrollment: Optional[int]       # 19
+    level: Optional[str]            # "학부"
+    label: str                      # "자동차진동제어및실습 (01분반)"
+
+    def to_json(self) -> dict:
+        return self._asdict()
+
+
+EMPTY_COURSE = CourseInfo(None, "", None, None, None, None, "")
+
+# 첫 줄 맨 앞의 "(학부)" / "(대학원)" 같은 과정 구분
+_LEVEL_PREFIX = re.compile(r"^\(([^)]*)\)\s*")
+_DIGITS = re.compile(r"\d+")
+
+
+def _split_pair(line: str):
+    """"379052 / 01분반" → ("379052", "01분반"), 구분자가 없으면 (line, None)"""
+    left, sep, right = line.partition("/")
+    return left.strip() or None, (right.strip() or None) if sep else None
+
+
+def parse_course(raw_text: Optional[str]) -> CourseInfo:
+    """
+    CSV raw_text 예시:
+      (학부) 자동차진동제어및실습
+      379052 / 01분반
+      장일도 / 19명
+
+    → CourseInfo(course_code="379052", title="자동차진동제어및실습", section="01분반",
+                 instructor="장일도", enrollment=19, level="학부",
+                 label="자동차진동제어및실습 (01분반)")
+    줄이 모자라거나 형식이 다르면 해당 필드만 None.
+    """
+    if not raw_text:
+        return EMPTY_COURSE
+
+    lines = [line.strip() for line in str(raw_text).splitlines() if line.strip()]
+    if not lines:
+        return EMPTY_COURSE
+
+    # 1줄: "(학부) 자동차진동제어및실습"
+    level = None
+    title = lines[0]
+    m = _LEVEL_PREFIX.match(title)
+    if m:
+        level = m.group(1).strip() or None
+        title = title[m.end():].strip()
+
+    # 2줄: "379052 / 01분반"
+    course_code = section = None
+    if len(lines) >= 2 and "/" in lines[1]:
+        course_code, section = _split_pair(lines[1])
+
+    # 3줄: "장일도 / 19명"
+    instructor = enrollment = None
+    if len(lines) >= 3:
+        instructor, count = _split_pair(lines[2])
+        digits = _DIGITS.search(count or "")
+        enrollment = int(digits.group()) if digits else None
+
+    label = f"{title} ({section})" if section else title
+    return CourseInfo(course_code, title, section, instructor, enrollment, level, label)
+
+
+@lru_cache(maxsize=4096)
+def parse_course_cached(raw_text: Optional[str]) -> CourseInfo:
+    """구조화 컬럼이 비어 있는 예전 행용. 같은 과목 텍스트는 한 번만 파싱"""
+    return parse_course(raw_text)
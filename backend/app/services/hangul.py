@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import List
+
+# ---------------------------------------------------------------
+# 한글 검색용 정규화
+# ---------------------------------------------------------------
+# 단어 조각: 숫자 / 라틴 / 한글(완성형 + 호환 자모) 을 각각 한 덩어리로
+_WORD = re.compile(r"[0-9a-z가-힣ㄱ-ㅎㅏ-ㅣ]+")
+_SCRIPT_RUN = re.compile(r"[0-9]+|[a-z]+|[가-힣ㄱ-ㅎㅏ-ㅣ]+")
+_HANGUL = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+_CHOSUNG_QUERY = re.compile(r"^[0-9a-zㄱ-ㅎ]*[ㄱ-ㅎ][0-9a-zㄱ-ㅎ]*$")
+
+# 완성형 음절의 초성 (호환 자모). 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+
+def normalize(text: str) -> str:
+    """NFC + 소문자. 입력기마다 다른 조합형/완성형 차이를 없앤다"""
+    return unicodedata.normalize("NFC", str(text or "")).lower()
+
+
+def decompose(text: str) -> str:
+    """
+    완성형 음절 → 첫가끝 자모 (NFKD). "자동차진" 이 "자동차지" 로 시작하듯,
+    아직 받침을 치는 중인 마지막 글자도 접두어로 맞게 하려고 쓴다.
+    호환 자모(ㅈ, ㅊ …)도 같은 자모로 풀린다.
+    """
+    return unicodedata.normalize("NFKD", text)
+
+
+def compact(text: str) -> str:
+    """정규화 후 공백 / 기호 제거 ("프라임관 - 101대강의실" → "프라임관101대강의실")"""
+    return "".join(_WORD.findall(normalize(text)))
+
+
+def chosung(text: str) -> str:
+    """음절만 초성으로 바꿈 ("프라임관101" → "ㅍㄹㅇㄱ101")"""
+    return "".join(
+        CHOSUNG[(ord(ch) - 0xAC00) // 588] if "가" <= ch <= "힣" else ch
+        for ch in text
+    )
+
+
+def is_chosung_query(text: str) -> bool:
+    """음절 없이 초성(+숫자/영문)만 친 입력인지 ("ㅍㄹㅇ", "ㄷㄱㅇㅅ101")"""
+    return _CHOSUNG_QUERY.match(text) is not None
+
+
+def has_hangul(text: str) -> bool:
+    return _HANGUL.search(text) is not None
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    "(학부) 자동차진동제어및실습" → ["학부", "자동차진동제어및실습"]
+    "101대강의실"                → ["101대강의실", "101", "대강의실"]
+    공백/기호로 자르고, 숫자·라틴·한글이 붙어 있으면 그 경계로도 한 번 더 자른다.
+    """
+    tokens: List[str] = []
+    for word in _WORD.findall(normalize(text)):
+        tokens.append(word)
+        runs = _SCRIPT_RUN.findall(word)
+        if len(runs) > 1:
+            tokens.extend(runs)
+    return tokens
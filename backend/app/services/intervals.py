@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import time
+from typing import Iterable, List, Optional
+
+
+# ---------------------------------------------------------------
+# "HH:MM" ↔ 자정 기준 분
+# ---------------------------------------------------------------
+# 직렬화할 때마다 포맷팅하지 않도록 00:00 ~ 24:00 문자열을 미리 만들어 둔다
+_HHMM: List[str] = [f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60 + 1)]
+
+
+def to_minutes(v) -> int:
+    """
+    "HH:MM"(초가 붙은 "HH:MM:SS" 도 허용) 또는 time 객체 → 자정 기준 분.
+    형식이 잘못되면 ValueError.
+    """
+    if isinstance(v, time):
+        return v.hour * 60 + v.minute
+    s = str(v)
+    parts = s.split(":")
+    if len(parts) < 2 or len(parts[1]) != 2:
+        raise ValueError(f"invalid time format: {s}")
+    hh, mm = int(parts[0]), int(parts[1])
+    if not (0 <= hh <= 24 and 0 <= mm < 60) or (hh == 24 and mm):
+        raise ValueError(f"invalid time format: {s}")
+    return hh * 60 + mm
+
+
+def to_hhmm(m: int) -> str:
+    """자정 기준 분 → "HH:MM" (응답 직렬화 시에만 사용)"""
+    return _HHMM[m]
+
+
+# ---------------------------------------------------------------
+# 반열린 구간 [start, end)
+# ---------------------------------------------------------------
+@dataclass(frozen=True, slots=True, order=True)
+class Interval:
+    start: int
+    end: int
+
+    @classmethod
+    def parse(cls, start, end) -> "Interval":
+        return cls(to_minutes(start), to_minutes(end))
+
+    @property
+    def minutes(self) -> int:
+        return self.end - self.start
+
+    def overlaps(self, other: "Interval") -> bool:
+        return self.start < other.end and other.start < self.end
+
+    def contains(self, m: int) -> bool:
+        return self.start <= m < self.end
+
+    def to_json(self) -> dict:
+        return {"start": _HHMM[self.start], "end": _HHMM[self.end]}
+
+
+def merge(intervals: Iterable[Interval]) -> List[Interval]:
+    """겹치거나 맞닿는 구간을 병합해 시작 시각 순으로 반환 (길이 0 구간은 점유가 아니므로 버림)"""
+    merged: List[Interval] = []
+    for iv in sorted(intervals):
+        if iv.end <= iv.start:
+            continue
+        if merged and iv.start <= merged[-1].end:
+            if iv.end > merged[-1].end:
+                merged[-1] = Interval(merged[-1].start, iv.end)
+        else:
+            merged.append(iv)
+    return merged
+
+
+def gaps(merged: List[Interval], lo: int, hi: int) -> List[Interval]:
+    """
+    병합된(정렬·비중첩) 점유 구간 사이의 빈 구간을 [lo, hi) 범위로 잘라 반환.
+    """
+    free: List[Interval] = []
+    cursor = lo
+    for iv in merged:
+        if iv.end <= cursor:
+            continue
+        if iv.start >= hi:
+            break
+        if cursor < iv.start:
+            free.append(Interval(cursor, iv.start))
+        cursor = iv.end
+    if cursor < hi:
+        free.append(Interval(cursor, hi))
+    return free
+
+
+def first_gap(merged: List[Interval], lo: int, hi: int, min_len: int) -> Optional[Interval]:
+    """
+    병합된(정렬·비중첩) 점유 구간에서 [lo, hi) 안의 길이 min_len 이상인 첫 빈 구간.
+    lo 이후 첫 점유 구간은 이분 탐색으로 찾고, 거기서부터만 훑는다.
+    반환 구간의 끝은 다음 점유 시작(또는 hi) 까지 — 그때까지 계속 비어 있다는 뜻.
+    """
+    i = bisect_right(merged, lo, key=lambda iv: iv.end)   # end > lo 인 첫 구간
+    cursor = lo
+    while cursor + min_len <= hi:
+        if i == len(merged) or merged[i].start >= hi:
+            return Interval(cursor, hi)
+        busy = merged[i]
+        if busy.start - cursor >= min_len:
+            return Interval(cursor, busy.start)
+        cursor = max(cursor, busy.end)
+        i += 1
+    return None
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import psycopg
+
+logger = logging.getLogger("app.metrics")
+
+# 요청 하나가 이 횟수를 넘겨 쿼리하면 경고 로그 (N+1 회귀 조기 발견용)
+QUERY_COUNT_WARN = int(os.getenv("QUERY_COUNT_WARN", "10"))
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+# ---------------------------------------------------------------
+# 요청 단위 DB 사용량 (contextvar 로 핸들러/동시 조회 태스크까지 전달)
+# ---------------------------------------------------------------
+class RequestStats:
+    __slots__ = ("queries", "db_time")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def begin_request() -> RequestStats:
+    stats = RequestStats()
+    _current.set(stats)
+    return stats
+
+
+def _record_query(elapsed: float) -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += elapsed
+
+
+class InstrumentedAsyncCursor(psycopg.AsyncCursor):
+    async def execute(self, query, params=None, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return await super().execute(query, params, **kwargs)
+        finally:
+            _record_query(time.perf_counter() - t0)
+
+
+class InstrumentedAsyncServerCursor(psycopg.AsyncServerCursor):
+    async def execute(self, query, params=None, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return await super().execute(query, params, **kwargs)
+        finally:
+            _record_query(time.perf_counter() - t0)
+
+
+async def instrument_connection(conn: psycopg.AsyncConnection) -> None:
+    """AsyncConnectionPool(configure=...) 용: 새 커넥션의 커서를 계측 커서로 교체"""
+    conn.cursor_factory = InstrumentedAsyncCursor
+    conn.server_cursor_factory = InstrumentedAsyncServerCursor
+
+
+# ---------------------------------------------------------------
+# Prometheus 텍스트 포맷용 최소 구현 (카운터 / 히스토그램)
+# ---------------------------------------------------------------
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _fmt_labels(labels: Labels, extra: Sequence[Tuple[str, str]] = ()) -> str:
+    items = list(labels) + list(extra)
+    if not items:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"')) for k, v in items
+    )
+    return "{" + body + "}"
+
+
+def _fmt_le(b: float) -> str:
+    return str(b) if not float(b).is_integer() else f"{float(b):.1f}"
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        out = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, v in sorted(self._values.items()):
+            out.append(f"{self.name}{_fmt_labels(labels)} {v}")
+        return out
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets)
+        # labels → [버킷별 개수..., +Inf], 합계, 개수
+        self._counts: Dict[Labels, List[int]] = {}
+        self._sums: Dict[Labels, float] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            self._sums[labels] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def render(self) -> List[str]:
+        out = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, counts in sorted(self._counts.items()):
+            running = 0
+            for b, c in zip(self.buckets, counts):
+                running += c
+                out.append(f"{self.name}_bucket{_fmt_labels(labels, [('le', _fmt_le(b))])} {running}")
+            running += counts[-1]
+            out.append(f"{self.name}_bucket{_fmt_labels(labels, [('le', '+Inf')])} {running}")
+            out.append(f"{self.name}_sum{_fmt_labels(labels)} {self._sums[labels]}")
+            out.append(f"{self.name}_count{_fmt_labels(labels)} {running}")
+        return out
+
+
+REQUESTS = Counter("http_requests_total", "HTTP requests by route and status.")
+LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", LATENCY_BUCKETS
+)
+QUERIES = Histogram(
+    "db_queries_per_request", "DB statements executed per HTTP request.", QUERY_COUNT_BUCKETS
+)
+DB_TIME = Counter("db_time_seconds_total", "Time spent in DB statements, by route.")
+QUERY_WARNINGS = Counter(
+    "db_query_count_warnings_total", "Requests that exceeded QUERY_COUNT_WARN statements."
+)
+
+
+def observe_request(method: str, route: str, status: int, elapsed: float, stats: RequestStats) -> None:
+    labels: Labels = (("method", method), ("route", route))
+    REQUESTS.inc(labels + (("status", str(status)),))
+    LATENCY.observe(labels, elapsed)
+    QUERIES.observe(labels, stats.queries)
+    DB_TIME.inc(labels, stats.db_time)
+
+    if stats.queries > QUERY_COUNT_WARN:
+        QUERY_WARNINGS.inc(labels)
+        logger.warning(
+            "%s %s ran %d DB queries (limit %d, db %.1f ms, total %.1f ms)",
+            method, route, stats.queries, QUERY_COUNT_WARN,
+            stats.db_time * 1000, elapsed * 1000,
+        )
+
+
+def render_prometheus() -> str:
+    lines: List[str] = []
+    for metric in (REQUESTS, LATENCY, QUERIES, DB_TIME, QUERY_WARNINGS):
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
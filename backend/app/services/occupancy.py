@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from app.services.courses import parse_course_cached
+from app.services.intervals import Interval, merge, to_minutes
+
+
+# ---------------------------------------------------------------
+# 교시 → 시간 매핑 (학교 시간표에 맞게 수정 가능)
+# ---------------------------------------------------------------
+PERIOD_TIME: Dict[int, Tuple[str, str]] = {
+    1: ("09:00", "09:50"),
+    2: ("10:00", "10:50"),
+    3: ("11:00", "11:50"),
+    4: ("12:00", "12:50"),
+    5: ("13:00", "13:50"),
+    6: ("14:00", "14:50"),
+    7: ("15:00", "15:50"),
+    8: ("16:00", "16:50"),
+    9: ("17:00", "17:50"),
+}
+
+
+# 교시 → (시작분, 종료분)
+PERIOD_MINUTES: Dict[int, Tuple[int, int]] = {
+    p: (to_minutes(s), to_minutes(e)) for p, (s, e) in PERIOD_TIME.items()
+}
+
+
+# ---------------------------------------------------------------
+# 수업 원시 텍스트 → "과목명 (분반)" 으로 변환
+# ---------------------------------------------------------------
+def parse_class_text(raw_text: str) -> str:
+    """
+    CSV raw_text 예시:
+      (학부) 자동차진동제어및실습
+      379052 / 01분반
+      장일도 / 19명
+
+    → "자동차진동제어및실습 (01분반)"
+    임포트 때 room_timetable.label 로 미리 저장되므로, 여기는 label 이 빈 예전 행에만 쓰인다.
+    """
+    return parse_course_cached(raw_text).label
+
+
+class ClassBlock(NamedTuple):
+    start: int      # 자정 기준 분
+    end: int
+    raw_text: str
+    label: str      # room_timetable.label (없으면 parse_class_text 결과)
+
+    @property
+    def interval(self) -> Interval:
+        return Interval(self.start, self.end)
+
+
+def merge_class_periods(rows) -> List[ClassBlock]:
+    """
+    (period, raw_text, label) 행들(교시 오름차순)을 ClassBlock 리스트로 변환.
+    label 은 임포트 때 저장해 둔 값, 비어 있으면 raw_text 를 (메모이즈) 파싱.
+    연속 교시이면서 같은 과목(raw_text 동일)이면
+    중간 10분 쉬는시간을 포함해서 한 덩어리로 합친다.
+    """
+    tmp = [
+        (period, *PERIOD_MINUTES[period], raw_text, label)
+        for period, raw_text, label in rows
+        if period in PERIOD_MINUTES
+    ]
+    if not tmp:
+        return []
+
+    merged: List[ClassBlock] = []
+
+    cur_period, cur_start, cur_end, cur_text, cur_label = tmp[0]
+    for period, start, end, text, label in tmp[1:]:
+        if period == cur_period + 1 and text == cur_text:
+            # 연속 교시 + 같은 과목 → 끝 시간만 늘림 (09:00~09:50 + 10:00~10:50 => 09:00~10:50)
+            cur_end = end
+            cur_period = period
+        else:
+            merged.append(ClassBlock(cur_start, cur_end, cur_text, cur_label or parse_class_text(cur_text)))
+            cur_period, cur_start, cur_end, cur_text, cur_label = period, start, end, text, label
+
+    # 마지막 덩어리 추가
+    merged.append(ClassBlock(cur_start, cur_end, cur_text, cur_label or parse_class_text(cur_text)))
+
+    return merged
+
+
+# ---------------------------------------------------------------
+# 주간 점유 인덱스
+# ---------------------------------------------------------------
+class OccupancyIndex:
+    """
+    (room_id, weekday) → 병합된 수업 블록.
+    room_timetable 은 학기 중 바뀌지 않으므로 서버 시작 시 한 번 적재하고,
+    CSV 임포트 후 reload() 로만 다시 읽는다. 조회는 DB 접근 없이 dict 조회 한 번.
+    """
+
+    def __init__(self):
+        self._blocks: Dict[Tuple[int, int], List[ClassBlock]] = {}
+        self._busy: Dict[Tuple[int, int], List[Interval]] = {}
+        self._lock = threading.Lock()
+        self.loaded_at: Optional[datetime] = None
+        self.version = 0
+
+    @staticmethod
+    async def _fetch(conn, room_ids: Optional[List[int]] = None) -> Dict[Tuple[int, int], List[ClassBlock]]:
+        where = "WHERE TRIM(COALESCE(raw_text, '')) <> ''"
+        params: tuple = ()
+        if room_ids is not None:
+            where += " AND room_id = ANY(%s)"
+            params = (list(room_ids),)
+
+        async with conn.cursor() as cur:
+            await cur.execute(
+                f"""
+                SELECT room_id, weekday, period, raw_text, label
+                FROM room_timetable
+                {where}
+                ORDER BY room_id, weekday, period
+                """,
+                params,
+            )
+            rows = await cur.fetchall()
+
+        grouped: Dict[Tuple[int, int], List[Tuple[int, str, Optional[str]]]] = {}
+        for room_id, weekday, period, raw_text, label in rows:
+            grouped.setdefault((room_id, weekday), []).append((period, raw_text, label))
+
+        return {key: merge_class_periods(periods) for key, periods in grouped.items()}
+
+    def _swap(self, blocks: Dict[Tuple[int, int], List[ClassBlock]]) -> None:
+        # 과목이 달라 따로 남은 블록까지 합친 점유 구간 (빈 시간 탐색용)
+        busy = {key: merge(b.interval for b in v) for key, v in blocks.items()}
+        # 읽는 쪽은 락 없이 self._blocks 를 참조하므로 통째로 교체
+        with self._lock:
+            self._blocks = blocks
+            self._busy = busy
+            self.loaded_at = datetime.now()
+            self.version += 1
+
+    async def load(self, conn) -> None:
+        self._swap(await self._fetch(conn))
+
+    async def load_rooms(self, conn, room_ids: List[int]) -> None:
+        """증분 임포트 후: 지정한 방들의 블록만 다시 읽어 교체 (나머지는 그대로)"""
+        fresh = await self._fetch(conn, room_ids)
+        targets = set(room_ids)
+        blocks = {key: v for key, v in self._blocks.items() if key[0] not in targets}
+        blocks.update(fresh)
+        self._swap(blocks)
+
+    reload = load
+
+    def blocks(self, room_id: int, weekday: int) -> List[ClassBlock]:
+        """weekday: 1=월 ~ 6=토"""
+        return self._blocks.get((room_id, weekday), [])
+
+    def blocks_on(self, room_id: int, d: date) -> List[ClassBlock]:
+        return self.blocks(room_id, d.weekday() + 1)
+
+    def busy_on(self, room_id: int, d: date) -> List[Interval]:
+        """그 날짜 요일의 수업 점유 구간 (미리 병합, 시작 순)"""
+        return self._busy.get((room_id, d.weekday() + 1), [])
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            "keys": len(self._blocks),
+            "blocks": sum(len(v) for v in self._blocks.values()),
+        }
+
+
+occupancy = OccupancyIndex()
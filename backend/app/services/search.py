@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+from app.services.courses import CourseInfo, parse_course_cached
+from app.services.hangul import decompose, has_hangul, tokenize
+from app.services.intervals import to_hhmm
+from app.services.occupancy import PERIOD_MINUTES
+
+
+class SearchHit(NamedTuple):
+    room_id: int
+    weekday: int        # 1=월 ~ 6=토
+    period: int
+    building: str
+    room: str
+    course: CourseInfo
+
+    def to_json(self) -> dict:
+        start, end = PERIOD_MINUTES.get(self.period, (None, None))
+        return {
+            "room_id": self.room_id,
+            "building": self.building,
+            "room": self.room,
+            "weekday": self.weekday,
+            "period": self.period,
+            "start": to_hhmm(start) if start is not None else None,
+            "end": to_hhmm(end) if end is not None else None,
+            **self.course.to_json(),
+        }
+
+
+# 한글 토큰은 음절마다 접미어도 색인 ("진동" 으로 "자동차진동제어및실습" 찾기).
+# 너무 긴 토큰은 앞부분만 접미어로 쪼갠다.
+MAX_SUFFIX_TOKEN = 24
+
+
+@lru_cache(maxsize=65536)
+def _index_keys(text: Optional[str]) -> FrozenSet[str]:
+    """같은 과목명 / 교수 / 방 이름은 여러 칸에 반복되므로 텍스트별로 한 번만 계산"""
+    keys = set()
+    for token in tokenize(text or ""):
+        keys.add(decompose(token))
+        if has_hangul(token):
+            for i in range(1, min(len(token), MAX_SUFFIX_TOKEN)):
+                keys.add(decompose(token[i:]))
+    return frozenset(keys)
+
+
+# ---------------------------------------------------------------
+# 과목 / 교수 / 강의실 역색인
+# ---------------------------------------------------------------
+class SearchIndex:
+    """
+    자모 단위 토큰 → 시간표 칸(SearchHit) 번호 목록 (오름차순).
+    토큰은 정렬해 두고 bisect 로 접두어 범위를 찾으므로, 입력 중인 "자동차지" 도
+    "자동차진동…" 에 걸린다. 질의 토큰이 여러 개면 모두 맞는 칸만 (AND):
+    걸리는 칸이 가장 적은 토큰의 목록만 병합하며 훑고, 나머지 토큰은 칸마다
+    "이 칸의 키 중 접두어 범위에 드는 게 있나" 를 bisect 로 확인한다.
+    occupancy 와 마찬가지로 시작 시 / 임포트 후 reload 때 통째로 다시 만든다.
+    """
+
+    def __init__(self):
+        self._hits: List[SearchHit] = []
+        self._keys: List[str] = []
+        self._postings: List[List[int]] = []        # _keys 와 같은 순서
+        self._cum: List[int] = [0]                  # posting 길이 누적합 (범위 크기 추정)
+        self._doc_group: List[int] = []             # 칸 → 같은 색인 키를 가진 묶음
+        self._group_keys: List[List[int]] = []      # 묶음 → 정렬된 키 번호
+        self._lock = threading.Lock()
+        self.loaded_at: Optional[datetime] = None
+        self.build_ms = 0.0
+
+    async def load(self, conn) -> None:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT t.room_id, t.weekday, t.period, t.raw_text,
+                       t.course_code, t.title, t.section, t.instructor,
+                       t.enrollment, t.level, t.label,
+                       r.name, COALESCE(b.name, '')
+                FROM room_timetable t
+                JOIN room r ON r.id = t.room_id
+                LEFT JOIN building b ON b.id = r.building_id
+                WHERE TRIM(COALESCE(t.raw_text, '')) <> ''
+                ORDER BY t.room_id, t.weekday, t.period
+                """
+            )
+            rows = await cur.fetchall()
+        self.build(rows)
+
+    reload = load
+
+    def build(self, rows) -> None:
+        t0 = time.perf_counter()
+        hits: List[SearchHit] = []
+        doc_group: List[int] = []
+        groups: Dict[Tuple[CourseInfo, str, str], int] = {}
+        group_sets: List[FrozenSet[str]] = []
+
+        for room_id, weekday, period, raw_text, *course, room, building in rows:
+            info = CourseInfo(*course) if course[-1] is not None else parse_course_cached(raw_text)
+            hits.append(SearchHit(room_id, weekday, period, building, room, info))
+
+            gkey = (info, room, building)
+            gid = groups.get(gkey)
+            if gid is None:
+                gid = groups[gkey] = len(group_sets)
+                group_sets.append(frozenset().union(*(
+                    _index_keys(text)
+                    for text in (info.title, info.course_code, info.instructor, room, building)
+                )))
+            doc_group.append(gid)
+
+        keys = sorted(set().union(*group_sets))
+        key_no = {k: i for i, k in enumerate(keys)}
+        group_keys = [sorted(key_no[k] for k in ks) for ks in group_sets]
+
+        postings: List[List[int]] = [[] for _ in keys]
+        for doc, gid in enumerate(doc_group):
+            for k in group_keys[gid]:
+                postings[k].append(doc)
+
+        with self._lock:
+            self._hits = hits
+            self._keys = keys
+            self._postings = postings
+            self._cum = [0, *accumulate(len(p) for p in postings)]
+            self._doc_group = doc_group
+            self._group_keys = group_keys
+            self.loaded_at = datetime.now()
+            self.build_ms = (time.perf_counter() - t0) * 1000
+
+    def _prefix_range(self, token: str) -> Tuple[int, int]:
+        """접두어가 token 인 키 번호 범위 [lo, hi)"""
+        key = decompose(token)
+        lo = bisect_left(self._keys, key)
+        # 자모 문자열에서 key 로 시작하는 것들 바로 뒤
+        hi = bisect_left(self._keys, key + "\U0010ffff", lo)
+        return lo, hi
+
+    def _has_key_in(self, doc: int, lo: int, hi: int) -> bool:
+        ks = self._group_keys[self._doc_group[doc]]
+        i = bisect_left(ks, lo)
+        return i < len(ks) and ks[i] < hi
+
+    def _iter_docs(self, lo: int, hi: int) -> Iterator[int]:
+        """범위 안 posting 들을 칸 번호 순으로 병합 (중복 제거)"""
+        last = -1
+        for doc in heapq.merge(*self._postings[lo:hi]):
+            if doc != last:
+                yield doc
+                last = doc
+
+    def search(self, query: str, limit: int = 50, weekday: Optional[int] = None) -> List[SearchHit]:
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+
+        ranges = [self._prefix_range(t) for t in tokens]
+        if any(lo == hi for lo, hi in ranges):
+            return []
+        # 걸리는 칸이 가장 적은 토큰이 기준, 나머지는 칸마다 확인만
+        ranges.sort(key=lambda r: self._cum[r[1]] - self._cum[r[0]])
+        (lo, hi), rest = ranges[0], ranges[1:]
+
+        hits = self._hits
+        out: List[SearchHit] = []
+        for doc in self._iter_docs(lo, hi):
+            if weekday is not None and hits[doc].weekday != weekday:
+                continue
+            if all(self._has_key_in(doc, rlo, rhi) for rlo, rhi in rest):
+                out.append(hits[doc])
+                if len(out) >= limit:
+                    break
+        return out
+
+    def stats(self) -> dict:
+        return {
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            "hits": len(self._hits),
+            "keys": len(self._keys),
+            "build_ms": round(self.build_ms, 1),
+        }
+
+
+search_index = SearchIndex()
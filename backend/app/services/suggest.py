@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import heapq
+import threading
+from bisect import bisect_left
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
+
+from app.services.hangul import chosung, compact, decompose, is_chosung_query, tokenize
+
+
+class RoomEntry(NamedTuple):
+    id: int
+    building_id: Optional[int]
+    building: str
+    name: str
+    floor: Optional[int]
+    capacity: Optional[int]
+
+    @property
+    def display(self) -> str:
+        return f"{self.building} - {self.name}" if self.building else self.name
+
+    def to_json(self) -> dict:
+        return {
+            "id": self.id,
+            "building_id": self.building_id,
+            "building": self.building,
+            "name": self.name,
+            "display": self.display,
+            "floor": self.floor,
+            "capacity": self.capacity,
+        }
+
+
+# 키 종류 (작을수록 우선): 전체 이름 > 방 이름 > 단어 조각
+FULL, ROOM, PART = 0, 1, 2
+
+
+# ---------------------------------------------------------------
+# 강의실 이름 자동완성
+# ---------------------------------------------------------------
+class RoomSuggestIndex:
+    """
+    정규화된 강의실 이름 → 방. (키, 종류, 방 번호) 를 정렬한 리스트에서 bisect 로
+    접두어 범위를 찾는다. 같은 방을 여러 키로 넣어 두므로
+      "프라임관101", "101대", "대강의", "ㅍㄹㅇㄱ", "ㄷㄱㅇㅅ" 모두 "프라임관 - 101대강의실" 로 간다.
+    일반 입력은 자모 단위 키(치는 중인 받침 허용), 초성만 친 입력은 초성 키에서 찾는다.
+    """
+
+    def __init__(self):
+        self._rooms: List[RoomEntry] = []
+        self._jamo: List[Tuple[str, int, int]] = []      # (자모 키, 종류, 방 번호)
+        self._chosung: List[Tuple[str, int, int]] = []   # (초성 키, 종류, 방 번호)
+        self._lock = threading.Lock()
+        self.loaded_at: Optional[datetime] = None
+
+    async def load(self, conn) -> None:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT r.id, r.building_id, COALESCE(b.name, ''), r.name, r.floor, r.capacity
+                FROM room r
+                LEFT JOIN building b ON b.id = r.building_id
+                ORDER BY r.id
+                """
+            )
+            rows = await cur.fetchall()
+        self.build(rows)
+
+    reload = load
+
+    def build(self, rows) -> None:
+        rooms = [RoomEntry(*row) for row in rows]
+        jamo, initials = set(), set()
+
+        for no, room in enumerate(rooms):
+            keys = {(compact(room.building + room.name), FULL), (compact(room.name), ROOM)}
+            for token in tokenize(room.name):
+                keys.add((token, PART))
+            for key, kind in keys:
+                if key:
+                    jamo.add((decompose(key), kind, no))
+                    initials.add((chosung(key), kind, no))
+
+        with self._lock:
+            self._rooms = rooms
+            self._jamo = sorted(jamo)
+            self._chosung = sorted(initials)
+            self.loaded_at = datetime.now()
+
+    def suggest(self, query: str, k: int = 10, building_id: Optional[int] = None) -> List[RoomEntry]:
+        q = compact(query)
+        if not q:
+            return []
+
+        if is_chosung_query(q):
+            entries, key = self._chosung, q
+        else:
+            entries, key = self._jamo, decompose(q)
+
+        lo = bisect_left(entries, (key,))
+        hi = bisect_left(entries, (key + "\U0010ffff",), lo)
+
+        # 방마다 가장 좋은 키 종류만 남기고, 종류 → 이름 길이 → 이름 순으로 top-k
+        rooms = self._rooms
+        best = {}
+        for _key, kind, no in entries[lo:hi]:
+            if building_id is not None and rooms[no].building_id != building_id:
+                continue
+            if kind < best.get(no, PART + 1):
+                best[no] = kind
+
+        ranked = heapq.nsmallest(
+            k, best.items(),
+            key=lambda item: (item[1], len(rooms[item[0]].display), rooms[item[0]].display),
+        )
+        return [rooms[no] for no, _kind in ranked]
+
+    def stats(self) -> dict:
+        return {
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            "rooms": len(self._rooms),
+            "keys": len(self._jamo),
+        }
+
+
+room_suggest = RoomSuggestIndex()
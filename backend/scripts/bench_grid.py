@@ -0,0 +1,101 @@
+"""
+CSV 격자 → 행 변환 벤치: grid_to_rows(numpy) vs 예전 iterrows 루프 vs melt 경로.
+
+가상의 캠퍼스(건물 × 강의실, 방마다 교시 × 월~토 격자)를 메모리에 만들어
+CSV 읽기를 뺀 변환 시간만 잰다. 예전 두 경로는 비교/회귀 테스트용으로 여기에만 남겨 둔다.
+
+    cd backend
+    python -m scripts.bench_grid --rooms 2000 --periods 14
+"""
+import argparse
+import random
+import time
+from typing import List
+
+import pandas as pd
+
+from app.db.timetable_grid import (
+    DAY_COLUMNS, PERIOD_COLUMN, RECORD_COLUMNS, Row, day_map, grid_to_rows, records_to_rows,
+)
+
+COURSE = "(학부) 과목{n}\n{n:04d} / 01분반\n교수{n} / 30명"
+
+
+def iterrows_rows(df: pd.DataFrame) -> List[Row]:
+    """예전 import_csv.parse_csv_file 의 행 단위 루프 (교시 칸 빈 행 / 빈 셀 / "nan" 건너뜀)"""
+    rows: List[Row] = []
+    for _, row in df.iterrows():
+        if str(row["col_1"]).strip() == "" or str(row["col_1"]).lower() == "nan":
+            continue
+
+        period = int(row["col_1"])
+
+        for col_idx, weekday in day_map.items():
+            cell = row[f"col_{col_idx}"]
+            if str(cell).strip() in ("", "nan"):
+                continue
+
+            rows.append((period, weekday, str(cell)))
+    return rows
+
+
+def melt_rows(df: pd.DataFrame) -> List[Row]:
+    """한동안 쓰던 melt + 마스크 경로 (방마다 pandas 호출 비용이 커서 iterrows 보다 느렸다)"""
+    day_cols = [c for c in DAY_COLUMNS if c in df.columns]
+    period = pd.to_numeric(df[PERIOD_COLUMN], errors="coerce")
+    grid = df.loc[period.notna(), day_cols]
+    grid.insert(0, "period", period[period.notna()].astype(int))
+
+    long = grid.melt(id_vars="period", var_name="col", value_name="raw_text")
+    long = long[long["raw_text"].notna()]
+
+    text = long["raw_text"].astype(str)
+    keep = ~text.str.strip().isin(["", "nan"])
+    long = long.loc[keep].assign(
+        weekday=long.loc[keep, "col"].map(DAY_COLUMNS).astype(int),
+        raw_text=text[keep],
+    )
+    records = long.sort_values(["period", "weekday"], kind="stable")[RECORD_COLUMNS]
+    return records_to_rows(records)
+
+
+def make_room(periods: int, fill: float, rng: random.Random) -> pd.DataFrame:
+    """크롤러 CSV 와 같은 모양 (col_1=교시, col_2..col_7=월..토, 빈 칸은 NaN)"""
+    data = {"col_1": list(range(1, periods + 1))}
+    for col_idx in day_map:
+        data[f"col_{col_idx}"] = [
+            COURSE.format(n=rng.randrange(10000)) if rng.random() < fill else float("nan")
+            for _ in range(periods)
+        ]
+    return pd.DataFrame(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="grid_to_records vs iterrows")
+    parser.add_argument("--rooms", type=int, default=2000, help="강의실 수")
+    parser.add_argument("--periods", type=int, default=14, help="하루 교시 수")
+    parser.add_argument("--fill", type=float, default=0.4, help="수업이 찬 칸 비율")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    frames = [make_room(args.periods, args.fill, rng) for _ in range(args.rooms)]
+
+    paths = [("iterrows", iterrows_rows), ("melt", melt_rows), ("grid_to_rows", grid_to_rows)]
+    results, times = {}, {}
+    for name, fn in paths:
+        t0 = time.perf_counter()
+        results[name] = [fn(df) for df in frames]
+        times[name] = time.perf_counter() - t0
+
+    # 교시 순으로 만든 격자라 순서까지 같아야 한다
+    assert results["iterrows"] == results["melt"] == results["grid_to_rows"], "경로별 결과가 다름"
+
+    cells = sum(len(r) for r in results["grid_to_rows"])
+    print(f"rooms={args.rooms} periods={args.periods} fill={args.fill:.0%} → {cells}칸")
+    for name, _ in paths:
+        t = times[name]
+        print(f"  {name:14s} {t:7.2f}s  {args.rooms / t:8.0f} rooms/s  x{times['iterrows'] / t:.1f}")
+
+if __name__ == "__main__":
+    main()
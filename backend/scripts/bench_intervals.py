@@ -0,0 +1,98 @@
+"""
+구간 계산 마이크로벤치: 분(int) 기반 intervals vs 예전 time/strftime 기반 헬퍼.
+
+하루 타임라인 한 번 = (수업 + 예약) 병합 → 근무시간 안의 빈 구간 계산.
+예전 헬퍼는 비교용으로 여기에만 남겨 둔다 (main.py 에서 제거된 parse_hhmm / merge_blocks).
+
+    cd backend
+    python -m scripts.bench_intervals --blocks 12 -n 20000
+"""
+import argparse
+import random
+import timeit
+from datetime import time
+from typing import List, Tuple
+
+from app.services.intervals import Interval, gaps, merge, to_hhmm
+
+WORK_START, WORK_END = "09:00", "18:00"
+
+
+# ───────────── 예전 방식 (문자열 ↔ time 반복 변환) ─────────────
+def parse_hhmm(s) -> time:
+    if isinstance(s, time):
+        return s
+    hh, mm = str(s)[:5].split(":")
+    return time(int(hh), int(mm))
+
+
+def merge_blocks(blocks: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    parsed = sorted([(parse_hhmm(s), parse_hhmm(e)) for s, e in blocks], key=lambda x: x[0])
+    merged: List[Tuple[time, time]] = []
+    for s, e in parsed:
+        if not merged or s > merged[-1][1]:
+            merged.append((s, e))
+        else:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+    return [(a.strftime("%H:%M"), b.strftime("%H:%M")) for a, b in merged]
+
+
+def old_free(blocks: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    free = []
+    cursor = WORK_START
+    for s, e in merge_blocks(blocks):
+        if parse_hhmm(cursor) < parse_hhmm(s):
+            free.append((cursor, s))
+        cursor = e
+    if parse_hhmm(cursor) < parse_hhmm(WORK_END):
+        free.append((cursor, WORK_END))
+    return free
+
+
+# ───────────── 현재 방식 ─────────────
+def new_free(blocks: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    busy = merge(Interval.parse(s, e) for s, e in blocks)
+    return [(to_hhmm(g.start), to_hhmm(g.end)) for g in gaps(busy, 9 * 60, 18 * 60)]
+
+
+def new_free_minutes(blocks: List[Interval]) -> List[Interval]:
+    """API 경로처럼 DB 행을 한 번만 분으로 바꿔 둔 경우 (문자열 변환 없음)"""
+    return gaps(merge(blocks), 9 * 60, 18 * 60)
+
+
+def make_day(n: int, rng: random.Random) -> List[Tuple[str, str]]:
+    """09~18시 사이 30분 단위 블록 n 개 (겹침/맞닿음 섞임)"""
+    out = []
+    for _ in range(n):
+        s = rng.randrange(18, 35) * 30
+        e = min(s + rng.choice((30, 60, 90, 120)), 18 * 60)
+        out.append((f"{s // 60:02d}:{s % 60:02d}", f"{e // 60:02d}:{e % 60:02d}"))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="구간 계산 timeit 비교")
+    parser.add_argument("--blocks", type=int, default=12, help="하루 점유 블록 수")
+    parser.add_argument("-n", type=int, default=20000, help="반복 횟수")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    day = make_day(args.blocks, random.Random(args.seed))
+    assert old_free(day) == new_free(day), "두 방식 결과가 다름"
+    day_iv = [Interval.parse(s, e) for s, e in day]
+
+    cases = [
+        ("time/strftime (old)", lambda: old_free(day)),
+        ("minutes, HH:MM in/out", lambda: new_free(day)),
+        ("minutes only", lambda: new_free_minutes(day_iv)),
+    ]
+    base = None
+    print(f"blocks={args.blocks} n={args.n}")
+    for name, fn in cases:
+        best = min(timeit.repeat(fn, number=args.n, repeat=5)) / args.n * 1e6
+        base = base or best
+        print(f"  {name:24s} {best:7.2f} µs/day  x{base / best:.1f}")
+
+
+if __name__ == "__main__":
+    main()
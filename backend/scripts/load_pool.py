@@ -0,0 +1,129 @@
+"""
+비동기 엔드포인트 부하 테스트: 커넥션 풀(DB_POOL_MAX) 보다 많은 동시 요청을 일정 시간 보내고
+엔드포인트별 지연시간(p50/p95/p99) 과 503(PoolTimeout → "database busy") 개수를 출력한다.
+(실행 중인 API 서버 + DB 대상, 조회만 한다)
+
+    cd backend
+    uv run python -m scripts.load_pool --concurrency 40 --duration 20
+
+응답 캐시에 걸리지 않도록 날짜/시간대를 요청마다 바꾼다 (--cached 면 고정).
+"""
+import argparse
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.db.db_config import DB_POOL_MAX, DB_POOL_TIMEOUT
+
+ENDPOINTS = ("free-now", "free-between", "timeline", "batch")
+
+
+def make_request(kind: str, base: str, room_ids, rng: random.Random, cached: bool):
+    """(method, url, params, json) — 날짜는 앞으로 1년 안에서 고른다"""
+    day = date.today() + timedelta(days=0 if cached else rng.randrange(365))
+    if kind == "free-now":
+        return "GET", f"{base}/rooms/free-now", None, None
+    if kind == "free-between":
+        hour = 9 if cached else rng.randrange(9, 17)
+        params = {"date": day.isoformat(), "start": f"{hour:02d}:00", "end": f"{hour + 1:02d}:00"}
+        return "GET", f"{base}/rooms/free-between", params, None
+    if kind == "timeline":
+        room_id = room_ids[0] if cached else rng.choice(room_ids)
+        return "GET", f"{base}/rooms/{room_id}/timeline", {"date": day.isoformat()}, None
+    body = {
+        "room_ids": room_ids[:20] if cached else rng.sample(room_ids, min(20, len(room_ids))),
+        "start_date": day.isoformat(),
+        "end_date": (day + timedelta(days=6)).isoformat(),
+    }
+    return "POST", f"{base}/timelines:batch", None, body
+
+
+def percentile(sorted_values, p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="커넥션 풀 포화 부하 테스트")
+    parser.add_argument("--base", default="http://localhost:8000", help="API 서버 주소")
+    parser.add_argument("--concurrency", type=int, default=DB_POOL_MAX * 4,
+                        help=f"동시 요청 수 (기본 DB_POOL_MAX×4 = {DB_POOL_MAX * 4})")
+    parser.add_argument("--duration", type=float, default=20.0, help="측정 시간(초)")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help=f"쉼표 구분 ({', '.join(ENDPOINTS)})")
+    parser.add_argument("--cached", action="store_true", help="같은 요청 반복 (응답 캐시 포함 측정)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    kinds = [k.strip() for k in args.endpoints.split(",") if k.strip()]
+    unknown = set(kinds) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"모르는 엔드포인트: {', '.join(sorted(unknown))}")
+
+    rooms = requests.get(f"{args.base}/rooms", timeout=10)
+    rooms.raise_for_status()
+    room_ids = [r["id"] for r in rooms.json()]
+    if not room_ids:
+        raise SystemExit("❌ 강의실이 없습니다. CSV 를 먼저 적재하세요.")
+
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=args.concurrency))
+
+    lock = threading.Lock()
+    latencies = defaultdict(list)   # kind → [초]
+    statuses = defaultdict(Counter)  # kind → {status: 개수}
+    deadline = time.perf_counter() + args.duration
+
+    def worker(i: int):
+        rng = random.Random(args.seed * 1000 + i)
+        while time.perf_counter() < deadline:
+            kind = kinds[rng.randrange(len(kinds))]
+            method, url, params, body = make_request(kind, args.base, room_ids, rng, args.cached)
+            t0 = time.perf_counter()
+            try:
+                status = session.request(method, url, params=params, json=body, timeout=30).status_code
+            except requests.RequestException as e:
+                status = type(e).__name__
+            elapsed = time.perf_counter() - t0
+            with lock:
+                latencies[kind].append(elapsed)
+                statuses[kind][status] += 1
+
+    print(f"동시 {args.concurrency} (DB_POOL_MAX={DB_POOL_MAX}, 대기 한도 {DB_POOL_TIMEOUT:.0f}s), "
+          f"{args.duration:.0f}s, 방 {len(room_ids)}개{', 캐시 포함' if args.cached else ''}")
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(worker, range(args.concurrency)))
+    elapsed = time.perf_counter() - t0
+
+    total = total_503 = 0
+    print(f"  {'endpoint':14s} {'n':>6s} {'rps':>7s} {'p50':>7s} {'p95':>7s} {'p99':>7s} {'503':>5s}  기타")
+    for kind in kinds:
+        lat = sorted(latencies[kind])
+        codes = statuses[kind]
+        n, n503 = len(lat), codes.get(503, 0)
+        total += n
+        total_503 += n503
+        other = {k: v for k, v in codes.items() if k not in (200, 503)}
+        print(
+            f"  {kind:14s} {n:6d} {n / elapsed:7.1f} "
+            f"{percentile(lat, 0.50) * 1000:6.0f}ms {percentile(lat, 0.95) * 1000:6.0f}ms "
+            f"{percentile(lat, 0.99) * 1000:6.0f}ms {n503:5d}  {other or ''}"
+        )
+    print(f"  {'TOTAL':14s} {total:6d} {total / elapsed:7.1f} rps, 503 {total_503}건 ({total_503 / max(total, 1):.1%})")
+
+    # 서버 쪽 풀 통계 (요청 대기/타임아웃 누적)
+    try:
+        print("  db_pool:", requests.get(f"{args.base}/healthz", timeout=10).json().get("db_pool"))
+    except requests.RequestException:
+        pass
+
+
+if __name__ == "__main__":
+    main()
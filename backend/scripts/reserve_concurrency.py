@@ -0,0 +1,82 @@
+"""
+같은 강의실/시간대에 예약 요청을 동시에 N 개 보내 정확히 1 개만 성공하는지 확인.
+(실행 중인 API 서버 + DB 대상. 성공한 예약 1 건은 DB 에 남는다)
+
+    cd backend
+    uv run python -m scripts.reserve_concurrency --room_id 1 --date 2030-01-07 --start 19:00 --end 20:00 -n 200
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def reserve(session: requests.Session, url: str, body: dict):
+    t0 = time.perf_counter()
+    try:
+        r = session.post(url, json=body, timeout=30)
+        error = r.json().get("detail", {}).get("error") if r.status_code == 409 else None
+        return r.status_code, error, time.perf_counter() - t0
+    except Exception as e:
+        return None, str(e), time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 예약 경쟁 테스트")
+    parser.add_argument("--base", default="http://localhost:8000", help="API 서버 주소")
+    parser.add_argument("--room_id", type=int, required=True)
+    parser.add_argument("--date", required=True, help="YYYY-MM-DD (비어 있는 날짜로)")
+    parser.add_argument("--start", default="19:00")
+    parser.add_argument("--end", default="20:00")
+    parser.add_argument("-n", type=int, default=200, help="동시 요청 수")
+    args = parser.parse_args()
+
+    # 이미 예약/수업이 있는 시간대면 전부 409 라 의미가 없으니 먼저 확인
+    timeline = requests.get(f"{args.base}/rooms/{args.room_id}/timeline", params={"date": args.date}, timeout=10)
+    timeline.raise_for_status()
+    busy = [
+        b for b in timeline.json().get("blocks", [])
+        if b["status"] == "occupied" and b["start"] < args.end and args.start < b["end"]
+    ]
+    if busy:
+        sys.exit(f"❌ {args.date} {args.start}-{args.end} 가 이미 차 있습니다: {busy}. 다른 시간대를 고르세요.")
+
+    url = f"{args.base}/rooms/reserve"
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_maxsize=args.n))
+    bodies = [
+        {"room_id": args.room_id, "date": args.date, "start": args.start, "end": args.end, "user": f"race-{i}"}
+        for i in range(args.n)
+    ]
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.n) as pool:
+        results = list(pool.map(lambda b: reserve(session, url, b), bodies))
+    elapsed = time.perf_counter() - t0
+
+    codes = Counter((status, error) for status, error, _ in results)
+    latencies = sorted(lat for _, _, lat in results)
+    print(f"요청 {args.n}개, {elapsed:.2f}s")
+    for (status, error), count in codes.most_common():
+        print(f"  {status} {error or ''}: {count}")
+    print(f"  p50={latencies[len(latencies) // 2] * 1000:.0f}ms p99={latencies[int(len(latencies) * 0.99) - 1] * 1000:.0f}ms")
+
+    # 503(풀 포화) / 409 conflict_retry 는 "예약 안 됨" 이라 정합성엔 문제 없음 → 따로 세기만 한다
+    ok = codes.get((200, None), 0)
+    other_2xx = sum(c for (status, _), c in codes.items() if status and 200 <= status < 300 and status != 200)
+    conflicts = codes.get((409, "conflict_with_reservation"), 0)
+    retries = codes.get((409, "conflict_retry"), 0)
+    busy = sum(c for (status, _), c in codes.items() if status == 503)
+    print(f"  성공 {ok} / 충돌 {conflicts} / conflict_retry {retries} / 503 {busy} / 기타 {args.n - ok - conflicts - retries - busy}")
+
+    assert ok == 1, f"성공 {ok}건 (정확히 1건이어야 함)"
+    assert other_2xx == 0, f"200 외 2xx 응답: {dict(codes)}"
+    print("✅ 정확히 1건만 예약됨")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,10 @@ import os
 import re
 import time
 import argparse
-from typing import List, Tuple, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
 
 from dotenv import load_dotenv
 import pandas as pd
@@ -21,7 +24,10 @@ from selenium.common.exceptions import (
     TimeoutException, StaleElementReferenceException, NoSuchElementException
 )
 
+from .http_fetch import FetchConfig, SessionExpired, TimetableFetcher, session_from_cookies, split_targets
+from .readiness import ready
 from .site_selectors import LoginSelectors, RoomSearchSelectors, TableSelectors
+from .table_extract import cells_from_element, cells_from_html, expand_spans, grid_to_df
 
 WAIT = 10  # 기본 대기(초)
 
@@ -41,14 +47,81 @@ def switch_to_default(driver):
         pass
 
 from collections import deque
+
+class FramePathCache:
+    """
+    (드라이버 세션, by, value) → 마지막으로 요소를 찾은 프레임 경로(각 단계의 frame 인덱스).
+    같은 페이지를 반복 조회할 때 BFS 대신 경로를 그대로 다시 밟아 본다.
+    병렬 모드에서 여러 드라이버가 같이 쓰므로 세션별로 키를 나누고 락으로 보호.
+    """
+    def __init__(self):
+        self._paths = {}
+        self._lock = threading.Lock()
+        self.hits = 0       # 캐시 경로로 바로 찾음
+        self.misses = 0     # 캐시에 없어 BFS
+        self.stale = 0      # 캐시 경로가 더 이상 맞지 않아 BFS
+
+    @staticmethod
+    def _key(driver, by, value):
+        return (getattr(driver, "session_id", id(driver)), by, value)
+
+    def get(self, driver, by, value):
+        with self._lock:
+            return self._paths.get(self._key(driver, by, value))
+
+    def put(self, driver, by, value, path):
+        with self._lock:
+            self._paths[self._key(driver, by, value)] = tuple(path)
+
+    def drop(self, driver, by, value):
+        with self._lock:
+            self._paths.pop(self._key(driver, by, value), None)
+
+    def count(self, field):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def stats(self) -> str:
+        total = self.hits + self.misses + self.stale
+        rate = self.hits / total * 100 if total else 0.0
+        return f"hits={self.hits} misses={self.misses} stale={self.stale} (hit {rate:.0f}%)"
+
+frame_cache = FramePathCache()
+
+def switch_into_path(driver, path) -> bool:
+    """top 부터 frame 인덱스 경로를 따라 들어감. 중간에 frame 이 없으면 False"""
+    switch_to_default(driver)
+    for idx in path:
+        frames = driver.find_elements(By.CSS_SELECTOR, "iframe, frame")
+        if idx >= len(frames):
+            return False
+        driver.switch_to.frame(frames[idx])
+    return True
+
 def list_and_switch_into_frame_containing(driver, by, value, max_depth=6, per_level_limit=20, timeout=0.5) -> bool:
     """
     모든 iframe/frame을 BFS로 순회하여 (by,value) 요소가 존재하는 프레임으로 전환.
     찾으면 True, 아니면 False.
+    이전에 찾은 경로가 frame_cache 에 있으면 그 경로부터 확인하고, 안 맞을 때만 BFS.
     """
+    cached = frame_cache.get(driver, by, value)
+    if cached is not None:
+        try:
+            if switch_into_path(driver, cached):
+                WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, value)))
+                frame_cache.count("hits")
+                return True
+        except Exception:
+            pass
+        frame_cache.count("stale")
+        frame_cache.drop(driver, by, value)
+    else:
+        frame_cache.count("misses")
+
     switch_to_default(driver)
     try:
         WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, value)))
+        frame_cache.put(driver, by, value, [])
         return True
     except Exception:
         pass
@@ -57,15 +130,7 @@ def list_and_switch_into_frame_containing(driver, by, value, max_depth=6, per_le
     queue = deque([[]])
     while queue:
         path = queue.popleft()
-        switch_to_default(driver)
-        ok = True
-        for idx in path:
-            frames = driver.find_elements(By.CSS_SELECTOR, "iframe, frame")
-            if idx >= len(frames):
-                ok = False
-                break
-            driver.switch_to.frame(frames[idx])
-        if not ok:
+        if not switch_into_path(driver, path):
             continue
 
         key = tuple(path)
@@ -75,6 +140,7 @@ def list_and_switch_into_frame_containing(driver, by, value, max_depth=6, per_le
 
         try:
             WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, value)))
+            frame_cache.put(driver, by, value, path)
             return True
         except Exception:
             pass
@@ -174,18 +240,17 @@ def open_room_timetable_direct(driver, timetable_url: str, rs: RoomSearchSelecto
     입력칸 탐지되면 성공.
     """
     def landed():
-        try:
-            WebDriverWait(driver, 1.5).until(EC.presence_of_element_located((By.XPATH, rs.room_keyword_input_xpath)))
+        # 최상위 문서에 입력칸이 붙는 순간 반환 (고정 sleep 대신). 없으면 프레임 안에서 찾기
+        if ready.wait_for(driver, rs.room_keyword_input_xpath, "present", label="goto.landed", timeout=1.5)["ok"]:
             return True
-        except Exception:
-            return list_and_switch_into_frame_containing(driver, By.XPATH, rs.room_keyword_input_xpath, max_depth=8)
+        return list_and_switch_into_frame_containing(driver, By.XPATH, rs.room_keyword_input_xpath, max_depth=8)
 
     if not timetable_url:
         raise SystemExit("TIMETABLE_URL이 비었습니다.")
 
     switch_to_default(driver)
     try:
-        driver.get(timetable_url); time.sleep(0.5)
+        driver.get(timetable_url)
         if landed(): ensure_still_logged_in(driver); return
     except Exception:
         pass
@@ -193,7 +258,6 @@ def open_room_timetable_direct(driver, timetable_url: str, rs: RoomSearchSelecto
     try:
         switch_to_default(driver)
         driver.execute_script("window.top.location.assign(arguments[0]);", timetable_url)
-        time.sleep(0.7)
         if landed(): ensure_still_logged_in(driver); return
     except Exception:
         pass
@@ -201,7 +265,7 @@ def open_room_timetable_direct(driver, timetable_url: str, rs: RoomSearchSelecto
     try:
         switch_to_default(driver)
         driver.execute_script("window.open(arguments[0], '_blank');", timetable_url)
-        time.sleep(0.7)
+        WebDriverWait(driver, WAIT).until(lambda d: len(d.window_handles) > 1)
         driver.switch_to.window(driver.window_handles[-1])
         switch_to_default(driver)
         if landed(): ensure_still_logged_in(driver); return
@@ -281,18 +345,22 @@ def trigger_room_search(driver, rs: RoomSearchSelectors, room_keyword: str):
         type_keyword()
         click_find()
 
-        # 유효 옵션 로드 대기 (플레이스홀더 제외)
+        # 유효 옵션 로드 대기 (플레이스홀더 제외): 확인 → 목록이 바뀔 때까지 대기 → 확인 … (시도당 최대 3초)
         loaded = False
-        start = time.time()
-        while time.time() - start < 3.0:  # 시도당 최대 3초
+        deadline = time.monotonic() + 3.0
+        while True:
             try:
-                opts, _, _ = collect_room_options(driver, rs)
+                opts, _, _ = collect_room_options(driver, rs, timeout=0)
                 if opts:
                     loaded = True
                     break
             except SystemExit:
                 pass
-            time.sleep(0.25)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ready.wait_for(driver, rs.room_select_xpath, "changed", label="search.options",
+                           timeout=remaining, baseline=ready.signature(driver, rs.room_select_xpath))
 
         if loaded:
             # 콤보박스가 접혀 있으면 살짝 포커싱
@@ -318,15 +386,18 @@ def trigger_room_search(driver, rs: RoomSearchSelectors, room_keyword: str):
         pass
     raise SystemExit("강의실찾기 후 유효 옵션이 3회 재시도에도 로드되지 않았습니다.")
 
-def collect_room_options(driver, rs: RoomSearchSelectors) -> Tuple[List[str], Optional[Select], Optional[object]]:
+def collect_room_options(driver, rs: RoomSearchSelectors,
+                         timeout: float = 8.0) -> Tuple[List[str], Optional[Select], Optional[object]]:
     """
     결과 목록 수집.
     - <select>인 경우: (텍스트리스트, Select, None)
     - 커스텀 드롭다운인 경우: (텍스트리스트, None, listbox_el)
+    timeout: 단계(select / 커스텀 목록)별 최대 대기. 예전 32 x 0.25초 폴링과 같은 8초
     """
     # 1) select
     sel_el = None; options_text = []
-    for _ in range(32):
+    deadline = time.monotonic() + timeout
+    while True:
         sel_el = find_select_in_any_frame(driver, rs.room_select_xpath, max_depth=8)
         if sel_el is not None:
             try:
@@ -337,11 +408,21 @@ def collect_room_options(driver, rs: RoomSearchSelectors) -> Tuple[List[str], Op
                     return options_text, sel, None
             except StaleElementReferenceException:
                 pass
-        time.sleep(0.25)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if sel_el is not None:
+            # select 는 있는데 비어 있음 → option 이 바뀔 때까지 (find_select 가 해당 프레임으로 들어가 있음)
+            before = ready.signature(driver, rs.room_select_xpath)
+            ready.wait_for(driver, rs.room_select_xpath, "changed", label="options.select",
+                           timeout=remaining, baseline=before)
+        else:
+            ready.nap(driver, "options.select_lookup")
 
     # 2) custom dropdown
     listbox = None
-    for _ in range(32):
+    deadline = time.monotonic() + timeout
+    while True:
         for xp in [
             '//*[@role="listbox"]',
             '//ul[contains(@class,"select") or contains(@class,"listbox") or contains(@class,"dropdown")]',
@@ -352,9 +433,9 @@ def collect_room_options(driver, rs: RoomSearchSelectors) -> Tuple[List[str], Op
                 break
             except Exception:
                 continue
-        if listbox is not None:
+        if listbox is not None or time.monotonic() >= deadline:
             break
-        time.sleep(0.25)
+        ready.nap(driver, "options.listbox_lookup")
     if listbox is None:
         raise SystemExit("강의실 목록 UI를 찾지 못했습니다.")
 
@@ -393,29 +474,40 @@ def select_room_option(driver, wanted_text: str, sel: Optional[Select], listbox)
         js_focus_scroll_click(driver, target)
 
 # ───────────────────────── 테이블 대기/파싱 ─────────────────────────
-def wait_timetable(driver, ts: TableSelectors):
+def wait_timetable(driver, ts: TableSelectors, before: Optional[str] = None):
+    """
+    시간표 표가 준비될 때까지 대기 (최대 ready.timeout).
+    before: 방을 고르기 전 표 내용 서명(ready.signature). 주면 표가 다시 그려지는 순간을 기다린다
+            (이전 방 표가 남아 있으면 내용이 있어도 아직 준비된 게 아님). 내용이 이전 방과 같아도
+            표 안에 DOM 변화가 있으면 준비로 보고, ready.grace 동안 변화가 없으면 내용 유무로 판정.
+    """
     table = WebDriverWait(driver, 10).until(
         EC.presence_of_element_located((By.XPATH, ts.weekly_table_xpath))
     )
-    for _ in range(20):
-        rows = table.find_elements(By.XPATH, ts.row_xpath)
-        if len(rows) >= 1:
-            non_empty = any((cell.text or "").strip()
-                            for r in rows for cell in r.find_elements(By.XPATH, ts.cell_xpath))
-            if non_empty: return table
-        time.sleep(0.25)
+    cells = f"{ts.row_css} {ts.cell_css}"
+    if before is not None:
+        ready.wait_for(driver, ts.weekly_table_xpath, "refreshed", label="timetable.refreshed",
+                       baseline=before, cell_css=cells)
+    else:
+        ready.wait_for(driver, ts.weekly_table_xpath, "has_text", label="timetable.content", cell_css=cells)
+    try:
+        table.tag_name  # 갱신 중 교체됐으면 다시 잡기
+    except StaleElementReferenceException:
+        table = driver.find_element(By.XPATH, ts.weekly_table_xpath)
     return table
 
 def parse_weekly_table_to_df(table, ts: TableSelectors) -> pd.DataFrame:
-    rows = table.find_elements(By.XPATH, ts.row_xpath)
-    data: List[List[str]] = []
-    for r in rows:
-        cells = [(cell.text or "").strip() for cell in r.find_elements(By.XPATH, ts.cell_xpath)]
-        if cells:
-            data.append(cells)
-    maxw = max((len(x) for x in data), default=0)
-    data = [row + [""] * (maxw - len(row)) for row in data]
-    return pd.DataFrame(data, columns=[f"col_{i+1}" for i in range(maxw)])
+    """
+    셀 전체를 execute_script 한 번으로 받아 rowspan/colspan 을 펼친 뒤 DataFrame 으로.
+    스크립트가 실패하면 outerHTML 한 번을 받아 BeautifulSoup 으로 같은 처리.
+    """
+    try:
+        raw = cells_from_element(table.parent, table, ts.row_css, ts.cell_css)
+    except StaleElementReferenceException:
+        raise  # 표가 통째로 바뀜 → outerHTML 도 못 읽으므로 호출자가 다시 기다리게
+    except Exception:
+        raw = cells_from_html(table.get_attribute("outerHTML") or "", ts.row_css, ts.cell_css)
+    return grid_to_df(expand_spans(raw))
 
 # ───────────────────────── 전체/단일 스크랩 ─────────────────────────
 def scrape_all_rooms(driver,
@@ -426,7 +518,13 @@ def scrape_all_rooms(driver,
                      out_dir: str,
                      combined_path: Optional[str],
                      include_regex: Optional[str] = None,
-                     room_keyword: Optional[str] = None) -> Tuple[List[str], pd.DataFrame]:
+                     room_keyword: Optional[str] = None,
+                     seen: Optional[set] = None,
+                     tag: str = "") -> Tuple[List[str], pd.DataFrame]:
+    """
+    seen: 저장까지 끝난 옵션 텍스트 집합. 넘기면 호출자와 공유(병렬 모드에서 실패한 방 추적용)
+    tag : 로그 앞에 붙일 표시 (예: "[w2] ")
+    """
 
     os.makedirs(out_dir or ".", exist_ok=True)
     combined_rows: List[pd.DataFrame] = []
@@ -435,7 +533,8 @@ def scrape_all_rooms(driver,
 
     # 초기 필터링
     options_text = [t for t in options_text if t and not is_placeholder(t)]
-    seen = set()
+    if seen is None:
+        seen = set()
 
     for idx, display in enumerate(options_text, 1):
         txt = display.strip()
@@ -460,7 +559,8 @@ def scrape_all_rooms(driver,
         if not target:
             print(f"[skip] '{txt}' 현재 목록에 없음. 현재={cur_options[:6]}..."); continue
 
-        # 선택
+        # 선택 (고르기 전 표 내용을 기억해 두고, 바뀌는 순간을 기다린다)
+        before = ready.signature(driver, TableSelectors().weekly_table_xpath)
         try:
             select_room_option(driver, target, cur_sel, cur_listbox)
         except SystemExit as e:
@@ -484,7 +584,7 @@ def scrape_all_rooms(driver,
 
         # 표 로딩/파싱
         try:
-            table = wait_timetable(driver, TableSelectors())
+            table = wait_timetable(driver, TableSelectors(), before=before)
             df = parse_weekly_table_to_df(table, TableSelectors())
             df.insert(0, "room", target)
             fname = sanitize_filename(target) + ".csv"
@@ -493,9 +593,9 @@ def scrape_all_rooms(driver,
             saved_files.append(path)
             combined_rows.append(df)
             seen.add(txt)
-            print(f"[{idx:02d}/{len(options_text)}] saved: {path} (rows={len(df)})")
+            print(f"{tag}[{idx:02d}/{len(options_text)}] saved: {path} (rows={len(df)})")
         except Exception as e:
-            print(f"[warn] 파싱 실패: {target} ({e})")
+            print(f"{tag}[warn] 파싱 실패: {target} ({e})")
             continue
 
     combined_df = pd.concat(combined_rows, ignore_index=True) if combined_rows else pd.DataFrame()
@@ -504,6 +604,278 @@ def scrape_all_rooms(driver,
         combined_df.to_csv(combined_path, index=False, encoding="utf-8-sig")
     return saved_files, combined_df
 
+# ───────────────────────── 병렬 스크랩 (--workers N) ─────────────────────────
+@lru_cache(maxsize=1)
+def chromedriver_path() -> str:
+    # 워커들이 동시에 설치/다운로드하지 않도록 한 번만
+    return ChromeDriverManager().install()
+
+def make_driver(headless: bool):
+    options = webdriver.ChromeOptions()
+    options.add_argument("--window-size=1400,1000")
+    if headless: options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu"); options.add_argument("--no-sandbox"); options.add_argument("--disable-dev-shm-usage")
+    return webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+
+# CDP Network.setCookies 가 받는 필드만 남김
+COOKIE_KEYS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+def export_cookies(driver) -> List[dict]:
+    """
+    로그인된 세션의 쿠키 전체. SSO 로 여러 도메인에 걸쳐 있으므로
+    현재 도메인만 주는 get_cookies() 대신 CDP 로 브라우저 전체 쿠키를 읽는다.
+    """
+    try:
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+    except Exception:
+        cookies = driver.get_cookies()
+    out = []
+    for raw in cookies:
+        c = {k: raw[k] for k in COOKIE_KEYS if k in raw}
+        expires = raw.get("expires", raw.get("expiry"))  # get_cookies() 는 expiry
+        if expires and expires > 0 and not raw.get("session"):
+            c["expires"] = expires
+        else:
+            c.pop("expires", None)  # 세션 쿠키
+        out.append(c)
+    return out
+
+def import_cookies(driver, cookies: List[dict], base_url: str):
+    """다른 드라이버에서 내보낸 쿠키를 주입 (도메인별 선방문 없이 CDP 로 한 번에)"""
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        return
+    except Exception:
+        pass
+    # CDP 를 못 쓰면 base_url 도메인 쿠키라도 add_cookie 로
+    driver.get(base_url)
+    for c in cookies:
+        try:
+            driver.add_cookie({k: v for k, v in c.items() if k != "expires"})
+        except Exception:
+            continue
+
+def partition_options(options_text: List[str], n: int) -> List[List[str]]:
+    """라운드로빈 분할 → 같은 입력이면 항상 같은 분배 (건물별로 몰리지 않게)"""
+    return [options_text[i::n] for i in range(n)]
+
+def crawl_worker(worker_no: int,
+                 cookies: List[dict],
+                 targets: List[str],
+                 args,
+                 seen: set) -> Tuple[List[str], pd.DataFrame]:
+    """
+    새 headless 드라이버에 로그인 쿠키를 심고 targets 만 스크랩.
+    쿠키로 진입이 안 되면 이 워커만 직접 로그인 1회 재시도. 예외는 호출자가 워커 단위로 처리.
+    """
+    tag = f"[w{worker_no}] "
+    rs = RoomSearchSelectors()
+    driver = make_driver(headless=True)
+    try:
+        import_cookies(driver, cookies, args.base_url)
+        try:
+            open_room_timetable_direct(driver, args.timetable_url, rs)
+        except SystemExit as e:
+            print(f"{tag}쿠키 세션으로 진입 실패({e}) → 직접 로그인")
+            login(driver, args.base_url, os.getenv("PORTAL_ID"), os.getenv("PORTAL_PW"), LoginSelectors())
+            open_room_timetable_direct(driver, args.timetable_url, rs)
+
+        trigger_room_search(driver, rs, args.room_kw)
+        _opts, sel, listbox = collect_room_options(driver, rs)
+        print(f"{tag}시작: {len(targets)}개")
+        return scrape_all_rooms(
+            driver, rs, targets, sel, listbox,
+            out_dir=args.out_dir, combined_path=None,
+            include_regex=args.include_regex, room_keyword=args.room_kw,
+            seen=seen, tag=tag,
+        )
+    finally:
+        driver.quit()
+
+def concat_in_order(frames: List[pd.DataFrame], options_text: List[str]) -> pd.DataFrame:
+    """방별 DataFrame 을 수집 완료 순서와 무관하게 원래 옵션 순서로 합침"""
+    order = {t: i for i, t in enumerate(options_text)}
+    combined_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if not combined_df.empty:
+        # 부분 일치로 선택된 방은 원래 옵션 순서를 못 찾으므로 맨 뒤 (이름순). 방 안의 행 순서는 유지
+        combined_df = (
+            combined_df.assign(_order=combined_df["room"].map(lambda r: order.get(r, len(order))))
+            .sort_values(["_order", "room"], kind="stable")
+            .drop(columns="_order")
+            .reset_index(drop=True)
+        )
+    return combined_df
+
+def scrape_all_rooms_parallel(driver, options_text: List[str], args) -> Tuple[List[str], pd.DataFrame]:
+    """
+    driver(로그인 완료) 의 쿠키를 N 개 드라이버에 나눠 주고 옵션을 분할해 동시에 스크랩.
+    한 워커가 죽어도 나머지는 계속 진행하고, 끝내지 못한 방은 driver 로 순차 재시도한다.
+    통합 CSV 는 워커 완료 순서와 무관하게 원래 옵션 순서로 합친다.
+    """
+    pattern = re.compile(args.include_regex) if args.include_regex else None
+    options_text = list(dict.fromkeys(
+        t.strip() for t in options_text
+        if t and not is_placeholder(t) and (not pattern or pattern.search(t))
+    ))
+    if not options_text:
+        return [], pd.DataFrame()
+
+    n = max(1, min(args.workers, len(options_text)))
+    cookies = export_cookies(driver)
+    parts = partition_options(options_text, n)
+    seen_by_worker: Dict[int, set] = {i: set() for i in range(n)}
+
+    results: Dict[int, Tuple[List[str], pd.DataFrame]] = {}
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = {
+            pool.submit(crawl_worker, i + 1, cookies, parts[i], args, seen_by_worker[i]): i
+            for i in range(n)
+        }
+        for fut, i in futures.items():
+            try:
+                results[i] = fut.result()
+            except (Exception, SystemExit) as e:  # 워커 단위 격리 (SystemExit 포함)
+                print(f"[w{i + 1}] 실패: {e}")
+
+    done = set().union(*seen_by_worker.values())
+    saved_files = [f for i in sorted(results) for f in results[i][0]]
+    frames = [results[i][1] for i in sorted(results) if not results[i][1].empty]
+
+    # 실패/누락분은 로그인된 원래 드라이버로 순차 재시도
+    leftover = [t for t in options_text if t not in done]
+    if leftover:
+        print(f"[*] 미완료 {len(leftover)}개 순차 재시도: {leftover[:5]}...")
+        try:
+            rs = RoomSearchSelectors()
+            open_room_timetable_direct(driver, args.timetable_url, rs)
+            trigger_room_search(driver, rs, args.room_kw)
+            _opts, sel, listbox = collect_room_options(driver, rs)
+            files, df = scrape_all_rooms(
+                driver, rs, leftover, sel, listbox,
+                out_dir=args.out_dir, combined_path=None,
+                include_regex=args.include_regex, room_keyword=args.room_kw,
+                seen=done, tag="[retry] ",
+            )
+            saved_files += files
+            if not df.empty:
+                frames.append(df)
+        except (Exception, SystemExit) as e:
+            print(f"[retry] 실패: {e}")
+
+    combined_df = concat_in_order(frames, options_text)
+    if args.combined_csv:
+        os.makedirs(os.path.dirname(args.combined_csv) or ".", exist_ok=True)
+        combined_df.to_csv(args.combined_csv, index=False, encoding="utf-8-sig")
+
+    file_order = {sanitize_filename(t) + ".csv": i for i, t in enumerate(options_text)}
+    saved_files.sort(key=lambda p: (file_order.get(os.path.basename(p), len(file_order)), p))
+    failed = [t for t in leftover if t not in done]
+    if failed:
+        print(f"[warn] 최종 실패 {len(failed)}개: {failed}")
+    return saved_files, combined_df
+
+# ───────────────────────── HTTP 직접 수집 (--fetcher http) ─────────────────────────
+OPTION_VALUES_JS = "return arguments[0].map(o => [(o.text || '').trim(), o.value || '']);"
+
+def option_values(driver, sel: Optional[Select]) -> Dict[str, str]:
+    """select 표시명 → option value (WebDriver 왕복 1회). 커스텀 목록이면 빈 dict"""
+    if sel is None:
+        return {}
+    try:
+        return {t: v for t, v in driver.execute_script(OPTION_VALUES_JS, sel.options) if t}
+    except Exception:
+        return {}
+
+def scrape_all_rooms_http(driver, options_text: List[str], sel: Optional[Select],
+                          args) -> Tuple[List[str], pd.DataFrame]:
+    """
+    driver(로그인 완료) 쿠키로 requests 세션을 만들어 방마다 시간표를 HTTP 로 직접 받는다.
+    동시 요청 수는 --workers. 세션이 끊기거나 실패한 방은 driver 로 화면 수집 (순차) 한다.
+    """
+    if not args.fetch_url:
+        raise SystemExit("--fetcher http 에는 --fetch_url (TIMETABLE_FETCH_URL) 필요.")
+    pattern = re.compile(args.include_regex) if args.include_regex else None
+    options_text = list(dict.fromkeys(
+        t.strip() for t in options_text
+        if t and not is_placeholder(t) and (not pattern or pattern.search(t))
+    ))
+    if not options_text:
+        return [], pd.DataFrame()
+
+    values = option_values(driver, sel)
+    cfg = FetchConfig(url=args.fetch_url, data=args.fetch_data, table_css=args.fetch_table,
+                      workers=max(1, args.workers))
+    if not cfg.per_room:
+        raise SystemExit("--fetch_url/--fetch_data 에 {value} 또는 {text} 자리표시가 없습니다(모든 방이 같은 요청).")
+    try: user_agent = driver.execute_script("return navigator.userAgent;")
+    except Exception: user_agent = None
+    session = session_from_cookies(export_cookies(driver), user_agent=user_agent,
+                                   referer=args.timetable_url, pool=cfg.workers)
+
+    # {value} 를 쓰는데 option 값을 모르는 방(커스텀 목록 등)은 HTTP 로 보내지 않고 화면 수집으로
+    targets, skipped = split_targets(cfg, options_text, values)
+    results: Dict[str, object] = dict(skipped)
+
+    os.makedirs(args.out_dir or ".", exist_ok=True)
+    t0 = time.perf_counter()
+    try:
+        results.update(TimetableFetcher(session, cfg).fetch_many(targets))
+    finally:
+        session.close()
+    print(f"[http] {len(targets)}개 요청 {time.perf_counter() - t0:.1f}s (동시 {cfg.workers})"
+          + (f", option 값 없음 {len(options_text) - len(targets)}개" if len(targets) < len(options_text) else ""))
+
+    saved_files: List[str] = []
+    frames: List[pd.DataFrame] = []
+    seen: set = set()
+    for idx, txt in enumerate(options_text, 1):
+        res = results.get(txt)
+        if not isinstance(res, pd.DataFrame):
+            print(f"[http] 실패: {txt} ({res})")
+            continue
+        df = res.copy()
+        df.insert(0, "room", txt)
+        path = os.path.join(args.out_dir, sanitize_filename(txt) + ".csv")
+        df.to_csv(path, index=False, encoding="utf-8-sig")
+        saved_files.append(path)
+        frames.append(df)
+        seen.add(txt)
+        print(f"[http][{idx:02d}/{len(options_text)}] saved: {path} (rows={len(df)})")
+
+    # 실패분은 화면 수집으로 (세션 만료면 쿠키가 죽은 것이니 로그인부터)
+    leftover = [t for t in options_text if t not in seen]
+    if leftover:
+        if any(isinstance(results.get(t), SessionExpired) for t in leftover):
+            print("[http] 세션 만료 응답 → 재로그인 후 화면 수집")
+            login(driver, args.base_url, os.getenv("PORTAL_ID"), os.getenv("PORTAL_PW"), LoginSelectors())
+        print(f"[*] HTTP 미완료 {len(leftover)}개 화면 수집: {leftover[:5]}...")
+        try:
+            rs = RoomSearchSelectors()
+            open_room_timetable_direct(driver, args.timetable_url, rs)
+            trigger_room_search(driver, rs, args.room_kw)
+            _opts, sel, listbox = collect_room_options(driver, rs)
+            files, df = scrape_all_rooms(
+                driver, rs, leftover, sel, listbox,
+                out_dir=args.out_dir, combined_path=None,
+                include_regex=args.include_regex, room_keyword=args.room_kw,
+                seen=seen, tag="[ui] ",
+            )
+            saved_files += files
+            if not df.empty:
+                frames.append(df)
+        except (Exception, SystemExit) as e:
+            print(f"[ui] 실패: {e}")
+
+    combined_df = concat_in_order(frames, options_text)
+    if args.combined_csv:
+        os.makedirs(os.path.dirname(args.combined_csv) or ".", exist_ok=True)
+        combined_df.to_csv(args.combined_csv, index=False, encoding="utf-8-sig")
+
+    failed = [t for t in leftover if t not in seen]
+    if failed:
+        print(f"[warn] 최종 실패 {len(failed)}개: {failed}")
+    return saved_files, combined_df
+
 # ───────────────────────── CLI ─────────────────────────
 def cli():
     load_dotenv()
@@ -516,6 +888,18 @@ def cli():
     parser.add_argument("--out_dir", default="./output/rooms", help="(all) 개별 CSV 폴더")
     parser.add_argument("--combined_csv", default="./output/rooms_combined.csv", help="(all) 통합 CSV 경로")
     parser.add_argument("--include_regex", default=None, help="(all) 옵션 텍스트 필터 정규식")
+    parser.add_argument("--workers", type=int, default=1, help="(all) 동시 브라우저 수 (로그인은 1회, 쿠키 공유)")
+    parser.add_argument("--fetcher", choices=["ui", "http"], default="ui",
+                        help="(all) ui=화면에서 방 선택, http=로그인 쿠키로 시간표 요청 직접 전송")
+    parser.add_argument("--fetch_url", default=os.getenv("TIMETABLE_FETCH_URL"),
+                        help="(http) 시간표 요청 URL, {value}/{text} 자리표시 (TIMETABLE_FETCH_URL)")
+    parser.add_argument("--fetch_data", default=os.getenv("TIMETABLE_FETCH_DATA"),
+                        help="(http) 있으면 POST form, 예: 'roomCd={value}' (TIMETABLE_FETCH_DATA)")
+    parser.add_argument("--fetch_table", default=os.getenv("TIMETABLE_FETCH_TABLE"),
+                        help="(http) 응답 안 시간표 table CSS, 없으면 첫 table (TIMETABLE_FETCH_TABLE)")
+    parser.add_argument("--ready_timeout", type=float, default=ready.timeout, help="페이지 준비 대기 최대 초 (READY_TIMEOUT)")
+    parser.add_argument("--wait_mode", choices=["event", "poll"], default=ready.wait_mode,
+                        help="event=DOM 변화 감지, poll=예전 0.25초 폴링 (비교용, WAIT_MODE)")
 
     parser.add_argument("--base_url", default=os.getenv("BASE_URL"), help="로그인 페이지 URL")
     parser.add_argument("--timetable_url", default=os.getenv("TIMETABLE_URL"), help="강의실 시간표 URL")
@@ -523,6 +907,7 @@ def cli():
     parser.add_argument("--no-headless", dest="headless", action="store_false", help="브라우저 표시")
     parser.set_defaults(headless=(os.getenv("HEADLESS", "true").lower() in ("1", "true", "y", "on")))
     args = parser.parse_args()
+    ready.timeout, ready.wait_mode = args.ready_timeout, args.wait_mode
 
     if not args.base_url:
         raise SystemExit("BASE_URL이 비었습니다(.env 확인).")
@@ -533,12 +918,7 @@ def cli():
     if args.mode == "single" and not args.room_select:
         raise SystemExit("--mode single에서는 --room_select 필요.")
 
-    options = webdriver.ChromeOptions()
-    options.add_argument("--window-size=1400,1000")
-    if args.headless: options.add_argument("--headless=new")
-    options.add_argument("--disable-gpu"); options.add_argument("--no-sandbox"); options.add_argument("--disable-dev-shm-usage")
-
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    driver = make_driver(args.headless)
 
     try:
         print("[*] 로그인...")
@@ -578,15 +958,23 @@ def cli():
             print(f"[✅] 완료: {args.out_csv}")
 
         else:
-            print(f"[*] 전체 스크랩 시작 (옵션 {len(options_text)}개). include_regex={args.include_regex or '(없음)'}")
-            saved_files, combined_df = scrape_all_rooms(
-                driver, RoomSearchSelectors(), options_text, sel, listbox,
-                out_dir=args.out_dir, combined_path=args.combined_csv,
-                include_regex=args.include_regex, room_keyword=args.room_kw
-            )
+            print(f"[*] 전체 스크랩 시작 (옵션 {len(options_text)}개, fetcher={args.fetcher}, workers={args.workers}). include_regex={args.include_regex or '(없음)'}")
+            if args.fetcher == "http":
+                saved_files, combined_df = scrape_all_rooms_http(driver, options_text, sel, args)
+            elif args.workers > 1:
+                saved_files, combined_df = scrape_all_rooms_parallel(driver, options_text, args)
+            else:
+                saved_files, combined_df = scrape_all_rooms(
+                    driver, RoomSearchSelectors(), options_text, sel, listbox,
+                    out_dir=args.out_dir, combined_path=args.combined_csv,
+                    include_regex=args.include_regex, room_keyword=args.room_kw
+                )
             print(f"[✅] 개별 {len(saved_files)}건 저장 → {args.out_dir}")
             print(f"[✅] 통합 CSV 저장 → {args.combined_csv} (행 {len(combined_df)}개)")
 
+        print(f"[frame-cache] {frame_cache.stats()}")
+        print(ready.report())
+
     except Exception as e:
         print("[❌] 에러:", e)
         ts = int(time.time())
@@ -0,0 +1,173 @@
+# smartcampus_crawler/http_fetch.py
+"""
+시간표 HTTP 직접 수집 (--fetcher http).
+
+화면에서 방을 하나씩 고르는 대신, 로그인한 브라우저의 쿠키를 requests.Session 에 옮겨
+시간표 페이지가 실제로 부르는 요청을 직접 보낸다. 응답 HTML 은 table_extract 로 파싱.
+
+엔드포인트는 사이트마다 다르므로 설정으로 받는다 (브라우저 개발자도구 Network 탭에서 확인).
+  TIMETABLE_FETCH_URL  : 요청 URL. {value}(select option 값) / {text}(표시명) 자리표시 사용 가능
+                         (그 외 중괄호는 글자 그대로 보낸다)
+  TIMETABLE_FETCH_DATA : 있으면 POST form. "roomCd={value}&gubun=1" 처럼 쓴다
+  TIMETABLE_FETCH_TABLE: 응답에서 시간표 <table> CSS (없으면 첫 번째 table)
+
+세션 하나를 스레드들이 같이 쓰고, 커넥션 풀 크기 = 동시 요청 수라서 keep-alive 로 재사용된다.
+"""
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, quote
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from .site_selectors import LoginSelectors, TableSelectors
+from .table_extract import table_html_to_df
+
+
+class SessionExpired(Exception):
+    """응답이 로그인 폼 → 쿠키 세션이 끊김 (UI 수집으로 넘겨야 함)"""
+
+
+@dataclass
+class FetchConfig:
+    url: str
+    data: Optional[str] = None
+    table_css: Optional[str] = None
+    workers: int = 4
+    timeout: float = 10.0
+    table: TableSelectors = field(default_factory=TableSelectors)
+
+    @property
+    def needs_value(self) -> bool:
+        """요청이 option 값({value})으로 방을 구분하는지. 값 없이 보내면 모든 방이 같은 응답을 받는다"""
+        return "{value}" in self.url or "{value}" in (self.data or "")
+
+    @property
+    def per_room(self) -> bool:
+        """자리표시가 하나도 없으면 모든 방이 같은 요청이 된다"""
+        return self.needs_value or "{text}" in self.url or "{text}" in (self.data or "")
+
+
+# ───────────────────────── 세션 ─────────────────────────
+def session_from_cookies(cookies: List[dict],
+                         user_agent: Optional[str] = None,
+                         referer: Optional[str] = None,
+                         pool: int = 4) -> requests.Session:
+    """
+    export_cookies() 결과 → requests.Session.
+    도메인/경로를 그대로 옮겨 SSO 로 여러 도메인에 걸친 쿠키도 맞는 곳에만 붙게 한다.
+    """
+    s = requests.Session()
+    for c in cookies:
+        s.cookies.set(
+            c["name"], c["value"],
+            domain=c.get("domain", ""), path=c.get("path", "/"),
+            secure=bool(c.get("secure")), expires=c.get("expires"),
+        )
+    if user_agent:
+        s.headers["User-Agent"] = user_agent  # 서버가 UA 로 세션을 묶는 경우 대비
+    if referer:
+        s.headers["Referer"] = referer
+    adapter = HTTPAdapter(pool_connections=pool, pool_maxsize=pool, max_retries=1)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+# ───────────────────────── 요청/파싱 ─────────────────────────
+_PLACEHOLDER = re.compile(r"\{(value|text)\}")
+
+
+def fill(template: str, value: str, text: str) -> str:
+    """
+    {value} / {text} 만 한 번에 치환. str.format 과 달리 다른 중괄호({0}, JSON 등)는 그대로 두고,
+    치환된 값 안의 "{text}" 같은 글자를 다시 치환하지도 않는다.
+    """
+    repl = {"value": value, "text": text}
+    return _PLACEHOLDER.sub(lambda m: repl[m.group(1)], template)
+
+
+def split_targets(cfg: FetchConfig, options_text: List[str],
+                  values: Dict[str, str]) -> Tuple[List[Tuple[str, str]], Dict[str, Exception]]:
+    """
+    표시명 목록 → (HTTP 로 보낼 (표시명, option 값), 보내지 않을 표시명 → 사유).
+    {value} 를 쓰는데 option 값을 모르는 방(커스텀 목록 등)은 빈 {value} 로 보내지 않는다.
+    """
+    targets: List[Tuple[str, str]] = []
+    skipped: Dict[str, Exception] = {}
+    for t in options_text:
+        if cfg.needs_value and not values.get(t):
+            skipped[t] = ValueError("option 값 없음 → 화면 수집")
+        else:
+            targets.append((t, values.get(t, "")))
+    return targets, skipped
+
+
+def build_request(cfg: FetchConfig, value: str, text: str) -> Tuple[str, str, Optional[List[Tuple[str, str]]]]:
+    """
+    (method, url, form) — URL 자리표시는 인코딩, form 값은 requests 가 인코딩.
+    모든 방이 같은 요청이 되는 경우(자리표시 없음 / 빈 {value})는 보내지 않고 ValueError.
+    """
+    if not cfg.per_room:
+        raise ValueError("URL/form 에 {value} 또는 {text} 자리표시가 없음 (모든 방이 같은 요청)")
+    if cfg.needs_value and not value:
+        raise ValueError(f"option 값 없음: {text!r} (빈 {{value}} 로는 보내지 않음)")
+    url = fill(cfg.url, quote(value or "", safe=""), quote(text or "", safe=""))
+    if not cfg.data:
+        return "GET", url, None
+    form = [(k, fill(v, value or "", text or ""))
+            for k, v in parse_qsl(cfg.data, keep_blank_values=True)]
+    return "POST", url, form
+
+
+def extract_table_html(html: str, table_css: Optional[str]) -> Optional[str]:
+    """응답에서 시간표 table 만. 로그인 폼이 오면 SessionExpired"""
+    soup = BeautifulSoup(html, "html.parser")
+    if soup.select_one(LoginSelectors().id_input):
+        raise SessionExpired("로그인 페이지 응답")
+    table = soup.select_one(table_css) if table_css else soup.find("table")
+    return str(table) if table is not None else None
+
+
+class TimetableFetcher:
+    def __init__(self, session: requests.Session, cfg: FetchConfig):
+        self.session = session
+        self.cfg = cfg
+
+    def fetch_html(self, value: str, text: str) -> str:
+        method, url, form = build_request(self.cfg, value, text)
+        r = self.session.request(method, url, data=form, timeout=self.cfg.timeout)
+        if r.status_code in (401, 403):
+            raise SessionExpired(f"HTTP {r.status_code}")
+        r.raise_for_status()
+        if not r.encoding or r.encoding.lower() == "iso-8859-1":
+            r.encoding = r.apparent_encoding  # 헤더에 charset 없는 EUC-KR 페이지 대비
+        return r.text
+
+    def fetch_df(self, value: str, text: str) -> pd.DataFrame:
+        table_html = extract_table_html(self.fetch_html(value, text), self.cfg.table_css)
+        if table_html is None:
+            raise ValueError("응답에 시간표 table 없음")
+        df = table_html_to_df(table_html, self.cfg.table.row_css, self.cfg.table.cell_css)
+        if df.empty:
+            raise ValueError("시간표 table 이 비어 있음")
+        return df
+
+    def fetch_many(self, targets: List[Tuple[str, str]]) -> Dict[str, Union[pd.DataFrame, Exception]]:
+        """
+        targets: (표시명, option 값). 최대 cfg.workers 개씩 동시에.
+        결과는 표시명 → DataFrame 또는 실패 예외 (방 단위 격리, 호출자가 재시도 여부 결정)
+        """
+        def one(target):
+            text, value = target
+            try:
+                return text, self.fetch_df(value, text)
+            except Exception as e:
+                return text, e
+
+        with ThreadPoolExecutor(max_workers=max(1, self.cfg.workers)) as pool:
+            return dict(pool.map(one, targets))
@@ -0,0 +1,240 @@
+# smartcampus_crawler/readiness.py
+"""
+페이지 준비 대기 (이벤트 방식).
+
+time.sleep(0.25) 로 조건을 반복 확인하는 대신, 현재 문서(프레임)에 MutationObserver 를 걸고
+execute_async_script 로 "조건이 참이 되는 순간" 또는 timeout 까지 기다린다.
+DOM 이 바뀔 때만 조건을 다시 보므로 준비되자마자 돌아오고, 폴링 간격만큼 늦지 않는다.
+
+mode
+  present  : xpath 요소가 있음
+  has_text : select 면 글자 있는 option 이 있음, 그 외엔 (cell_css 셀 중) 내용 있는 것이 있음
+  changed  : 요소 내용 서명(signature)이 baseline 과 달라짐
+  refreshed: changed 이거나, 대기 시작 후 요소 안에서 DOM 변화가 있었음 (내용이 같은 표로 다시 그려져도 잡힘).
+             grace 초 동안 둘 다 없으면 has_text 로 판정 (방 전환 후 표 갱신)
+  mutation : 아무 DOM 변화 (짧은 낮잠 대용: 변화가 오거나 timeout 이면 깸)
+
+wait_mode="poll" 이면 같은 조건을 예전처럼 interval 마다 확인한다 (비교 측정용).
+모든 대기는 label 별로 기록되어 report() 로 이벤트 방식 vs 폴링 추정 시간을 출력한다.
+"""
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+
+# 공통 조건 함수: (xpath, mode, baseline, cellCss) 로 check() / sig() 를 만든다
+# touched / origin / graceOver 는 WAIT_JS 의 observer / grace 타이머가 채운다
+_PREDICATE_JS = r"""
+const find = () => xpath ? document.evaluate(
+    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue : document.body;
+const sig = el => !el ? null
+    : (el.options ? Array.from(el.options, o => o.text).join('\u0001') : (el.innerText || ''));
+const hasText = el => {
+    if (el.options) return Array.from(el.options).some(o => (o.text || '').trim());
+    const cells = cellCss ? el.querySelectorAll(cellCss) : [el];
+    return Array.from(cells).some(c => (c.innerText || '').trim().length > 0);
+};
+let touched = false, origin = null, graceOver = false;
+const check = () => {
+    if (mode === 'mutation') return false;
+    const el = find();
+    if (!el) return false;
+    if (mode === 'present') return true;
+    if (mode === 'changed') return sig(el) !== baseline;
+    if (mode === 'refreshed') {
+        if (touched || (origin && el !== origin) || sig(el) !== baseline) return true;
+        return graceOver && hasText(el);
+    }
+    return hasText(el);
+};
+"""
+
+# arguments: xpath, mode, baseline, cellCss, timeoutMs, quietMs, graceMs, callback
+WAIT_JS = r"""
+const [xpath, mode, baseline, cellCss, timeoutMs, quietMs, graceMs, done] = arguments;
+""" + _PREDICATE_JS + r"""
+const t0 = performance.now();
+let finished = false, quietTimer = null, timer = null, graceTimer = null, observer = null;
+origin = find();
+const finish = ok => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer); clearTimeout(quietTimer); clearTimeout(graceTimer);
+    done({ok: ok, ms: performance.now() - t0, signature: sig(find())});
+};
+// 조건이 참이 된 뒤 quietMs 동안 추가 변화가 없을 때 완료 (목록이 여러 번에 나눠 채워지는 경우)
+const settle = () => {
+    clearTimeout(quietTimer);
+    if (quietMs > 0) quietTimer = setTimeout(() => finish(check()), quietMs);
+    else finish(true);
+};
+if (check()) { settle(); if (finished) return; }
+observer = new MutationObserver(records => {
+    if (mode === 'mutation') return finish(true);
+    if (origin && records.some(r => origin.contains(r.target))) touched = true;
+    if (check()) settle();
+});
+observer.observe(document.documentElement || document,
+                 {childList: true, subtree: true, characterData: true, attributes: true});
+if (mode === 'refreshed') graceTimer = setTimeout(() => { graceOver = true; if (check()) settle(); }, graceMs);
+timer = setTimeout(() => finish(check()), timeoutMs);
+"""
+
+# arguments: xpath, mode, baseline, cellCss → {ok, signature}
+# 폴링은 DOM 변화를 못 보므로 refreshed 는 예전처럼 changed || has_text
+CHECK_JS = r"""
+const [xpath, mode, baseline, cellCss] = arguments;
+""" + _PREDICATE_JS + r"""
+graceOver = true;
+return {ok: check(), signature: sig(find())};
+"""
+
+SIGNATURE_JS = r"""
+const [xpath] = arguments;
+const el = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+return !el ? null : (el.options ? Array.from(el.options, o => o.text).join('\u0001') : (el.innerText || ''));
+"""
+
+
+@dataclass
+class WaitStat:
+    count: int = 0
+    timeouts: int = 0
+    waited_ms: float = 0.0          # 실제로 기다린 시간
+    poll_est_ms: float = 0.0        # 같은 대기를 interval 폴링으로 했을 때 추정 (간격 단위 올림)
+
+
+@dataclass
+class Readiness:
+    wait_mode: str = field(default_factory=lambda: os.getenv("WAIT_MODE", "event"))   # event | poll
+    timeout: float = field(default_factory=lambda: float(os.getenv("READY_TIMEOUT", "5")))
+    poll_interval: float = 0.25
+    quiet_ms: int = 100
+    grace: float = 1.0              # refreshed: 변화가 없을 때 has_text 로 넘어가기까지
+    stats: Dict[str, WaitStat] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    # ─────────── 기록 ───────────
+    def _record(self, label: str, ok: bool, ms: float, poll_ms: Optional[float] = None):
+        """poll_ms: 예전 방식이었다면 걸렸을 시간. 없으면 ms 를 폴링 간격 단위로 올림 (poll 모드는 실측 그대로)"""
+        if poll_ms is None:
+            interval_ms = self.poll_interval * 1000
+            poll_ms = ms if self.wait_mode == "poll" else math.ceil(ms / interval_ms) * interval_ms
+        with self._lock:
+            st = self.stats.setdefault(label, WaitStat())
+            st.count += 1
+            st.timeouts += 0 if ok else 1
+            st.waited_ms += ms
+            st.poll_est_ms += poll_ms
+
+    # ─────────── 대기 ───────────
+    def wait_for(self, driver, xpath: Optional[str], mode: str = "present", *,
+                 label: str, timeout: Optional[float] = None,
+                 baseline: Optional[str] = None, cell_css: Optional[str] = None,
+                 quiet_ms: Optional[int] = None) -> dict:
+        """
+        현재 프레임에서 조건이 참이 될 때까지 대기. {ok, ms, signature} 반환 (예외 없음).
+        문서가 대기 중에 교체(페이지 이동)되면 새 문서에서 남은 시간만큼 한 번 더 기다린다.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        quiet = self.quiet_ms if quiet_ms is None else quiet_ms
+        t0 = time.perf_counter()
+        result = {"ok": False, "signature": None}
+
+        if self.wait_mode == "poll":
+            result = self._poll(driver, xpath, mode, baseline, cell_css, timeout)
+        else:
+            result = self._wait_async(driver, xpath, mode, baseline, cell_css, timeout, quiet, self.grace)
+
+        ms = (time.perf_counter() - t0) * 1000
+        ok = bool(result.get("ok"))
+        self._record(label, ok, ms)
+        return {"ok": ok, "ms": ms, "signature": result.get("signature")}
+
+    def _wait_async(self, driver, xpath, mode, baseline, cell_css, timeout, quiet, grace=0.0) -> dict:
+        t0 = time.perf_counter()
+        result = {"ok": False, "signature": None}
+        # 드라이버 script timeout 은 다른 execute_async_script 에도 쓰이므로 끝나면 되돌린다
+        try: prev_timeout = driver.timeouts.script
+        except Exception: prev_timeout = None
+        try:
+            for _ in range(2):
+                remaining = timeout - (time.perf_counter() - t0)
+                if remaining <= 0:
+                    break
+                try:
+                    driver.set_script_timeout(remaining + 2)
+                    return driver.execute_async_script(
+                        WAIT_JS, xpath, mode, baseline, cell_css,
+                        int(remaining * 1000), quiet, int(grace * 1000),
+                    ) or result
+                except (JavascriptException, TimeoutException):
+                    continue  # 대기 중 문서 교체 → 새 문서에서 재시도
+                except WebDriverException:
+                    break
+            return result
+        finally:
+            if prev_timeout is not None:
+                try: driver.set_script_timeout(prev_timeout)
+                except WebDriverException: pass
+
+    def _poll(self, driver, xpath, mode, baseline, cell_css, timeout) -> dict:
+        """예전 방식: interval 마다 조건 확인 (wait_mode=poll 비교용)"""
+        deadline = time.perf_counter() + timeout
+        result = {"ok": False, "signature": None}
+        while True:
+            try:
+                result = driver.execute_script(CHECK_JS, xpath, mode, baseline, cell_css) or result
+            except WebDriverException:
+                pass
+            if result.get("ok") or time.perf_counter() >= deadline:
+                return result
+            time.sleep(self.poll_interval)
+
+    def nap(self, driver, label: str, seconds: Optional[float] = None):
+        """
+        고정 sleep 대체: DOM 변화가 생기면 바로, 없으면 seconds 후에 깬다.
+        '다시 확인해 볼 만한 일이 생겼나' 만 기다리는 용도.
+        """
+        seconds = self.poll_interval if seconds is None else seconds
+        t0 = time.perf_counter()
+        if self.wait_mode == "poll":
+            time.sleep(seconds)
+        else:
+            self._wait_async(driver, None, "mutation", None, None, seconds, 0)
+        # 예전 고정 sleep 은 변화가 있어도 seconds 를 다 잤다
+        self._record(label, True, (time.perf_counter() - t0) * 1000, poll_ms=seconds * 1000)
+
+    def signature(self, driver, xpath: str) -> Optional[str]:
+        """changed 모드 baseline 용 현재 내용 서명"""
+        try:
+            return driver.execute_script(SIGNATURE_JS, xpath)
+        except WebDriverException:
+            return None
+
+    # ─────────── 리포트 ───────────
+    def report(self) -> str:
+        with self._lock:
+            items = sorted(self.stats.items())
+        if not items:
+            return "[ready] 기록 없음"
+        lines = [f"[ready] mode={self.wait_mode} timeout={self.timeout:.1f}s interval={self.poll_interval:.2f}s"]
+        total_w = total_p = 0.0
+        for label, st in items:
+            total_w += st.waited_ms
+            total_p += st.poll_est_ms
+            lines.append(
+                f"  {label:28s} n={st.count:4d} timeout={st.timeouts:3d} "
+                f"waited={st.waited_ms / 1000:7.2f}s poll_est={st.poll_est_ms / 1000:7.2f}s"
+            )
+        lines.append(f"  {'TOTAL':28s} waited={total_w / 1000:.2f}s poll_est={total_p / 1000:.2f}s")
+        return "\n".join(lines)
+
+
+# 크롤러 전체가 공유 (CLI 에서 wait_mode / timeout 설정)
+ready = Readiness()
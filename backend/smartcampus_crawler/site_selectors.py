@@ -39,5 +39,6 @@ class TableSelectors:
         '(//h3|//h4)[contains(normalize-space(),"주간") and contains(.,"시간표")]/following::table[1]'
         ' | //table[contains(@summary,"시간표") or contains(@id,"timetable")]'
     )
-    row_xpath: str = './/tbody/tr'
-    cell_xpath: str = './/td'
+    # 표 안의 행/셀 (CSS: execute_script 의 querySelectorAll 과 BeautifulSoup 이 같이 씀)
+    row_css: str = 'tbody tr'
+    cell_css: str = 'td'
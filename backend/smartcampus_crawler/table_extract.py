@@ -0,0 +1,109 @@
+# smartcampus_crawler/table_extract.py
+"""
+주간 시간표 <table> → 2차원 문자열 격자.
+
+- 브라우저: execute_script 한 번으로 모든 셀의 (텍스트, rowspan, colspan) 을 받아온다.
+  (행마다 find_elements, 셀마다 .text 를 부르면 셀 수만큼 WebDriver 왕복이 생김)
+- 오프라인/HTTP: outerHTML 이나 응답 HTML 을 BeautifulSoup 으로 같은 형태로 읽는다.
+rowspan/colspan 펼치기는 두 경로가 같은 expand_spans() 를 쓴다.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+# (텍스트, rowspan, colspan)
+RawCell = Tuple[str, int, int]
+
+# arguments: table, row_css, cell_css → [[[text, rowspan, colspan], ...], ...]
+TABLE_CELLS_JS = r"""
+const [table, rowSel, cellSel] = arguments;
+return Array.from(table.querySelectorAll(rowSel), tr =>
+    Array.from(tr.querySelectorAll(cellSel), td => [td.innerText || '', td.rowSpan || 1, td.colSpan || 1])
+);
+"""
+
+
+def clean_text(text: Optional[str]) -> str:
+    """셀 텍스트: 줄마다 앞뒤 공백 제거, 빈 줄 제거 (innerText / get_text 차이 흡수)"""
+    return "\n".join(line.strip() for line in (text or "").splitlines() if line.strip())
+
+
+def expand_spans(rows: Sequence[Sequence[RawCell]]) -> List[List[str]]:
+    """
+    rowspan/colspan 을 펼쳐 칸마다 텍스트를 채운다.
+    위 행에서 내려온 칸(rowspan)은 같은 텍스트로 채우므로, 두 교시짜리 수업도 교시마다 한 칸씩 남는다.
+    펼친 뒤 빈 행은 버린다.
+    """
+    grid: List[List[str]] = []
+    pending: dict = {}  # 열 → (남은 행 수, 텍스트)
+
+    for cells in rows:
+        out: List[str] = []
+        carried: dict = {}
+        col = 0
+
+        def fill():
+            nonlocal col
+            while pending.get(col, (0, ""))[0] > 0:
+                left, text = pending[col]
+                out.append(text)
+                carried[col] = (left - 1, text)
+                col += 1
+
+        for text, rowspan, colspan in cells:
+            fill()
+            text = clean_text(text)
+            for _ in range(max(1, int(colspan or 1))):
+                out.append(text)
+                carried[col] = (max(1, int(rowspan or 1)) - 1, text)
+                col += 1
+        fill()
+
+        pending = carried
+        if out:
+            grid.append(out)
+    return grid
+
+
+def grid_to_df(grid: List[List[str]]) -> pd.DataFrame:
+    """짧은 행은 "" 로 채워 col_1..col_N 열의 DataFrame 으로"""
+    maxw = max((len(x) for x in grid), default=0)
+    data = [row + [""] * (maxw - len(row)) for row in grid]
+    return pd.DataFrame(data, columns=[f"col_{i+1}" for i in range(maxw)])
+
+
+# ───────────────────────── 경로별 셀 수집 ─────────────────────────
+def cells_from_element(driver, table, row_css: str, cell_css: str) -> List[List[RawCell]]:
+    """Selenium WebElement 테이블 → RawCell 행 목록 (WebDriver 왕복 1회)"""
+    return driver.execute_script(TABLE_CELLS_JS, table, row_css, cell_css) or []
+
+
+def cells_from_html(html: str, row_css: str, cell_css: str) -> List[List[RawCell]]:
+    """
+    테이블 HTML(outerHTML 또는 페이지 전체) → RawCell 행 목록.
+    페이지 전체가 오면 첫 번째 <table> 기준. <br> 은 줄바꿈으로 본다.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup if soup.name == "table" else (soup.find("table") or soup)
+    for br in table.find_all("br"):
+        br.replace_with("\n")
+
+    def span(el, attr):
+        try:
+            return int(el.get(attr) or 1)
+        except ValueError:
+            return 1
+
+    rows = table.select(row_css)
+    if not rows and row_css.startswith("tbody"):
+        # 브라우저는 <tbody> 를 자동으로 넣지만 원본 HTML 에는 없을 수 있음
+        rows = table.select(row_css[len("tbody"):].strip() or "tr")
+    return [
+        [(td.get_text(), span(td, "rowspan"), span(td, "colspan")) for td in tr.select(cell_css)]
+        for tr in rows
+    ]
+
+
+def table_html_to_df(html: str, row_css: str = "tbody tr", cell_css: str = "td") -> pd.DataFrame:
+    return grid_to_df(expand_spans(cells_from_html(html, row_css, cell_css)))
@@ -0,0 +1,92 @@
+"""
+API 테스트용 가짜 DB (Postgres 없이 TestClient 로 app.main 을 돌린다).
+
+커서가 execute 할 때마다 metrics 요청 카운터에 기록하므로 (운영의 InstrumentedAsyncCursor 와 같은 경로)
+미들웨어가 보는 요청당 쿼리 수를 그대로 검사할 수 있다.
+"""
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable, List, Tuple
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.services import metrics
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    async def execute(self, sql, params=None):
+        if self.conn.delay:
+            await asyncio.sleep(self.conn.delay)
+        metrics._record_query(self.conn.delay)
+        self.rows = self.conn.handler(sql, params)
+        return self
+
+    async def fetchall(self):
+        return self.rows
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    async def close(self):
+        pass
+
+    def __aiter__(self):
+        async def rows():
+            for row in self.rows:
+                yield row
+        return rows()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+class FakeConn:
+    """handler(sql, params) → 결과 행 리스트. delay 초만큼 쿼리마다 실제로 기다린다 (이벤트 루프 양보)"""
+
+    def __init__(self, handler: Callable, delay: float = 0.0):
+        self.handler = handler
+        self.delay = delay
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+
+@contextmanager
+def api_client(handler: Callable, delay: float = 0.0):
+    """
+    가짜 커넥션을 물린 TestClient 와, 미들웨어가 기록한 (route, status, stats.queries) 목록.
+    시작 시 인덱스 적재(시간표/검색/자동완성) 쿼리도 handler 를 거치므로 모르는 SQL 은 [] 를 돌려주면 된다.
+    """
+    conn = FakeConn(handler, delay)
+
+    @asynccontextmanager
+    async def fake_connection():
+        yield conn
+
+    async def noop():
+        pass
+
+    seen: List[Tuple[str, int, int]] = []
+    observe = metrics.observe_request
+
+    def capture(method, route, status, elapsed, stats):
+        seen.append((route, status, stats.queries))
+        observe(method, route, status, elapsed, stats)
+
+    with mock.patch.object(main, "async_connection", fake_connection), \
+            mock.patch.object(main, "open_async_pool", noop), \
+            mock.patch.object(main, "close_async_pool", noop), \
+            mock.patch.object(metrics, "observe_request", capture), \
+            mock.patch.object(main.response_cache, "clear", main.response_cache.clear):
+        main.response_cache.clear()
+        with TestClient(main.app) as client:
+            yield client, seen
@@ -0,0 +1,51 @@
+"""
+/rooms/free-now 이 방 개수와 상관없이 같은 수의 쿼리만 쓰는지 (N+1 회귀 방지).
+
+DB 없이 돌린다 (tests/fakes.py): 가짜 커서가 metrics 요청 카운터에 기록하므로
+미들웨어가 보는 stats.queries 를 그대로 검사한다.
+
+    cd backend
+    python -m unittest tests.test_free_now_queries
+"""
+import unittest
+from datetime import time
+
+from tests.fakes import api_client
+
+
+def campus(n_rooms: int):
+    """방 n 개, 방마다 오늘 예약 하나 (길이 0 이라 언제 돌려도 지금과 안 겹침 → 전부 빈 방)"""
+    rooms = [(rid, 1, f"R{rid}", 1, 30) for rid in range(1, n_rooms + 1)]
+    reservations = [(rid, time(0, 0), time(0, 0), "u") for rid in range(1, n_rooms + 1)]
+
+    def handler(sql, params):
+        if "FROM reservation" in sql:
+            return reservations
+        if sql.startswith("SELECT id, building_id, name, floor, capacity FROM room"):
+            return rooms
+        return []   # 시작 시 인덱스 적재 (시간표/검색/자동완성) 는 빈 캠퍼스로
+
+    return handler
+
+
+class FreeNowQueryCountTest(unittest.TestCase):
+    def queries_for(self, n_rooms: int, params=None):
+        with api_client(campus(n_rooms)) as (client, seen):
+            r = client.get("/rooms/free-now", params=params or {})
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()["count"], n_rooms)
+        counts = [q for route, _status, q in seen if route == "/rooms/free-now"]
+        self.assertEqual(len(counts), 1)
+        return counts[0]
+
+    def test_constant_query_count(self):
+        counts = {n: self.queries_for(n) for n in (1, 50, 500)}
+        self.assertEqual(len(set(counts.values())), 1, counts)
+        self.assertEqual(counts[1], 2)   # 방 목록 + 오늘 예약
+
+    def test_filters_do_not_add_queries(self):
+        self.assertEqual(self.queries_for(20, {"building_id": 1, "min_capacity": 10}), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+"""
+http_fetch 테스트: 로컬 http.server 가 fixture HTML 을 돌려주는 가짜 시간표 사이트 (브라우저 / Selenium 없음).
+
+    cd backend
+    python -m unittest tests.test_http_fetch
+"""
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from smartcampus_crawler.http_fetch import (
+    FetchConfig, SessionExpired, TimetableFetcher, build_request, session_from_cookies, split_targets,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+TIMETABLE = (FIXTURES / "http_timetable.html").read_text(encoding="utf-8")
+LOGIN = (FIXTURES / "http_login.html").read_text(encoding="utf-8")
+COOKIE = {"name": "JSESSIONID", "value": "ok", "domain": "127.0.0.1", "path": "/"}
+
+
+class FakeSite(BaseHTTPRequestHandler):
+    """
+    /tt?room=R  (GET) 또는 /tt + form roomCd=R (POST) → 시간표 (ROOM 자리에 R).
+    쿠키가 없으면 200 + 로그인 폼, /deny/<code> 는 그 상태 코드.
+    """
+    protocol_version = "HTTP/1.1"    # keep-alive (Content-Length 필수)
+    server: "Site"
+
+    def log_message(self, *args):
+        pass
+
+    def send_html(self, body: str, status: int = 200, charset: str = "utf-8"):
+        data = body.encode(charset)
+        self.send_response(status)
+        # euc-kr 은 charset 없이 (옛 JSP 페이지처럼) → 클라이언트가 내용으로 추정해야 함
+        self.send_header("Content-Type", "text/html" if charset == "euc-kr" else f"text/html; charset={charset}")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def handle_page(self, path: str, query: dict):
+        self.server.record(self.client_address, self.command, path, query)
+        if path.startswith("/deny/"):
+            return self.send_html("denied", int(path.rsplit("/", 1)[1]))
+        if "JSESSIONID=ok" not in (self.headers.get("Cookie") or ""):
+            return self.send_html(LOGIN)
+        room = (query.get("room") or query.get("roomCd") or [""])[0]
+        if path == "/euckr":
+            return self.send_html(TIMETABLE.replace("ROOM", room), charset="euc-kr")
+        self.send_html(TIMETABLE.replace("ROOM", room))
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.handle_page(url.path, parse_qs(url.query))
+
+    def do_POST(self):
+        form = self.rfile.read(int(self.headers.get("Content-Length") or 0)).decode()
+        url = urlparse(self.path)
+        self.handle_page(url.path, {**parse_qs(url.query), **parse_qs(form, keep_blank_values=True)})
+
+
+class Site(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeSite)
+        self.lock = threading.Lock()
+        self.requests = []           # (method, path, query)
+        self.clients = set()         # 클라이언트 (host, port) = TCP 커넥션
+
+    def record(self, client, method, path, query):
+        with self.lock:
+            self.clients.add(client)
+            self.requests.append((method, path, query))
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class HttpFetchTestBase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.site = Site()
+        threading.Thread(target=cls.site.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.site.shutdown()
+        cls.site.server_close()
+
+    def setUp(self):
+        with self.site.lock:
+            self.site.requests.clear()
+            self.site.clients.clear()
+
+    def fetcher(self, url: str, data=None, workers: int = 4, cookies=(COOKIE,)) -> TimetableFetcher:
+        cfg = FetchConfig(url=self.site.base + url, data=data, table_css="table#timetable", workers=workers)
+        session = session_from_cookies(list(cookies), pool=cfg.workers)
+        self.addCleanup(session.close)
+        return TimetableFetcher(session, cfg)
+
+
+class FetchTest(HttpFetchTestBase):
+    def test_get_parses_fixture_table(self):
+        df = self.fetcher("/tt?room={value}").fetch_df("R101", "프라임관 - 101")
+        self.assertEqual(
+            df.values.tolist(),
+            [["1", "R101 수업\n김교수", ""], ["2", "R101 수업\n김교수", "세미나"]],
+        )
+
+    def test_post_form(self):
+        self.fetcher("/tt", data="roomCd={value}&gubun=1").fetch_df("R7", "x")
+        self.assertEqual(self.site.requests, [("POST", "/tt", {"roomCd": ["R7"], "gubun": ["1"]})])
+
+    def test_keep_alive_reused_across_rooms(self):
+        rooms = [(f"방{i}", f"R{i}") for i in range(24)]
+        results = self.fetcher("/tt?room={value}", workers=3).fetch_many(rooms)
+        self.assertEqual(len(results), 24)
+        for text, value in rooms:
+            self.assertIn(f"{value} 수업", results[text].iloc[0, 1])
+        self.assertEqual(len(self.site.requests), 24)
+        # 요청마다 새 TCP 연결이면 24개 — 풀 크기(동시 요청 수) 이하로 재사용돼야 한다
+        self.assertLessEqual(len(self.site.clients), 3)
+
+    def test_charset_missing_falls_back_to_detection(self):
+        df = self.fetcher("/euckr?room={value}").fetch_df("공학관302", "x")
+        self.assertEqual(df.iloc[0, 1], "공학관302 수업\n김교수")
+
+
+class SessionExpiredTest(HttpFetchTestBase):
+    def test_login_page_body(self):
+        with self.assertRaises(SessionExpired):
+            self.fetcher("/tt?room={value}", cookies=()).fetch_df("R1", "x")
+
+    def test_401_and_403(self):
+        for code in (401, 403):
+            with self.subTest(code=code), self.assertRaises(SessionExpired):
+                self.fetcher(f"/deny/{code}?room={{value}}").fetch_df("R1", "x")
+
+    def test_fetch_many_reports_per_room(self):
+        results = self.fetcher("/tt?room={value}", cookies=()).fetch_many([("a", "1"), ("b", "2")])
+        self.assertTrue(all(isinstance(e, SessionExpired) for e in results.values()))
+
+
+class NoEmptyValueTest(HttpFetchTestBase):
+    def test_empty_value_never_sent(self):
+        results = self.fetcher("/tt?room={value}").fetch_many([("ok", "R1"), ("custom", "")])
+        self.assertIsInstance(results["custom"], ValueError)
+        self.assertEqual([q for _, _, q in self.site.requests], [{"room": ["R1"]}])
+
+    def test_empty_value_in_form_never_sent(self):
+        results = self.fetcher("/tt", data="roomCd={value}").fetch_many([("custom", "")])
+        self.assertIsInstance(results["custom"], ValueError)
+        self.assertEqual(self.site.requests, [])
+
+    def test_text_only_template_allows_missing_value(self):
+        self.fetcher("/tt?room={text}").fetch_df("", "R9")
+        self.assertEqual(self.site.requests[0][2], {"room": ["R9"]})
+
+    def test_not_per_room_refused(self):
+        with self.assertRaises(ValueError):
+            self.fetcher("/tt?room=fixed").fetch_df("R1", "x")
+        self.assertEqual(self.site.requests, [])
+
+    def test_split_targets(self):
+        cfg = FetchConfig(url="http://h/tt?room={value}")
+        targets, skipped = split_targets(cfg, ["a", "b", "c"], {"a": "1", "c": ""})
+        self.assertEqual(targets, [("a", "1")])
+        self.assertEqual(sorted(skipped), ["b", "c"])
+
+        cfg = FetchConfig(url="http://h/tt?name={text}")
+        targets, skipped = split_targets(cfg, ["a", "b"], {"a": "1"})
+        self.assertEqual((targets, skipped), ([("a", "1"), ("b", "")], {}))
+
+
+class BuildRequestTest(unittest.TestCase):
+    def test_literal_braces_kept(self):
+        cfg = FetchConfig(url="http://h/tt/{0}?q={value}&f={}", data='json={"room":"{value}"}&name={text}')
+        method, url, form = build_request(cfg, "A 1", "공학관 - 302")
+        self.assertEqual(method, "POST")
+        self.assertEqual(url, "http://h/tt/{0}?q=A%201&f={}")
+        self.assertEqual(form, [("json", '{"room":"A 1"}'), ("name", "공학관 - 302")])
+
+    def test_value_with_braces_not_reexpanded(self):
+        cfg = FetchConfig(url="http://h/tt?room={value}&name={text}", data="roomCd={value}&name={text}")
+        _, url, form = build_request(cfg, "{text}", "x")
+        self.assertEqual(url, "http://h/tt?room=%7Btext%7D&name=x")
+        self.assertEqual(form, [("roomCd", "{text}"), ("name", "x")])
+
+    def test_get_without_data(self):
+        self.assertEqual(build_request(FetchConfig(url="http://h/{text}"), "", "a/b"),
+                         ("GET", "http://h/a%2Fb", None))
+
+
+if __name__ == "__main__":
+    unittest.main()
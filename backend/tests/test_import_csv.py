@@ -0,0 +1,164 @@
+"""
+import_csv 테스트 (DB 없이, 임포터가 쓰는 문장만 흉내 내는 가짜 커서).
+
+    cd backend
+    python -m unittest tests.test_import_csv
+"""
+import tempfile
+import unittest
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from unittest import mock
+
+from app.db import import_csv
+from app.db.import_csv import building_code, ensure_buildings
+
+
+class BuildingTableCursor:
+    """ensure_buildings 가 쓰는 세 문장만 이해하는 building(code UNIQUE, name) 테이블"""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)   # [(id, code, name)]
+        self.result = []
+
+    def execute(self, sql, params):
+        if sql.lstrip().startswith("INSERT INTO building"):
+            codes, names = params
+            for code, name in zip(codes, names):
+                taken = any(c == code or n == name for _, c, n in self.rows)
+                if not taken:   # WHERE NOT EXISTS (name) + ON CONFLICT (code) DO NOTHING
+                    self.rows.append((len(self.rows) + 1, code, name))
+        elif sql.startswith("SELECT name, id FROM building"):
+            self.result = [(n, i) for i, _, n in self.rows if n in params[0]]
+        elif sql.startswith("SELECT code, name FROM building"):
+            self.result = [(c, n) for _, c, n in self.rows if c in params[0]]
+        else:
+            raise AssertionError(sql)
+
+    def fetchall(self):
+        return self.result
+
+
+class CampusCursor(BuildingTableCursor):
+    """building 에 더해 room / room_timetable 까지 (import_files 한 번에 필요한 만큼)"""
+
+    def __init__(self):
+        super().__init__()
+        self.rooms = {}      # id → [building_id, name, timetable_hash]
+        self.cells = {}      # (room_id, period, weekday) → raw_text
+
+    def execute(self, sql, params):
+        sql = sql.strip()
+        if sql.startswith("INSERT INTO room "):
+            created = []
+            for b, n in zip(*params):
+                if not any(r[:2] == [b, n] for r in self.rooms.values()):
+                    rid = len(self.rooms) + 1
+                    self.rooms[rid] = [b, n, None]
+                    created.append((rid,))
+            self.result = created
+        elif sql.startswith("SELECT r.building_id, r.name, r.id"):
+            wanted = set(zip(*params))
+            self.result = [(b, n, rid) for rid, (b, n, _) in self.rooms.items() if (b, n) in wanted]
+        elif sql.startswith("SELECT id, timetable_hash FROM room"):
+            self.result = [(rid, self.rooms[rid][2]) for rid in params[0]]
+        elif sql.startswith("SELECT room_id, period, weekday, raw_text"):
+            self.result = [(*k, t, False) for k, t in self.cells.items() if k[0] in params[0]]
+        elif sql.startswith("UPDATE room r SET timetable_hash"):
+            for rid, h in zip(*params):
+                self.rooms[rid][2] = h
+        else:
+            super().execute(sql, params)
+
+    @contextmanager
+    def copy(self, sql):
+        cells = self.cells
+
+        class Copy:
+            def write_row(self, row):
+                cells[tuple(row[:3])] = row[3]
+
+        yield Copy()
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, cur):
+        self.cur = cur
+
+    def cursor(self):
+        return self.cur
+
+    def transaction(self):
+        return nullcontext()
+
+
+class EnsureBuildingsTest(unittest.TestCase):
+    def test_creates_and_reuses(self):
+        cur = BuildingTableCursor([(1, "ENG", "공학관")])
+        ids = ensure_buildings(cur, ["공학관", "프라임관", "프라임관"])
+        self.assertEqual(ids, {"공학관": 1, "프라임관": 2})
+        self.assertEqual(cur.rows[1], (2, "프라임", "프라임관"))
+
+    def test_code_taken_by_existing_building(self):
+        cur = BuildingTableCursor([(1, "공학", "공학")])
+        with self.assertRaises(ValueError) as ctx:
+            ensure_buildings(cur, ["공학관"])
+        msg = str(ctx.exception)
+        self.assertIn("'공학관'", msg)
+        self.assertIn("code '공학'", msg)
+        self.assertIn("이미 '공학'", msg)
+
+    def test_code_collision_within_batch(self):
+        cur = BuildingTableCursor()
+        with self.assertRaises(ValueError) as ctx:
+            ensure_buildings(cur, ["a관", "A"])
+        self.assertIn("code 'A'", str(ctx.exception))
+
+    def test_building_code(self):
+        self.assertEqual(building_code("프라임관"), "프라임")
+        self.assertEqual(building_code("eng"), "ENG")
+
+
+class ImportCsvFileTest(unittest.TestCase):
+    """CSV 하나 임포트도 서버에 알리고, 시간표가 빈 새 방도 알림에 들어가는지"""
+
+    HEADER = "col_1,col_2,col_3,col_4,col_5,col_6,col_7\n"
+
+    def setUp(self):
+        self.cur = CampusCursor()
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def run_import(self, name: str, body: str):
+        path = Path(self.dir.name) / name
+        path.write_text(self.HEADER + body, encoding="utf-8")
+        with mock.patch.object(import_csv, "connection", lambda: nullcontext(FakeConnection(self.cur))), \
+                mock.patch.object(import_csv, "notify_api_reload") as notify, \
+                mock.patch("builtins.print"):
+            summary = import_csv.import_csv_file(str(path))
+        return summary, notify
+
+    def test_new_room_with_empty_grid_is_notified(self):
+        summary, notify = self.run_import("프라임관 - 101호.csv", "1,,,,,,\n")
+        self.assertEqual(summary.new_room_ids, [1])
+        self.assertEqual(summary.changed_room_ids, [])
+        notify.assert_called_once_with([1])
+
+    def test_changed_room_notified_once(self):
+        summary, notify = self.run_import("프라임관 - 101호.csv", "1,특강,,,,,\n")
+        self.assertEqual((summary.new_room_ids, summary.changed_room_ids), ([1], [1]))
+        notify.assert_called_once_with([1])
+        self.assertEqual(self.cur.cells, {(1, 1, 1): "특강"})
+
+    def test_unchanged_reimport_does_not_notify(self):
+        self.run_import("프라임관 - 101호.csv", "1,특강,,,,,\n")
+        summary, notify = self.run_import("프라임관 - 101호.csv", "1,특강,,,,,\n")
+        self.assertEqual(summary.reload_room_ids, [])
+        notify.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+app.services.intervals 테스트 (분 단위 반열린 구간 [start, end)).
+
+    cd backend
+    python -m unittest tests.test_intervals
+"""
+import unittest
+from datetime import time
+
+from app.services.intervals import Interval, first_gap, gaps, merge, to_hhmm, to_minutes
+
+WORK_START, WORK_END = 9 * 60, 18 * 60
+
+
+def iv(start: str, end: str) -> Interval:
+    return Interval.parse(start, end)
+
+
+class MinutesTest(unittest.TestCase):
+    def test_round_trip(self):
+        for s in ("00:00", "09:05", "17:59", "24:00"):
+            self.assertEqual(to_hhmm(to_minutes(s)), s)
+
+    def test_seconds_and_time_objects(self):
+        self.assertEqual(to_minutes("13:30:00"), 810)
+        self.assertEqual(to_minutes(time(13, 30)), 810)
+
+    def test_24_00_is_end_of_day(self):
+        self.assertEqual(to_minutes("24:00"), 1440)
+        self.assertEqual(iv("23:00", "24:00").to_json(), {"start": "23:00", "end": "24:00"})
+
+    def test_invalid(self):
+        for s in ("24:01", "25:00", "9:5", "12:60", "noon", "12"):
+            with self.assertRaises(ValueError, msg=s):
+                to_minutes(s)
+
+
+class IntervalTest(unittest.TestCase):
+    def test_touching_does_not_overlap(self):
+        self.assertFalse(iv("09:00", "10:00").overlaps(iv("10:00", "11:00")))
+        self.assertTrue(iv("09:00", "10:01").overlaps(iv("10:00", "11:00")))
+
+    def test_contains_is_half_open(self):
+        a = iv("09:00", "10:00")
+        self.assertTrue(a.contains(540))
+        self.assertFalse(a.contains(600))
+
+    def test_ordering_by_start(self):
+        self.assertEqual(sorted([iv("10:00", "11:00"), iv("09:00", "12:00")])[0], iv("09:00", "12:00"))
+
+
+class MergeTest(unittest.TestCase):
+    def test_touching_intervals_join(self):
+        self.assertEqual(merge([iv("10:00", "11:00"), iv("09:00", "10:00")]), [iv("09:00", "11:00")])
+
+    def test_contained_and_disjoint(self):
+        self.assertEqual(
+            merge([iv("09:00", "12:00"), iv("10:00", "11:00"), iv("13:00", "14:00")]),
+            [iv("09:00", "12:00"), iv("13:00", "14:00")],
+        )
+
+    def test_zero_length_dropped(self):
+        self.assertEqual(merge([iv("10:00", "10:00")]), [])
+        self.assertEqual(
+            merge([iv("09:00", "10:00"), iv("10:30", "10:30"), iv("11:00", "12:00")]),
+            [iv("09:00", "10:00"), iv("11:00", "12:00")],
+        )
+
+    def test_empty(self):
+        self.assertEqual(merge([]), [])
+
+
+class GapsTest(unittest.TestCase):
+    def test_free_between_blocks(self):
+        busy = merge([iv("10:00", "11:00"), iv("13:00", "14:00")])
+        self.assertEqual(
+            gaps(busy, WORK_START, WORK_END),
+            [iv("09:00", "10:00"), iv("11:00", "13:00"), iv("14:00", "18:00")],
+        )
+
+    def test_block_ending_at_work_end(self):
+        busy = merge([iv("16:00", "18:00")])
+        self.assertEqual(gaps(busy, WORK_START, WORK_END), [iv("09:00", "16:00")])
+
+    def test_blocks_outside_window_clipped(self):
+        busy = merge([iv("07:00", "09:30"), iv("17:30", "20:00")])
+        self.assertEqual(gaps(busy, WORK_START, WORK_END), [iv("09:30", "17:30")])
+
+    def test_zero_length_block_does_not_split(self):
+        busy = merge([iv("12:00", "12:00")])
+        self.assertEqual(gaps(busy, WORK_START, WORK_END), [iv("09:00", "18:00")])
+
+    def test_fully_busy(self):
+        self.assertEqual(gaps(merge([iv("08:00", "19:00")]), WORK_START, WORK_END), [])
+
+    def test_until_midnight(self):
+        busy = merge([iv("22:00", "23:00")])
+        self.assertEqual(gaps(busy, to_minutes("21:00"), to_minutes("24:00")),
+                         [iv("21:00", "22:00"), iv("23:00", "24:00")])
+
+
+class FirstGapTest(unittest.TestCase):
+    busy = merge([iv("09:00", "10:00"), iv("10:30", "12:00"), iv("13:00", "18:00")])
+
+    def test_skips_too_short(self):
+        # 10:00-10:30 은 30분이라 60분 요청에는 못 씀
+        self.assertEqual(first_gap(self.busy, WORK_START, WORK_END, 60), iv("12:00", "13:00"))
+
+    def test_exact_fit(self):
+        self.assertEqual(first_gap(self.busy, WORK_START, WORK_END, 30), iv("10:00", "10:30"))
+
+    def test_lo_inside_busy_block(self):
+        self.assertEqual(first_gap(self.busy, to_minutes("11:00"), WORK_END, 30), iv("12:00", "13:00"))
+
+    def test_lo_inside_free_gap(self):
+        self.assertEqual(first_gap(self.busy, to_minutes("12:15"), WORK_END, 30), iv("12:15", "13:00"))
+
+    def test_block_ending_at_work_end(self):
+        self.assertIsNone(first_gap(self.busy, to_minutes("12:30"), WORK_END, 60))
+
+    def test_no_blocks(self):
+        self.assertEqual(first_gap([], WORK_START, WORK_END, 60), iv("09:00", "18:00"))
+
+    def test_until_midnight(self):
+        busy = merge([iv("18:00", "23:30")])
+        self.assertEqual(first_gap(busy, to_minutes("18:00"), to_minutes("24:00"), 30), iv("23:30", "24:00"))
+        self.assertIsNone(first_gap(busy, to_minutes("18:00"), to_minutes("24:00"), 31))
+
+    def test_touching_blocks_leave_no_gap(self):
+        busy = merge([iv("09:00", "12:00"), iv("12:00", "18:00")])
+        self.assertIsNone(first_gap(busy, WORK_START, WORK_END, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
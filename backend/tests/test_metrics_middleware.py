@@ -0,0 +1,51 @@
+"""
+record_metrics 미들웨어: 스트리밍 응답도 본문이 끝난 뒤 한 번만, 쿼리 수까지 기록하는지.
+
+    cd backend
+    python -m unittest tests.test_metrics_middleware
+"""
+import unittest
+from datetime import date, time
+
+from tests.fakes import api_client
+
+BATCH = "/timelines:batch"
+
+
+def handler(sql, params):
+    if "FROM reservation" in sql and "BETWEEN" in sql:
+        return [(1, date(2030, 1, 7), time(10, 0), time(11, 0), "u")]
+    if sql.startswith("SELECT id, building_id, name, floor, capacity FROM room"):
+        return [(1, 1, "R1", 1, 30), (2, 1, "R2", 1, 30)]
+    return []
+
+
+class RecordMetricsTest(unittest.TestCase):
+    def batch(self, stream: bool):
+        body = {"building_id": 1, "start_date": "2030-01-07", "end_date": "2030-01-08", "stream": stream}
+        # 쿼리마다 잠깐 기다려야 헤더 전송 뒤에 예약 커서가 돈다 (실제 DB 처럼)
+        with api_client(handler, delay=0.02) as (client, seen):
+            r = client.post(BATCH, json=body)
+        self.assertEqual(r.status_code, 200)
+        return r, [(status, q) for route, status, q in seen if route == BATCH]
+
+    def test_streamed_body_queries_counted(self):
+        r, observed = self.batch(stream=True)
+        self.assertEqual(len(r.text.splitlines()), 4)   # 방 2 × 이틀
+        # 방 목록(핸들러) + 예약 커서(본문 스트리밍 중) — 헤더 시점에 기록하면 1 로 잡힌다
+        self.assertEqual(observed, [(200, 2)])
+
+    def test_stream_and_plain_count_the_same(self):
+        _, streamed = self.batch(stream=True)
+        _, plain = self.batch(stream=False)
+        self.assertEqual(streamed, plain)
+
+    def test_error_status_recorded(self):
+        with api_client(handler) as (client, seen):
+            r = client.post(BATCH, json={"start_date": "2030-01-07", "end_date": "2030-01-08"})
+        self.assertEqual(r.status_code, 400)
+        self.assertEqual([(s, q) for route, s, q in seen if route == BATCH], [(400, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
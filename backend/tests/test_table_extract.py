@@ -0,0 +1,88 @@
+"""
+table_extract 오프라인 테스트 (저장해 둔 HTML fixture, 브라우저 / Selenium 없음).
+
+    cd backend
+    python -m unittest tests.test_table_extract
+"""
+import unittest
+from pathlib import Path
+
+from smartcampus_crawler.table_extract import (
+    cells_from_html, clean_text, expand_spans, table_html_to_df,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+COURSE = "(학부) 자동차진동제어및실습\n0001 / 01분반\n김교수 / 30명"
+
+
+def fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+class ExpandSpansTest(unittest.TestCase):
+    def test_rowspan_fills_following_rows(self):
+        rows = [
+            [("1", 1, 1), ("수업", 3, 1), ("A", 1, 1)],
+            [("2", 1, 1), ("B", 1, 1)],
+            [("3", 1, 1), ("C", 1, 1)],
+        ]
+        self.assertEqual(
+            expand_spans(rows),
+            [["1", "수업", "A"], ["2", "수업", "B"], ["3", "수업", "C"]],
+        )
+
+    def test_colspan_with_rowspan(self):
+        rows = [
+            [("1", 1, 1), ("실습", 2, 2)],
+            [("2", 1, 1)],
+        ]
+        self.assertEqual(expand_spans(rows), [["1", "실습", "실습"], ["2", "실습", "실습"]])
+
+    def test_empty_rows_dropped(self):
+        self.assertEqual(expand_spans([[], [("1", 1, 1)]]), [["1"]])
+
+    def test_clean_text(self):
+        self.assertEqual(clean_text("  a \n\n  b  \n"), "a\nb")
+        self.assertEqual(clean_text(None), "")
+
+
+class TableHtmlTest(unittest.TestCase):
+    def test_weekly_fixture(self):
+        df = table_html_to_df(fixture("weekly_timetable.html"))
+        self.assertEqual(list(df.columns), ["col_1", "col_2", "col_3", "col_4"])
+        self.assertEqual(
+            df.values.tolist(),
+            [
+                ["1", COURSE, "세미나", "세미나"],   # colspan=2
+                ["2", COURSE, "", "회의"],           # 위 행의 rowspan=2 가 내려옴
+                ["3", "특강", "", ""],               # colspan="2px" → 1
+            ],
+        )
+
+    def test_non_integer_span_counts_as_one(self):
+        cells = cells_from_html(fixture("weekly_timetable.html"), "tbody tr", "td")
+        self.assertEqual(cells[1][2][1:], (1, 1))   # rowspan="abc"
+        self.assertEqual(cells[2][1][1:], (1, 1))   # colspan="2px"
+
+    def test_header_row_excluded(self):
+        # <thead> 의 <th> 는 row_css / cell_css 에 걸리지 않음
+        df = table_html_to_df(fixture("weekly_timetable.html"))
+        self.assertNotIn("교시", df.values.ravel().tolist())
+
+    def test_missing_tbody_falls_back_to_tr(self):
+        df = table_html_to_df(fixture("no_tbody.html"))
+        self.assertEqual(
+            df.values.tolist(),
+            [
+                ["1", "캡스톤디자인\n이교수", "A"],
+                ["2", "캡스톤디자인\n이교수", "B"],
+                ["3", "캡스톤디자인\n이교수", "C"],
+            ],
+        )
+
+    def test_no_table_rows(self):
+        self.assertTrue(table_html_to_df("<table></table>").empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+timetable_grid 테스트: grid_to_rows 가 예전 iterrows 루프 / melt 경로와 같은 행을 내는지,
+그리고 증분 임포트용 해시/diff.
+
+    cd backend
+    python -m unittest tests.test_timetable_grid
+"""
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from app.db.timetable_grid import (
+    RECORD_COLUMNS, cells_of, content_hash, diff_cells, grid_to_records, grid_to_rows, records_to_rows,
+)
+from scripts.bench_grid import iterrows_rows, melt_rows
+
+FIXTURES = Path(__file__).parent / "fixtures"
+COURSE = "(학부) 자동차진동제어및실습\n0001 / 01분반\n김교수 / 30명"
+
+
+def by_cell(rows):
+    """예전 루프는 파일 행 순서, 새 경로는 (교시, 요일) 순 — 같은 칸끼리는 파일 순서 유지"""
+    return sorted(rows, key=lambda r: r[:2])
+
+
+class GridToRowsTest(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.read_csv(FIXTURES / "room_grid.csv")
+
+    def test_matches_iterrows_on_fixture(self):
+        new = grid_to_rows(self.df)
+        self.assertEqual(new, by_cell(iterrows_rows(self.df)))
+        self.assertEqual(new, melt_rows(self.df))
+        # 같은 칸이 두 번 나오면 둘 다 남고, cells_of 에서 나중 것이 이기는 것도 같아야 한다
+        self.assertEqual(cells_of(new), cells_of(iterrows_rows(self.df)))
+
+    def test_fixture_rows(self):
+        self.assertEqual(
+            grid_to_rows(self.df),
+            [
+                (1, 1, COURSE),
+                (1, 3, "세미나"),
+                (2, 1, COURSE),           # 여러 줄 셀 그대로
+                (2, 3, "늦게 추가된 줄"),  # 뒤쪽의 중복 교시 행
+                (2, 4, "회의"),
+                (3, 1, "특강"),
+                (3, 1, "보강"),           # 중복 교시: 파일 순서 유지
+                (3, 6, "토요특강"),
+            ],
+        )
+
+    def test_plain_python_types(self):
+        period, weekday, text = grid_to_rows(self.df)[0]
+        self.assertIs(type(period), int)
+        self.assertIs(type(weekday), int)
+        self.assertIs(type(text), str)
+
+    def test_records_frame(self):
+        records = grid_to_records(self.df)
+        self.assertEqual(list(records.columns), RECORD_COLUMNS)
+        self.assertEqual(records_to_rows(records), grid_to_rows(self.df))
+
+    def test_missing_columns(self):
+        self.assertEqual(grid_to_rows(pd.DataFrame({"col_1": [1]})), [])
+        self.assertEqual(grid_to_rows(pd.DataFrame({"col_2": ["x"]})), [])
+        self.assertTrue(grid_to_records(pd.DataFrame({"col_2": ["x"]})).empty)
+
+    def test_no_usable_rows(self):
+        self.assertEqual(grid_to_rows(pd.DataFrame({"col_1": [None], "col_2": ["x"]})), [])
+        self.assertEqual(grid_to_rows(pd.DataFrame({"col_1": [1], "col_2": [" "]})), [])
+
+    def test_non_numeric_period_dropped(self):
+        df = pd.DataFrame({"col_1": ["교시", "1"], "col_2": ["월", "수업"]})
+        self.assertEqual(grid_to_rows(df), [(1, 1, "수업")])
+
+
+class DiffTest(unittest.TestCase):
+    def test_hash_ignores_order(self):
+        a = {(1, 1): "x", (2, 3): "y"}
+        self.assertEqual(content_hash(a), content_hash(dict(reversed(list(a.items())))))
+        self.assertNotEqual(content_hash(a), content_hash({(1, 1): "x", (2, 3): "z"}))
+
+    def test_diff_cells(self):
+        stored = {(1, 1): "a", (1, 2): "b", (2, 1): "c"}
+        incoming = {(1, 1): "a", (1, 2): "B", (3, 1): "d"}
+        self.assertEqual(
+            diff_cells(stored, incoming),
+            ([(3, 1, "d")], [(1, 2, "B")], [(2, 1)]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()